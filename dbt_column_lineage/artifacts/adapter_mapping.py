@@ -16,7 +16,7 @@ Extend ADAPTER_TO_DIALECT as needed to support additional adapters.
 """
 
 import logging
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +47,39 @@ ADAPTER_TO_DIALECT: Dict[str, str] = {
 }
 
 
+# Closest sqlglot dialect *family* for a dialect (or unmapped adapter name), used as the
+# middle rung of the parse fallback cascade: declared dialect -> family -> generic. A
+# model that a dialect-specific parser rejects (or whose adapter sqlglot doesn't know at
+# all) is often still readable by the dialect it descends from.
+DIALECT_FAMILY: Dict[str, str] = {
+    # Postgres descendants / wire-compatible warehouses.
+    "redshift": "postgres",
+    "materialize": "postgres",
+    "risingwave": "postgres",
+    "greenplum": "postgres",
+    "cockroachdb": "postgres",
+    "alloydb": "postgres",
+    "yellowbrick": "postgres",
+    "vertica": "postgres",
+    # Spark / Hive lineage.
+    "databricks": "spark",
+    "glue": "spark",
+    "spark": "hive",
+    # Presto / Trino lineage.
+    "athena": "trino",
+    "starburst": "trino",
+    "trino": "presto",
+    # MySQL-compatible engines.
+    "mariadb": "mysql",
+    "singlestore": "mysql",
+    "tidb": "mysql",
+    "starrocks": "mysql",
+    "doris": "mysql",
+    # Hosted DuckDB.
+    "motherduck": "duckdb",
+}
+
+
 def _known_sqlglot_dialects() -> Set[str]:
     """Return the set of dialect names sqlglot actually supports.
 
@@ -96,3 +129,29 @@ def normalize_adapter(adapter_name: Optional[str]) -> Optional[str]:
         )
 
     return dialect
+
+
+def dialect_fallback_chain(dialect: Optional[str]) -> List[Optional[str]]:
+    """Return the dialects to try, in order, when parsing SQL declared as ``dialect``.
+
+    The cascade is: the declared dialect, then its closest family dialect (see
+    ``DIALECT_FAMILY``), then ``None`` — sqlglot's generic dialect. Rungs sqlglot does
+    not recognize are dropped, so an unknown adapter goes straight to its family (or to
+    generic) instead of failing every model. Duplicates are removed, order preserved.
+    """
+    candidates: List[Optional[str]] = []
+    if dialect:
+        lower = dialect.lower()
+        candidates.append(lower)
+        family = DIALECT_FAMILY.get(lower)
+        if family:
+            candidates.append(family)
+    candidates.append(None)
+
+    chain: List[Optional[str]] = []
+    for candidate in candidates:
+        if candidate is not None and _KNOWN_DIALECTS and candidate not in _KNOWN_DIALECTS:
+            continue
+        if candidate not in chain:
+            chain.append(candidate)
+    return chain
@@ -1,7 +1,119 @@
 from pathlib import Path
-from typing import Dict, Any
+from typing import Container, Dict, Any, Iterator, Optional, TextIO, cast, get_args
 import json
-from dbt_column_lineage.models.schema import Model
+import re
+from dbt_column_lineage.artifacts.compression import open_artifact
+from dbt_column_lineage.models.core import ColumnNode, ModelNode
+from dbt_column_lineage.models.schema import ResourceType
+
+_RESOURCE_TYPES = frozenset(get_args(ResourceType))
+
+# Catalog sections holding one entry per relation, streamed entry by entry.
+_RELATION_SECTIONS = ("nodes", "sources")
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_READ_SIZE = 1 << 20
+
+
+class _JsonStream:
+    """One JSON document read from a file a value at a time.
+
+    Containers are walked member by member (:meth:`members`); each member value is
+    decoded on its own by the C decoder, so only one relation's entry is in memory at
+    once rather than the whole catalog.
+    """
+
+    def __init__(self, file: TextIO):
+        self._file = file
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read more of the file (at least doubling the unconsumed buffer)."""
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        chunk = self._file.read(max(_READ_SIZE, len(self._buffer)))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = _JSON_WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of catalog JSON")
+
+    def _accept(self, char: str) -> bool:
+        if self._peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def _expect(self, char: str) -> None:
+        if not self._accept(char):
+            raise ValueError(f"Malformed catalog JSON: expected '{char}'")
+
+    def value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Most likely cut off by the end of the buffer.
+                if self._fill():
+                    continue
+                raise
+            # A number at the very end of the buffer may continue in the next read.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Keys of the object at the current position; consume each value before the next."""
+        self._expect("{")
+        if self._accept("}"):
+            return
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+            if not self._accept(","):
+                self._expect("}")
+                return
+
+
+def _slim_relation(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """The parts of a catalog entry :meth:`CatalogReader.get_models_nodes` reads.
+
+    Table ``stats`` and column ``comment``/``index`` are dropped.
+    """
+    metadata = entry.get("metadata") or {}
+    return {
+        "name": entry.get("name"),
+        "schema": entry.get("schema"),
+        "database": entry.get("database"),
+        "source_name": entry.get("source_name"),
+        "metadata": {
+            "name": metadata.get("name"),
+            "schema": metadata.get("schema"),
+            "database": metadata.get("database"),
+        },
+        "columns": {
+            name: {
+                "type": column.get("type") or column.get("data_type"),
+                "description": column.get("description"),
+            }
+            for name, column in (entry.get("columns") or {}).items()
+        },
+    }
 
 
 class CatalogReader:
@@ -9,44 +121,60 @@ class CatalogReader:
         self.catalog_path = Path(catalog_path)
         self.catalog: Dict[str, Any] = {}
 
-    def load(self) -> None:
+    def load(self, keep: Optional[Container[str]] = None) -> None:
+        """Read the catalog, keeping per relation only what the registry uses.
+
+        The file (optionally gzip/zstd-compressed) is streamed one relation at a time.
+        ``keep`` (unique_ids, typically the manifest's nodes and sources) restricts which
+        relations are kept at all.
+        """
         if not self.catalog_path.exists():
             raise FileNotFoundError(f"Catalog file not found: {self.catalog_path}")
-        with open(self.catalog_path, "r") as f:
-            self.catalog = json.load(f)
+        catalog: Dict[str, Any] = {}
+        with open_artifact(self.catalog_path) as f:
+            stream = _JsonStream(f)
+            for key in stream.members():
+                if key not in _RELATION_SECTIONS:
+                    catalog[key] = stream.value()
+                    continue
+                section = catalog[key] = {}
+                for unique_id in stream.members():
+                    entry = stream.value()
+                    if keep is None or unique_id in keep:
+                        section[unique_id] = _slim_relation(entry)
+        self.catalog = catalog
 
-    def get_models_nodes(self) -> Dict[str, Model]:
+    def get_models_nodes(self) -> Dict[str, ModelNode]:
         models = {}
         nodes = self.catalog.get("nodes", {})
         sources = self.catalog.get("sources", {})
 
         for node_id, model_data in nodes.items():
             resource_type = node_id.split(".")[0]
+            if resource_type not in _RESOURCE_TYPES:
+                raise ValueError(f"Unsupported resource type '{resource_type}' for {node_id}")
             # In dbt's catalog.json the schema/database/name live under `metadata`,
             # not at the top level of the node.
             metadata = model_data.get("metadata", {})
             model_name = (
                 metadata.get("name") or model_data.get("name") or node_id.split(".")[-1]
             ).lower()
-            processed_data = {
-                "name": model_name,
-                "schema": metadata.get("schema") or model_data.get("schema") or "main",
-                "database": metadata.get("database") or model_data.get("database") or "main",
-                "columns": {},
-                "resource_type": resource_type,
-            }
+            model = ModelNode(
+                name=model_name,
+                schema_name=metadata.get("schema") or model_data.get("schema") or "main",
+                database=metadata.get("database") or model_data.get("database") or "main",
+                resource_type=cast(ResourceType, resource_type),
+            )
 
             for col_name, col_data in model_data.get("columns", {}).items():
                 normalized_col_name = col_name.lower()
-                processed_data["columns"][normalized_col_name] = {
-                    "name": normalized_col_name,
-                    "model_name": model_name,
-                    "description": col_data.get("description"),
-                    "data_type": col_data.get("type") or col_data.get("data_type"),
-                    "lineage": [],
-                }
-
-            model = Model(**processed_data)
+                model.columns[normalized_col_name] = ColumnNode(
+                    name=normalized_col_name,
+                    model_name=model_name,
+                    description=col_data.get("description"),
+                    data_type=col_data.get("type") or col_data.get("data_type"),
+                )
+
             models[model.name] = model
 
         for source_id, source_data in sources.items():
@@ -62,30 +190,25 @@ class CatalogReader:
                     source_name = source_id_parts[2]
             normalized_source_name = source_name.lower() if source_name else None
 
-            processed_data = {
-                "name": table_name,
-                "schema": metadata.get("schema") or source_data.get("schema") or "main",
-                "database": metadata.get("database") or source_data.get("database") or "main",
-                "columns": {},
-                "resource_type": "source",
-                "source_identifier": normalized_source_identifier,
-                "source_name": normalized_source_name,
-            }
+            key = normalized_source_identifier or table_name
+            model = ModelNode(
+                name=table_name,
+                schema_name=metadata.get("schema") or source_data.get("schema") or "main",
+                database=metadata.get("database") or source_data.get("database") or "main",
+                resource_type="source",
+                source_identifier=normalized_source_identifier,
+                source_name=normalized_source_name,
+            )
 
             for col_name, col_data in source_data.get("columns", {}).items():
                 normalized_col_name = col_name.lower()
-                processed_data["columns"][normalized_col_name] = {
-                    "name": normalized_col_name,
-                    "model_name": normalized_source_identifier or table_name,
-                    "description": col_data.get("description"),
-                    "data_type": col_data.get("type") or col_data.get("data_type"),
-                    "lineage": [],
-                }
-
-            model = Model(**processed_data)
-            key = normalized_source_identifier or model.name
+                model.columns[normalized_col_name] = ColumnNode(
+                    name=normalized_col_name,
+                    model_name=key,
+                    description=col_data.get("description"),
+                    data_type=col_data.get("type") or col_data.get("data_type"),
+                )
+
             models[key] = model
-            for col in model.columns.values():
-                col.model_name = key
 
         return models
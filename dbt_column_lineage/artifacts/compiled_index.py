@@ -0,0 +1,93 @@
+"""A listing of the ``*.sql`` files under a dbt ``target/compiled`` directory.
+
+Manifests without embedded compiled code send the reader to ``target/compiled`` for
+every model. Rather than probe candidate paths with one ``stat`` each, the reader asks
+:func:`compiled_index` for the directory's file set, walked once with ``os.scandir``
+(whose entries carry the file type, so no per-file ``stat``) across a thread pool. The
+listing is cached per directory, so a base and a head registry reading the same target
+share one walk.
+
+The listing answers "yes" for certain but not "no": it is reused until the directory's
+own mtime changes, which a file added to a subdirectory does not do, and it skips
+symlinked directories. A path it does not list is still checked on disk.
+"""
+
+import os
+import stat
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+# Directory listings are I/O-bound: more threads than cores still pays off.
+_WALK_WORKERS = 8
+
+
+class CompiledIndex:
+    """Every ``*.sql`` file under ``root`` (absolute, normalised paths)."""
+
+    def __init__(self, root: str, files: List[str]):
+        self.root = root
+        self._prefix = root + os.sep
+        self.files: FrozenSet[str] = frozenset(files)
+        self.by_name: Dict[str, List[Path]] = {}
+        for file in files:
+            self.by_name.setdefault(os.path.basename(file), []).append(Path(file))
+
+    def lookup(self, path: Union[str, Path]) -> Optional[bool]:
+        """Whether the ``.sql`` file ``path`` is listed; ``None`` when ``path`` is outside
+        the listing. ``False`` is not final: the file may have been added since."""
+        key = os.path.abspath(path)
+        if not (key.endswith(".sql") and key.startswith(self._prefix)):
+            return None
+        return key in self.files
+
+
+def _scan(directory: str) -> Tuple[List[str], List[str]]:
+    """One directory's subdirectories and ``*.sql`` files."""
+    subdirs: List[str] = []
+    files: List[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Like Path.rglob, symlinked directories are not descended into.
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".sql") and entry.is_file():
+                    files.append(entry.path)
+    except OSError:
+        pass
+    return subdirs, files
+
+
+def _walk(root: str) -> List[str]:
+    files: List[str] = []
+    with ThreadPoolExecutor(max_workers=_WALK_WORKERS) as pool:
+        pending: Set[Future] = {pool.submit(_scan, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, sql_files = future.result()
+                files.extend(sql_files)
+                pending.update(pool.submit(_scan, subdir) for subdir in subdirs)
+    return sorted(files)
+
+
+@lru_cache(maxsize=8)
+def _cached_index(root: str, mtime_ns: int) -> CompiledIndex:
+    return CompiledIndex(root, _walk(root))
+
+
+def compiled_index(compiled_dir: Union[str, Path]) -> CompiledIndex:
+    """The (shared) index of ``compiled_dir``; empty when it is not a directory.
+
+    Reused for as long as the directory's own mtime is unchanged.
+    """
+    root = os.path.normpath(os.path.abspath(compiled_dir))
+    try:
+        info = os.stat(root)
+    except OSError:
+        return CompiledIndex(root, [])
+    if not stat.S_ISDIR(info.st_mode):
+        return CompiledIndex(root, [])
+    return _cached_index(root, info.st_mtime_ns)
@@ -0,0 +1,48 @@
+"""Reading dbt artifacts that are stored compressed.
+
+CI caches often keep ``manifest.json``/``catalog.json`` gzip- or zstd-compressed. The
+readers open them through :func:`open_artifact`, which decompresses while the loader
+reads, so no decompressed copy is written to disk. The format is detected from the
+file's magic bytes, not its name.
+
+gzip is in the standard library; zstd needs the optional ``zstandard`` package.
+"""
+
+import gzip
+import io
+from pathlib import Path
+from typing import Optional, TextIO, Union
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# File suffixes tried, in order, when looking for an artifact next to another one.
+ARTIFACT_SUFFIXES = ("", ".gz", ".zst")
+
+
+def open_artifact(path: Union[str, Path]) -> TextIO:
+    """Open a JSON artifact for reading as text, decompressing gzip/zstd on the fly."""
+    with open(path, "rb") as probe:
+        magic = probe.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic == _ZSTD_MAGIC:
+        try:
+            import zstandard  # type: ignore
+        except ImportError:
+            raise ValueError(
+                f"{path} is zstd-compressed; install the 'zstandard' package to read it"
+            )
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(reader), encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def find_artifact(directory: Path, name: str) -> Optional[Path]:
+    """``directory/name``, or its first compressed variant that exists."""
+    for suffix in ARTIFACT_SUFFIXES:
+        candidate = directory / f"{name}{suffix}"
+        if candidate.exists():
+            return candidate
+    return None
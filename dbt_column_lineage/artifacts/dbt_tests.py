@@ -0,0 +1,148 @@
+"""Columnar storage and reverse indexes for the dbt test nodes of one manifest.
+
+A large project declares tens of thousands of generic tests, yet an impact run only
+ever looks at the few attached to the changed columns. Ingestion therefore keeps each
+test attribute in its own list (one row per test), dedupes rows by ``unique_id`` with a
+dict, and indexes row numbers by ``(model, column)``. A :class:`TestNode` is built only
+for the rows a caller actually asks for, and then reused.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dbt_column_lineage.models.schema import TestNode
+
+
+class TestTable:
+    """The test nodes of a manifest as parallel per-attribute lists.
+
+    Model and column names are stored lowercased; ``None`` marks an attribute that could
+    not be attributed honestly (see :meth:`ManifestReader.get_test_table`).
+    """
+
+    # Tell pytest this is not a test class (the name starts with "Test").
+    __test__ = False
+
+    __slots__ = (
+        "unique_ids",
+        "test_names",
+        "target_models",
+        "target_columns",
+        "referenced_models",
+        "referenced_columns",
+        "resource_paths",
+        "_rows",
+        "_nodes",
+    )
+
+    def __init__(self) -> None:
+        self.unique_ids: List[str] = []
+        self.test_names: List[str] = []
+        self.target_models: List[Optional[str]] = []
+        self.target_columns: List[Optional[str]] = []
+        self.referenced_models: List[Optional[str]] = []
+        self.referenced_columns: List[Optional[str]] = []
+        self.resource_paths: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._nodes: List[Optional[TestNode]] = []
+
+    def __len__(self) -> int:
+        return len(self.unique_ids)
+
+    def append(
+        self,
+        unique_id: str,
+        test_name: str,
+        target_model: Optional[str] = None,
+        target_column: Optional[str] = None,
+        referenced_model: Optional[str] = None,
+        referenced_column: Optional[str] = None,
+        resource_path: Optional[str] = None,
+    ) -> bool:
+        """Add a row; returns ``False`` (and keeps the first row) for a repeated unique_id."""
+        if unique_id in self._rows:
+            return False
+        self._rows[unique_id] = len(self.unique_ids)
+        self.unique_ids.append(unique_id)
+        self.test_names.append(test_name)
+        self.target_models.append(target_model)
+        self.target_columns.append(target_column)
+        self.referenced_models.append(referenced_model)
+        self.referenced_columns.append(referenced_column)
+        self.resource_paths.append(resource_path)
+        self._nodes.append(None)
+        return True
+
+    def node(self, row: int) -> TestNode:
+        """The row as a :class:`TestNode`, built on first access."""
+        node = self._nodes[row]
+        if node is None:
+            node = TestNode(
+                unique_id=self.unique_ids[row],
+                test_name=self.test_names[row],
+                target_model=self.target_models[row],
+                target_column=self.target_columns[row],
+                referenced_model=self.referenced_models[row],
+                referenced_column=self.referenced_columns[row],
+                resource_path=self.resource_paths[row],
+            )
+            self._nodes[row] = node
+        return node
+
+    def nodes(self, rows: Iterable[int]) -> List[TestNode]:
+        return [self.node(row) for row in rows]
+
+
+class TestIndex:
+    """Row numbers of a :class:`TestTable` by what a change to a model or column breaks.
+
+    - ``column``: tests whose target is ``(model, column)``;
+    - ``referenced``: relationships tests whose referenced (parent) side is
+      ``(model, column)``;
+    - ``model``: every test a wholesale removal of the model breaks — attached to it, or
+      referencing it;
+    - ``unattributable``: tests with no known target model or column, counted but never
+      indexed.
+    """
+
+    __test__ = False
+
+    __slots__ = ("table", "column", "referenced", "model", "unattributable")
+
+    def __init__(self, table: TestTable) -> None:
+        self.table = table
+        self.column: Dict[Tuple[str, str], List[int]] = {}
+        self.referenced: Dict[Tuple[str, str], List[int]] = {}
+        self.model: Dict[str, List[int]] = {}
+        self.unattributable: List[int] = []
+
+        columns = zip(
+            table.target_models,
+            table.target_columns,
+            table.referenced_models,
+            table.referenced_columns,
+        )
+        for row, (target_model, target_column, ref_model, ref_column) in enumerate(columns):
+            # Rows are unique, so a row lands in a model bucket twice only when a test
+            # references the model it is attached to.
+            if target_model is not None:
+                self.model.setdefault(target_model, []).append(row)
+            if ref_model is not None and ref_model != target_model:
+                self.model.setdefault(ref_model, []).append(row)
+            if ref_model is not None and ref_column is not None:
+                self.referenced.setdefault((ref_model, ref_column), []).append(row)
+            if target_model is None or target_column is None:
+                self.unattributable.append(row)
+            else:
+                self.column.setdefault((target_model, target_column), []).append(row)
+
+    def column_tests(self, model: str, column: str) -> List[TestNode]:
+        return self.table.nodes(self.column.get((model.lower(), column.lower()), ()))
+
+    def tests_referencing(self, model: str, column: str) -> List[TestNode]:
+        return self.table.nodes(self.referenced.get((model.lower(), column.lower()), ()))
+
+    def model_tests(self, model: str) -> List[TestNode]:
+        return self.table.nodes(self.model.get(model.lower(), ()))
+
+    def unattributable_tests(self) -> List[TestNode]:
+        return self.table.nodes(self.unattributable)
@@ -0,0 +1,343 @@
+"""One column graph over several dbt projects that ref each other (dbt mesh).
+
+Each project keeps its own :class:`ModelRegistry`, loaded from its own manifest/catalog
+pair. A consumer project's manifest lists the public models it refs from a producer as
+ordinary nodes of the producer's package; those stubs carry the consumer-side
+``downstream`` edges, while the producer's registry holds the model's real columns and
+lineage. :class:`FederatedRegistry` resolves every name to the project that defines it
+and adds the other projects' downstream edges, so traversal crosses project boundaries
+without a merged manifest.
+
+With a ``cache_dir`` every project gets its own lineage store (see
+:mod:`~dbt_column_lineage.artifacts.lineage_store`), built in a worker process. An
+unchanged project reopens its store, so a change in one project re-parses only that
+project.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Set
+
+from dbt_column_lineage.artifacts.exceptions import (
+    ModelNotFoundError,
+    RegistryError,
+    RegistryNotLoadedError,
+)
+from dbt_column_lineage.artifacts.registry import ModelRegistry
+from dbt_column_lineage.models.core import ModelNode
+from dbt_column_lineage.models.schema import Coverage, Exposure, TestNode
+
+logger = logging.getLogger(__name__)
+
+# Cap on the failed/skipped name lists surfaced in Coverage (as in the registry).
+_COVERAGE_NAME_CAP = 25
+
+
+@dataclass(frozen=True)
+class ProjectArtifacts:
+    """One dbt project's artifacts. ``name`` is its dbt project name (the package its
+    models' unique_ids carry), used when the manifest does not record one."""
+
+    name: str
+    catalog_path: str
+    manifest_path: str
+    adapter: Optional[str] = None
+
+
+def _project_registry(project: ProjectArtifacts, store_path: Optional[Path]) -> ModelRegistry:
+    return ModelRegistry(
+        project.catalog_path,
+        project.manifest_path,
+        adapter_override=project.adapter,
+        lineage_store_path=str(store_path) if store_path else None,
+    )
+
+
+def _build_project_store(project: ProjectArtifacts, store_path: Optional[Path]) -> None:
+    """Worker-process entry point: load one project, (re)writing its lineage store."""
+    _project_registry(project, store_path).load()
+
+
+class _FederatedModels(Mapping[str, ModelNode]):
+    """``name -> ModelNode`` across projects, resolved by :class:`FederatedRegistry`."""
+
+    def __init__(self, federation: "FederatedRegistry"):
+        self._federation = federation
+
+    def __getitem__(self, name: str) -> ModelNode:
+        return self._federation._resolve(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._federation._owner
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._federation._owner)
+
+    def __len__(self) -> int:
+        return len(self._federation._owner)
+
+
+class FederatedRegistry:
+    """Several project registries presented as one (see the module docstring).
+
+    A name is owned by the first project whose manifest lists it under a package other
+    than another federated project's, so a model defined in two projects resolves to the
+    first one given.
+    """
+
+    def __init__(
+        self,
+        projects: Sequence[ProjectArtifacts],
+        cache_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
+        if not projects:
+            raise RegistryError("At least one project is required")
+        self.projects = list(projects)
+        self._cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        self._max_workers = max_workers
+        self._registries: List[ModelRegistry] = []
+        # name -> index of the owning project; insertion order is project order.
+        self._owner: Dict[str, int] = {}
+        # Per project: the model-like names it lists but another project owns.
+        self._foreign: List[Set[str]] = []
+        # name -> downstream edges recorded by non-owning projects.
+        self._extra_downstream: Dict[str, Set[str]] = {}
+        self._merged: Dict[str, ModelNode] = {}
+        self._exposures: Dict[str, Exposure] = {}
+        self._loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def _store_path(self, project: ProjectArtifacts) -> Optional[Path]:
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / f"{project.name}.lineage.sqlite"
+
+    def load(self) -> None:
+        """Load every project in parallel, then link them."""
+        if self._loaded:
+            raise RegistryError("Registry has already been loaded")
+
+        if self._cache_dir is not None:
+            # Parsing is CPU-bound: build the stores in worker processes. This process
+            # then only reopens them.
+            with ProcessPoolExecutor(max_workers=self._max_workers) as pool:
+                builds = {
+                    project.name: pool.submit(
+                        _build_project_store, project, self._store_path(project)
+                    )
+                    for project in self.projects
+                }
+                for name, build in builds.items():
+                    try:
+                        build.result()
+                    except Exception as e:
+                        raise RegistryError(f"Failed to load project '{name}': {e}")
+
+        self._registries = [
+            _project_registry(project, self._store_path(project)) for project in self.projects
+        ]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            loads = [pool.submit(registry.load) for registry in self._registries]
+            for project, future in zip(self.projects, loads):
+                try:
+                    future.result()
+                except Exception as e:
+                    raise RegistryError(f"Failed to load project '{project.name}': {e}")
+
+        self._link()
+        self._loaded = True
+
+    def _link(self) -> None:
+        project_names = [
+            registry.get_project_name() or project.name
+            for project, registry in zip(self.projects, self._registries)
+        ]
+        packages = [registry.get_model_packages() for registry in self._registries]
+
+        for index, registry in enumerate(self._registries):
+            others = set(project_names) - {project_names[index]}
+            for name in registry.get_models():
+                if packages[index].get(name) not in others:
+                    self._owner.setdefault(name, index)
+        # A name every listing project treats as foreign still resolves somewhere.
+        for index, registry in enumerate(self._registries):
+            for name in registry.get_models():
+                self._owner.setdefault(name, index)
+
+        for index, registry in enumerate(self._registries):
+            foreign = {
+                name
+                for name in registry.get_models()
+                if self._owner[name] != index and name in packages[index]
+            }
+            self._foreign.append(foreign)
+            for name in foreign:
+                stub = registry.get_model(name)
+                self._extra_downstream.setdefault(name, set()).update(stub.downstream)
+            for name, exposure in registry.get_exposures().items():
+                self._exposures.setdefault(name, exposure)
+
+        linked = sum(len(foreign) for foreign in self._foreign)
+        logger.info(f"Federated {len(self._registries)} projects, {linked} cross-project refs")
+
+    def _resolve(self, name: str) -> ModelNode:
+        merged = self._merged.get(name)
+        if merged is not None:
+            return merged
+        index = self._owner.get(name)
+        if index is None:
+            raise KeyError(name)
+        model = self._registries[index].get_model(name)
+        extra = self._extra_downstream.get(name)
+        if not extra or extra <= model.downstream:
+            return model
+        # Few models sit on a project boundary; keep their merged node.
+        merged = replace(model, downstream=model.downstream | extra)
+        self._merged[name] = merged
+        return merged
+
+    def _check_loaded(self) -> None:
+        if not self._loaded:
+            raise RegistryNotLoadedError("Registry must be loaded before accessing models")
+
+    def _owning_registry(self, model_name: str) -> ModelRegistry:
+        self._check_loaded()
+        index = self._owner.get(model_name.lower())
+        if index is None:
+            raise ModelNotFoundError(f"Model '{model_name}' not found")
+        return self._registries[index]
+
+    def get_registry(self, project_name: str) -> ModelRegistry:
+        """The sub-registry of one project, by its :class:`ProjectArtifacts` name."""
+        self._check_loaded()
+        for project, registry in zip(self.projects, self._registries):
+            if project.name == project_name:
+                return registry
+        raise RegistryError(f"Unknown project '{project_name}'")
+
+    def get_models(self) -> Mapping[str, ModelNode]:
+        self._check_loaded()
+        return _FederatedModels(self)
+
+    def get_model(self, model_name: str) -> ModelNode:
+        self._check_loaded()
+        try:
+            return self._resolve(model_name.lower())
+        except KeyError:
+            raise ModelNotFoundError(f"Model '{model_name}' not found")
+
+    def get_exposures(self) -> Dict[str, Exposure]:
+        self._check_loaded()
+        return self._exposures
+
+    def get_exposure(self, exposure_name: str) -> Exposure:
+        self._check_loaded()
+        exposure = self._exposures.get(exposure_name)
+        if exposure is None:
+            raise ValueError(f"Exposure '{exposure_name}' not found")
+        return exposure
+
+    def _owned_names(self, index: int, names: Set[str]) -> Set[str]:
+        return {name for name in names if self._owner.get(name) == index}
+
+    def get_coverage(self) -> Coverage:
+        """The projects' coverage summed, each cross-project stub counted once (by its
+        owner) rather than once per project that refs it."""
+        self._check_loaded()
+        manifest_models = catalog_models = parsed_ok = 0
+        failed: Set[str] = set()
+        skipped: Set[str] = set()
+        for index, registry in enumerate(self._registries):
+            coverage = registry.get_coverage()
+            foreign = self._foreign[index]
+            manifest_models += coverage.models_in_manifest - len(foreign)
+            catalog_models += coverage.models_in_catalog - sum(
+                1 for name in foreign if registry.is_catalog_backed(name)
+            )
+            parsed_ok += coverage.parsed_ok
+            project_failed = registry.get_parse_failed_models()
+            failed |= self._owned_names(index, project_failed)
+            skipped |= self._owned_names(index, registry.get_unparsed_models() - project_failed)
+
+        not_in_catalog_count = max(manifest_models - catalog_models, 0)
+        return Coverage(
+            models_in_manifest=manifest_models,
+            models_in_catalog=catalog_models,
+            parsed_ok=parsed_ok,
+            parse_failed=len(failed),
+            skipped_no_sql=len(skipped),
+            not_in_catalog_count=not_in_catalog_count,
+            failed_models=sorted(failed)[:_COVERAGE_NAME_CAP],
+            skipped_models=sorted(skipped)[:_COVERAGE_NAME_CAP],
+            complete=not_in_catalog_count == 0 and not failed and not skipped,
+        )
+
+    def get_parse_failed_models(self) -> set:
+        self._check_loaded()
+        failed: Set[str] = set()
+        for index, registry in enumerate(self._registries):
+            failed |= self._owned_names(index, registry.get_parse_failed_models())
+        return failed
+
+    def is_catalog_backed(self, model_name: str) -> bool:
+        try:
+            return self._owning_registry(model_name).is_catalog_backed(model_name)
+        except ModelNotFoundError:
+            return False
+
+    def get_compiled_sql(self, model_name: str) -> str:
+        return self._owning_registry(model_name).get_compiled_sql(model_name)
+
+    def get_manifest_downstream(self) -> Dict[str, set]:
+        self._check_loaded()
+        downstream: Dict[str, set] = {}
+        for registry in self._registries:
+            for name, children in registry.get_manifest_downstream().items():
+                downstream.setdefault(name, set()).update(children)
+        return downstream
+
+    def get_filter_dependents(self, source_column: str) -> set:
+        self._check_loaded()
+        dependents: Set[str] = set()
+        for registry in self._registries:
+            dependents |= registry.get_filter_dependents(source_column)
+        return dependents
+
+    def _collect_tests(self, per_registry: List[List[TestNode]]) -> List[TestNode]:
+        seen: Set[str] = set()
+        tests = []
+        for project_tests in per_registry:
+            for test in project_tests:
+                if test.unique_id not in seen:
+                    seen.add(test.unique_id)
+                    tests.append(test)
+        return tests
+
+    def get_column_tests(self, model: str, column: str) -> List[TestNode]:
+        return self._collect_tests([r.get_column_tests(model, column) for r in self._registries])
+
+    def get_tests_referencing(self, model: str, column: str) -> List[TestNode]:
+        return self._collect_tests(
+            [r.get_tests_referencing(model, column) for r in self._registries]
+        )
+
+    def get_model_tests(self, model: str) -> List[TestNode]:
+        return self._collect_tests([r.get_model_tests(model) for r in self._registries])
+
+    def get_test_unique_ids(self) -> Set[str]:
+        ids: Set[str] = set()
+        for registry in self._registries:
+            ids |= registry.get_test_unique_ids()
+        return ids
+
+    def get_unattributable_tests(self) -> List[TestNode]:
+        return self._collect_tests([r.get_unattributable_tests() for r in self._registries])
+
+    def get_unattributable_test_count(self) -> int:
+        return len(self.get_unattributable_tests())
@@ -0,0 +1,138 @@
+"""JSON decoding and encoding through the fastest library installed.
+
+Manifest loading, the lineage store, the CLI's JSON reports and the impact heatmap go
+through :func:`loads`, :func:`dumps_pretty` and (compact, as bytes) :func:`dumps`. They
+use ``orjson`` or ``msgspec`` when importable (``pip install "dbt-col-lineage[fast-json]"``)
+and the standard library otherwise; set ``DBT_COL_LINEAGE_JSON`` to ``orjson``,
+``msgspec`` or ``json`` to pick one.
+
+Every backend reads and writes the same documents. Input only the standard library
+accepts (``NaN``, integers beyond 64 bits) is retried with it, and so is output the
+fast backend cannot encode. The fast backends write non-ASCII text as UTF-8 rather than
+``\\u`` escapes.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, Type, Union
+
+ENV_VAR = "DBT_COL_LINEAGE_JSON"
+
+
+class JsonBackend(NamedTuple):
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps_pretty: Callable[[Any], str]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps_pretty(obj: Any) -> str:
+    return json.dumps(obj, indent=2, sort_keys=False)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _with_stdlib_fallback(
+    name: str,
+    loads: Callable[[Union[str, bytes]], Any],
+    dumps_pretty: Callable[[Any], str],
+    dumps: Callable[[Any], bytes],
+    errors: Tuple[Type[BaseException], ...],
+) -> JsonBackend:
+    def fallback_loads(data: Union[str, bytes]) -> Any:
+        try:
+            return loads(data)
+        except errors:
+            return json.loads(data)
+
+    def fallback_dumps_pretty(obj: Any) -> str:
+        try:
+            return dumps_pretty(obj)
+        except errors:
+            return _stdlib_dumps_pretty(obj)
+
+    def fallback_dumps(obj: Any) -> bytes:
+        try:
+            return dumps(obj)
+        except errors:
+            return _stdlib_dumps(obj)
+
+    return JsonBackend(name, fallback_loads, fallback_dumps_pretty, fallback_dumps)
+
+
+def _stdlib() -> Optional[JsonBackend]:
+    return JsonBackend("json", json.loads, _stdlib_dumps_pretty, _stdlib_dumps)
+
+
+def _orjson() -> Optional[JsonBackend]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=options).decode()
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return _with_stdlib_fallback(
+        "orjson", orjson.loads, dumps_pretty, dumps, (ValueError, TypeError)
+    )
+
+
+def _msgspec() -> Optional[JsonBackend]:
+    try:
+        import msgspec  # type: ignore
+    except ImportError:
+        return None
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def dumps_pretty(obj: Any) -> str:
+        return msgspec.json.format(encoder.encode(obj), indent=2).decode()
+
+    return _with_stdlib_fallback(
+        "msgspec", decoder.decode, dumps_pretty, encoder.encode, (msgspec.MsgspecError,)
+    )
+
+
+# In order of preference.
+_FACTORIES = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+
+def available_backends() -> List[str]:
+    return [name for name, factory in _FACTORIES.items() if factory() is not None]
+
+
+@lru_cache(maxsize=None)
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """The named backend, else the one ``DBT_COL_LINEAGE_JSON`` names, else the first
+    installed one."""
+    name = name or os.environ.get(ENV_VAR)
+    if not name:
+        return next(b for b in (factory() for factory in _FACTORIES.values()) if b is not None)
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend '{name}'; expected one of {list(_FACTORIES)}")
+    backend = _FACTORIES[name]()
+    if backend is None:
+        raise ValueError(f"JSON backend '{name}' is not installed")
+    return backend
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    return get_backend().loads(data)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """``obj`` as JSON indented by two spaces, keys in insertion order."""
+    return get_backend().dumps_pretty(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """``obj`` as compact UTF-8 JSON, keys in insertion order."""
+    return get_backend().dumps(obj)
@@ -0,0 +1,305 @@
+"""An on-disk column graph the registry can serve models from instead of holding them.
+
+The store is an embedded SQLite database, read through SQLite's memory-mapped I/O: the
+OS pages in only the rows a query touches, and the process keeps just the last few
+hundred models it materialised. It records the artifacts it was built from (path, size
+and mtime of ``manifest.json`` and ``catalog.json``, plus the dialect), so a later run
+over the same artifacts opens it and skips the catalog read and the SQL parsing.
+
+The registry writes the store from a complete in-memory load; nothing here parses SQL.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+from dbt_column_lineage.artifacts import json_backend
+from dbt_column_lineage.models.core import ColumnNode, ModelNode
+from dbt_column_lineage.models.schema import ColumnLineage
+
+# Bump when the tables below change shape; an older store is then rebuilt.
+_STORE_VERSION = 2
+_MMAP_SIZE = 1 << 30
+_DEFAULT_CACHE_SIZE = 512
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE models (name TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE columns (
+    model TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    data_type TEXT,
+    metadata TEXT,
+    PRIMARY KEY (model, name)
+) WITHOUT ROWID;
+CREATE TABLE lineage (
+    model TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    transformation_type TEXT NOT NULL,
+    sql_expression TEXT,
+    expression_fingerprint TEXT,
+    description TEXT,
+    sources TEXT NOT NULL,
+    PRIMARY KEY (model, column_name, ordinal)
+) WITHOUT ROWID;
+-- Lowercased upstream column -> the models projecting it / filtering on it.
+CREATE TABLE projected_sources (
+    source TEXT NOT NULL, model TEXT NOT NULL, PRIMARY KEY (source, model)
+) WITHOUT ROWID;
+CREATE TABLE predicate_sources (
+    source TEXT NOT NULL, model TEXT NOT NULL, PRIMARY KEY (source, model)
+) WITHOUT ROWID;
+"""
+
+# ModelNode fields kept as one JSON document per model (columns live in their own table).
+_MODEL_SET_FIELDS = ("upstream", "downstream", "predicate_sources")
+_MODEL_FIELDS = (
+    "schema_name",
+    "database",
+    "resource_type",
+    "metadata",
+    "unique_id",
+    "predicate_lineage",
+    "compiled_sql",
+    "language",
+    "resource_path",
+    "source_identifier",
+    "source_name",
+    "description",
+    "tags",
+)
+
+
+def artifact_fingerprint(
+    manifest_path: Path, catalog_path: Path, dialect: Optional[str]
+) -> Dict[str, Any]:
+    """What a store must have been built from to be reused for these artifacts."""
+    fingerprint: Dict[str, Any] = {"version": _STORE_VERSION, "dialect": dialect}
+    for key, path in (("manifest", manifest_path), ("catalog", catalog_path)):
+        stat = os.stat(path)
+        fingerprint[key] = [str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def _encode_model(model: ModelNode) -> str:
+    data: Dict[str, Any] = {name: getattr(model, name) for name in _MODEL_FIELDS}
+    for name in _MODEL_SET_FIELDS:
+        data[name] = sorted(getattr(model, name))
+    return json.dumps(data)
+
+
+class LineageStore:
+    """Read access to a store file written by :meth:`write`.
+
+    Safe to share between threads (the explorer serves requests from a pool): one
+    connection, serialised by a lock. Materialised models are kept in a bounded LRU.
+    """
+
+    def __init__(self, path: Path, cache_size: int = _DEFAULT_CACHE_SIZE):
+        self.path = Path(path)
+        self._connection = sqlite3.connect(
+            f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._connection.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, ModelNode]" = OrderedDict()
+        self._cache_size = cache_size
+        self._names: Optional[List[str]] = None
+        self._name_set: Set[str] = set()
+
+    @classmethod
+    def write(
+        cls,
+        path: Path,
+        models: Mapping[str, ModelNode],
+        fingerprint: Dict[str, Any],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write ``models`` (plus JSON-serialisable ``meta``) to a fresh store at ``path``.
+
+        Written to a sibling temp file and renamed into place, so a reader never sees a
+        half-written store and an interrupted write leaves the previous one intact.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        connection = sqlite3.connect(tmp_path)
+        try:
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.executescript(_SCHEMA)
+            entries = {"fingerprint": fingerprint, **(meta or {})}
+            connection.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in entries.items()],
+            )
+            for name, model in models.items():
+                cls._write_model(connection, name, model)
+            connection.commit()
+        finally:
+            connection.close()
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _write_model(connection: sqlite3.Connection, name: str, model: ModelNode) -> None:
+        connection.execute("INSERT INTO models VALUES (?, ?)", (name, _encode_model(model)))
+        columns = []
+        lineage = []
+        projected: Set[str] = set()
+        for col_name, column in model.columns.items():
+            metadata = json.dumps(column.metadata) if column.metadata is not None else None
+            columns.append((name, col_name, column.description, column.data_type, metadata))
+            for ordinal, edge in enumerate(column.lineage or []):
+                lineage.append(
+                    (
+                        name,
+                        col_name,
+                        ordinal,
+                        edge.transformation_type,
+                        edge.sql_expression,
+                        edge.expression_fingerprint,
+                        edge.description,
+                        json.dumps(sorted(edge.source_columns)),
+                    )
+                )
+                projected.update(source.lower() for source in edge.source_columns)
+        connection.executemany("INSERT INTO columns VALUES (?, ?, ?, ?, ?)", columns)
+        connection.executemany("INSERT INTO lineage VALUES (?, ?, ?, ?, ?, ?, ?, ?)", lineage)
+        connection.executemany(
+            "INSERT INTO projected_sources VALUES (?, ?)", [(src, name) for src in projected]
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO predicate_sources VALUES (?, ?)",
+            [(src.lower(), name) for src in model.predicate_sources],
+        )
+
+    @classmethod
+    def open_if_fresh(cls, path: Path, fingerprint: Dict[str, Any]) -> Optional["LineageStore"]:
+        """The store at ``path`` if it was built from the fingerprinted artifacts, else None."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            store = cls(path)
+            if store.meta("fingerprint") == fingerprint:
+                return store
+            store.close()
+        except sqlite3.DatabaseError:
+            pass
+        return None
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _query(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def meta(self, key: str) -> Any:
+        rows = self._query("SELECT value FROM meta WHERE key = ?", (key,))
+        return json_backend.loads(rows[0][0]) if rows else None
+
+    def names(self) -> List[str]:
+        """Every model name, in the order the registry held them."""
+        if self._names is None:
+            self._names = [row[0] for row in self._query("SELECT name FROM models ORDER BY rowid")]
+            self._name_set = set(self._names)
+        return self._names
+
+    def __contains__(self, name: object) -> bool:
+        self.names()
+        return name in self._name_set
+
+    def model(self, name: str) -> Optional[ModelNode]:
+        """The model as a :class:`ModelNode`, read from disk unless recently used."""
+        with self._lock:
+            cached = self._cache.get(name)
+            if cached is not None:
+                self._cache.move_to_end(name)
+                return cached
+        if name not in self:
+            return None
+        model = self._load_model(name)
+        with self._lock:
+            # Another thread may have loaded it meanwhile; keep a single instance.
+            model = self._cache.setdefault(name, model)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return model
+
+    def _load_model(self, name: str) -> ModelNode:
+        data = json_backend.loads(
+            self._query("SELECT data FROM models WHERE name = ?", (name,))[0][0]
+        )
+        for field_name in _MODEL_SET_FIELDS:
+            data[field_name] = set(data[field_name])
+        model = ModelNode(name=name, **data)
+
+        for col_name, description, data_type, metadata in self._query(
+            "SELECT name, description, data_type, metadata FROM columns WHERE model = ?",
+            (name,),
+        ):
+            model.columns[col_name] = ColumnNode(
+                name=col_name,
+                model_name=name,
+                description=description,
+                data_type=data_type,
+                metadata=json_backend.loads(metadata) if metadata is not None else None,
+            )
+        for col_name, kind, expression, fingerprint, description, sources in self._query(
+            "SELECT column_name, transformation_type, sql_expression, expression_fingerprint, "
+            "description, sources FROM lineage WHERE model = ? ORDER BY column_name, ordinal",
+            (name,),
+        ):
+            # Written from validated edges, so validation is skipped; sources are interned
+            # as the validator would.
+            model.columns[col_name].lineage.append(
+                ColumnLineage.model_construct(
+                    source_columns=frozenset(map(sys.intern, json_backend.loads(sources))),
+                    transformation_type=kind,
+                    sql_expression=expression,
+                    expression_fingerprint=fingerprint,
+                    description=description,
+                )
+            )
+        return model
+
+    def filter_dependents(self, source_column: str) -> Set[str]:
+        """Models filtering on ``source_column`` without projecting it (see the registry)."""
+        key = source_column.lower()
+        rows = self._query(
+            "SELECT model FROM predicate_sources WHERE source = ? "
+            "EXCEPT SELECT model FROM projected_sources WHERE source = ?",
+            (key, key),
+        )
+        return {row[0] for row in rows}
+
+
+class StoredModels(Mapping[str, ModelNode]):
+    """The registry's ``name -> ModelNode`` mapping, served from a :class:`LineageStore`."""
+
+    def __init__(self, store: LineageStore):
+        self.store = store
+
+    def __getitem__(self, name: str) -> ModelNode:
+        model = self.store.model(name)
+        if model is None:
+            raise KeyError(name)
+        return model
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.store
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.names())
+
+    def __len__(self) -> int:
+        return len(self.store.names())
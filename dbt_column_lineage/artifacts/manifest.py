@@ -1,19 +1,50 @@
-import json
 import os
 import re
-from typing import Dict, List, Optional, Set, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Any
 from pathlib import Path
 
+from dbt_column_lineage.artifacts import json_backend
 from dbt_column_lineage.artifacts.adapter_mapping import normalize_adapter
+from dbt_column_lineage.artifacts.compiled_index import CompiledIndex, compiled_index
+from dbt_column_lineage.artifacts.compression import open_artifact
+from dbt_column_lineage.artifacts.dbt_tests import TestTable
 from dbt_column_lineage.models.schema import TestNode
 
-
 # Matches the quoted name(s) inside a dbt ``ref(...)`` expression, e.g.
 # ``ref('stg_accounts')`` or ``ref('my_pkg', 'stg_accounts')``. The *last* quoted
 # token is the model name (the first, when present, is the package).
 _REF_QUOTED_RE = re.compile(r"""['"]([^'"]+)['"]""")
 
+# The Jinja :meth:`ManifestReader.render_raw_sql` understands: comments, and ``{{ ... }}``
+# expressions that are ``ref(...)``, ``source(...)``, ``config(...)`` or ``this``.
+_JINJA_COMMENT_RE = re.compile(r"\{#.*?#\}", re.DOTALL)
+_JINJA_EXPRESSION_RE = re.compile(r"\{\{-?(.*?)-?\}\}", re.DOTALL)
+_JINJA_CALL_RE = re.compile(r"(ref|source|config)\s*\((.*)\)", re.DOTALL)
+
+# Threads reading on-disk compiled SQL files in :meth:`ManifestReader.prefetch_compiled_sql`.
+_READ_WORKERS = 16
+
+# Resource types whose unique_id names a relation the registry tracks by that name.
+_RELATION_RESOURCE_TYPES = frozenset({"model", "snapshot"})
+
+
+class UniqueId(NamedTuple):
+    """A dbt unique_id split once: ``model.jaffle_shop.orders`` ->
+    ``("model", "jaffle_shop", "orders")``. ``name`` is the last segment, lowercased."""
+
+    resource_type: str
+    package: str
+    name: str
+
+
+def _split_unique_id(unique_id: str) -> UniqueId:
+    parts = unique_id.split(".")
+    return UniqueId(parts[0], parts[1] if len(parts) > 2 else "", parts[-1].lower())
 
+
+@lru_cache(maxsize=4096)
 def _model_name_from_ref(ref_expr: Optional[str]) -> Optional[str]:
     """Extract the model name from a dbt ``ref(...)`` expression string.
 
@@ -28,30 +59,96 @@ def _model_name_from_ref(ref_expr: Optional[str]) -> Optional[str]:
     return matches[-1].lower()
 
 
-def _model_name_from_unique_id(unique_id: Optional[str]) -> Optional[str]:
-    """Return the lowercased model name from a ``model.<pkg>.<name>`` unique_id."""
-    if not unique_id:
-        return None
-    parts = unique_id.split(".")
-    if parts[0] != "model":
+def _read_compiled_file(path: Path) -> Optional[str]:
+    try:
+        return path.read_text()
+    except OSError:
         return None
-    return parts[-1].lower()
+
+
+def _read_compiled_files(items: List[Tuple[str, Path]]) -> Dict[str, Optional[str]]:
+    return {model_name: _read_compiled_file(path) for model_name, path in items}
 
 
 class ManifestReader:
     def __init__(self, manifest_path: Optional[str] = None):
         self.manifest_path = Path(manifest_path) if manifest_path else None
         self.manifest: Dict[str, Any] = {}
-        # Lazily-built index of on-disk compiled SQL keyed by filename (e.g. ``orders.sql``),
-        # used to recover a model's compiled SQL when the manifest's ``original_file_path``
-        # has drifted from the ``target/compiled`` layout (a model moved between builds).
-        self._compiled_index: Optional[Dict[str, List[Path]]] = None
+        # Lazily-fetched listing of ``target/compiled`` (shared between readers of the same
+        # target): resolves candidate paths without a stat each, and recovers a model's
+        # compiled SQL by filename when the manifest's ``original_file_path`` has drifted
+        # from the ``target/compiled`` layout (a model moved between builds).
+        self._compiled_index: Optional[CompiledIndex] = None
+        # model name -> compiled SQL read ahead by prefetch_compiled_sql, handed out once.
+        self._prefetched_sql: Dict[str, Optional[str]] = {}
+        # Lookup tables derived from ``self.manifest`` once instead of per accessor call:
+        # unique_id -> its split parts, depends_on id -> the registry name it points at,
+        # and lowercased node name -> node. Rebuilt whenever ``self.manifest`` is replaced.
+        self._unique_ids: Dict[str, UniqueId] = {}
+        self._dependency_names: Dict[str, Optional[str]] = {}
+        self._nodes_by_name: Dict[str, Dict[str, Any]] = {}
+        self._relations: Optional[Dict[Tuple[str, ...], str]] = None
+        self._indexed_manifest: Optional[Dict[str, Any]] = None
 
     def load(self) -> None:
         if not self.manifest_path or not self.manifest_path.exists():
             raise FileNotFoundError(f"Manifest file not found: {self.manifest_path}")
-        with open(self.manifest_path, "r") as f:
-            self.manifest = json.load(f)
+        with open_artifact(self.manifest_path) as f:
+            self.manifest = json_backend.loads(f.read())
+        self._ensure_index()
+
+    def get_relation_ids(self) -> Set[str]:
+        """unique_ids of every node and source, i.e. the catalog entries worth reading."""
+        return set(self.manifest.get("nodes", {})) | set(self.manifest.get("sources", {}))
+
+    def _ensure_index(self) -> None:
+        if self._indexed_manifest is self.manifest:
+            return
+        self._unique_ids = {}
+        self._dependency_names = {}
+        self._nodes_by_name = {}
+        self._relations = None
+        for section in ("nodes", "sources", "exposures"):
+            for unique_id in self.manifest.get(section, {}):
+                self._unique_ids[unique_id] = _split_unique_id(unique_id)
+        for node in self.manifest.get("nodes", {}).values():
+            # First node wins on a name clash, as the former linear scan did.
+            self._nodes_by_name.setdefault(node.get("name", "").lower(), node)
+        self._indexed_manifest = self.manifest
+
+    def parse_unique_id(self, unique_id: str) -> UniqueId:
+        """Split a unique_id, reusing the table built at load for ids in the manifest."""
+        self._ensure_index()
+        parsed = self._unique_ids.get(unique_id)
+        if parsed is None:
+            parsed = self._unique_ids[unique_id] = _split_unique_id(unique_id)
+        return parsed
+
+    def _model_name(self, unique_id: Optional[str]) -> Optional[str]:
+        """The lowercased model name of a ``model.<pkg>.<name>`` unique_id, else ``None``."""
+        if not unique_id:
+            return None
+        parsed = self.parse_unique_id(unique_id)
+        return parsed.name if parsed.resource_type == "model" else None
+
+    def _dependency_name(self, dep_id: str) -> Optional[str]:
+        """The registry name a ``depends_on.nodes`` entry refers to, or ``None``.
+
+        Models and snapshots by name; sources by their (lowercased) identifier, falling
+        back to the source name. Other resource types are not relations we track.
+        """
+        self._ensure_index()
+        if dep_id in self._dependency_names:
+            return self._dependency_names[dep_id]
+        parsed = self.parse_unique_id(dep_id)
+        name: Optional[str] = None
+        if parsed.resource_type in _RELATION_RESOURCE_TYPES:
+            name = parsed.name
+        elif parsed.resource_type == "source":
+            source_identifier = self.manifest.get("sources", {}).get(dep_id, {}).get("identifier")
+            name = source_identifier.lower() if source_identifier else parsed.name
+        self._dependency_names[dep_id] = name
+        return name
 
     def get_adapter(self) -> Optional[str]:
         adapter_name = self.manifest.get("metadata", {}).get("adapter_type")
@@ -61,11 +158,9 @@ class ManifestReader:
         """Find a node in the manifest by model name."""
         if not self.manifest:
             return None
-        model_name_lower = model_name.lower()
-        for _, node in self.manifest.get("nodes", {}).items():
-            if node.get("name", "").lower() == model_name_lower:
-                return dict(node)
-        return None
+        self._ensure_index()
+        node = self._nodes_by_name.get(model_name.lower())
+        return dict(node) if node is not None else None
 
     def get_model_dependencies(self) -> Dict[str, Set[str]]:
         """Return a dictionary of model dependencies with full model names.
@@ -97,21 +192,8 @@ class ManifestReader:
 
                 depends_on = node.get("depends_on", {})
                 for dep_id in depends_on.get("nodes", []):
-                    parts = dep_id.split(".")
-                    if parts[0] == "model":
-                        dep_name = parts[-1].lower()
-                        upstream[model_name].add(dep_name)
-                    elif parts[0] == "source":
-                        source_node = self.manifest.get("sources", {}).get(dep_id, {})
-                        source_identifier = source_node.get("identifier")
-                        if source_identifier:
-                            upstream[model_name].add(source_identifier.lower())
-                        else:
-                            # Fallback to source name if identifier not found
-                            source_name = parts[-1].lower()
-                            upstream[model_name].add(source_name)
-                    elif parts[0] == "snapshot":
-                        dep_name = parts[-1].lower()
+                    dep_name = self._dependency_name(dep_id)
+                    if dep_name is not None:
                         upstream[model_name].add(dep_name)
 
         return upstream
@@ -141,27 +223,36 @@ class ManifestReader:
         if not self.manifest_path:
             return None
 
-        target_dir = self.manifest_path.parent
-        project_root = target_dir.parent
+        # Candidates are plain strings: this runs once per model, and most are answered
+        # from the compiled-directory listing without touching the disk.
+        target_dir = os.path.dirname(self.manifest_path)
+        project_root = os.path.dirname(target_dir)
 
         candidates = []
 
         # dbt records ``compiled_path`` relative to the project root once compiled.
         compiled_path = node.get("compiled_path")
         if compiled_path:
-            candidates.append(project_root / compiled_path)
-            candidates.append(Path(compiled_path))
+            candidates.append(os.path.join(project_root, compiled_path))
+            candidates.append(compiled_path)
 
         # dbt convention: <target>/compiled/<package_name>/<original_file_path>
         package_name = node.get("package_name")
         original_file_path = node.get("original_file_path")
         if package_name and original_file_path:
-            candidates.append(target_dir / "compiled" / package_name / original_file_path)
+            candidates.append(
+                os.path.join(target_dir, "compiled", package_name, original_file_path)
+            )
 
+        index = self._get_compiled_index()
         for candidate in candidates:
+            # Only a hit in the listing is conclusive: it can predate a file added since,
+            # and it does not descend into symlinked directories.
+            if index.lookup(candidate):
+                return Path(candidate)
             try:
-                if candidate.is_file():
-                    return candidate
+                if os.path.isfile(candidate):
+                    return Path(candidate)
             except OSError:
                 continue
 
@@ -184,8 +275,7 @@ class ManifestReader:
         match anywhere under ``target/compiled``. Returns ``None`` on zero or multiple matches
         (ambiguous → we decline to guess, keeping the model honestly unresolved).
         """
-        index = self._compiled_basename_index()
-        matches = index.get(filename, [])
+        matches = self._get_compiled_index().by_name.get(filename, [])
         if not matches:
             return None
         if package_name:
@@ -195,18 +285,35 @@ class ManifestReader:
                 return scoped[0]
         return matches[0] if len(matches) == 1 else None
 
-    def _compiled_basename_index(self) -> Dict[str, List[Path]]:
-        """Lazily index ``target/compiled/**/*.sql`` by filename → list of paths."""
-        if self._compiled_index is not None:
-            return self._compiled_index
-        index: Dict[str, List[Path]] = {}
-        if self.manifest_path:
-            compiled_dir = self.manifest_path.parent / "compiled"
-            if compiled_dir.is_dir():
-                for path in compiled_dir.rglob("*.sql"):
-                    index.setdefault(path.name, []).append(path)
-        self._compiled_index = index
-        return index
+    def _get_compiled_index(self) -> CompiledIndex:
+        """The listing of ``target/compiled/**/*.sql`` next to the manifest."""
+        if self._compiled_index is None:
+            if self.manifest_path is None:
+                return CompiledIndex(os.sep, [])
+            self._compiled_index = compiled_index(self.manifest_path.parent / "compiled")
+        return self._compiled_index
+
+    def prefetch_compiled_sql(self, model_names: Iterable[str]) -> None:
+        """Read ahead, concurrently, the on-disk compiled SQL of the given models that have
+        none embedded in the manifest; :meth:`get_compiled_sql` then hands each out once."""
+        files: Dict[str, Path] = {}
+        for model_name in model_names:
+            node = self._find_node(model_name)
+            if not node or node.get("compiled_sql") or node.get("compiled_code"):
+                continue
+            compiled_file = self._resolve_compiled_file(node)
+            if compiled_file:
+                files[model_name] = compiled_file
+        if not files:
+            return
+        # One task per worker rather than per file: the files are small and many.
+        items = list(files.items())
+        workers = min(_READ_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for batch in pool.map(
+                _read_compiled_files, [items[i::workers] for i in range(workers)]
+            ):
+                self._prefetched_sql.update(batch)
 
     def get_compiled_sql(self, model_name: str) -> Optional[str]:
         """Get compiled SQL for a model.
@@ -222,15 +329,67 @@ class ManifestReader:
         if embedded:
             return embedded
 
+        if model_name in self._prefetched_sql:
+            return self._prefetched_sql.pop(model_name)
+
         compiled_file = self._resolve_compiled_file(node)
         if compiled_file:
-            try:
-                return compiled_file.read_text()
-            except OSError:
-                return None
+            return _read_compiled_file(compiled_file)
 
         return None
 
+    def render_raw_sql(self, model_name: str, raw_sql: str) -> Optional[str]:
+        """Render a model's Jinja source the way ``dbt compile`` would, for simple models.
+
+        ``ref``, ``source`` and ``this`` become the ``relation_name`` the manifest records
+        for their target, ``config(...)`` and comments disappear. Returns ``None`` for any
+        other Jinja (blocks, macros, variables) or a target the manifest does not know:
+        rendering those needs dbt itself.
+        """
+        if "{%" in raw_sql:
+            return None
+        relations = self._relation_names()
+        unresolved = False
+
+        def render(match: "re.Match[str]") -> str:
+            nonlocal unresolved
+            expression = match.group(1).strip()
+            if expression == "this":
+                key: Tuple[str, ...] = ("ref", model_name.lower())
+            else:
+                call = _JINJA_CALL_RE.fullmatch(expression)
+                if call is None:
+                    unresolved = True
+                    return ""
+                if call.group(1) == "config":
+                    return ""
+                args = tuple(arg.lower() for arg in _REF_QUOTED_RE.findall(call.group(2)))
+                key = ("ref", args[-1]) if call.group(1) == "ref" and args else ("source",) + args
+            relation = relations.get(key)
+            if relation is None:
+                unresolved = True
+                return ""
+            return relation
+
+        rendered = _JINJA_EXPRESSION_RE.sub(render, _JINJA_COMMENT_RE.sub("", raw_sql))
+        return None if unresolved else rendered
+
+    def _relation_names(self) -> Dict[Tuple[str, ...], str]:
+        """``("ref", name)`` and ``("source", source_name, name)`` -> ``relation_name``."""
+        self._ensure_index()
+        if self._relations is not None:
+            return self._relations
+        relations: Dict[Tuple[str, ...], str] = {}
+        for node in self.manifest.get("nodes", {}).values():
+            if node.get("relation_name"):
+                relations.setdefault(("ref", node["name"].lower()), node["relation_name"])
+        for source in self.manifest.get("sources", {}).values():
+            if source.get("relation_name"):
+                key = ("source", source["source_name"].lower(), source["name"].lower())
+                relations.setdefault(key, source["relation_name"])
+        self._relations = relations
+        return relations
+
     def get_model_path(self, model_name: str) -> Optional[str]:
         """Get the path to the model from the manifest."""
         node = self._find_node(model_name)
@@ -260,6 +419,12 @@ class ManifestReader:
         return dict(node)
 
     def get_tests(self) -> List[TestNode]:
+        """Every dbt test node in the manifest as a :class:`TestNode` (see
+        :meth:`get_test_table`, which callers indexing many tests should prefer)."""
+        table = self.get_test_table()
+        return table.nodes(range(len(table)))
+
+    def get_test_table(self) -> TestTable:
         """Read dbt test nodes (``resource_type == "test"``) from the manifest.
 
         We never run the tests; we read what they *declare*. For each test we extract:
@@ -272,9 +437,9 @@ class ManifestReader:
 
         Tests whose target column or model cannot be attributed are kept with the
         unknown field set to ``None`` (never guessed), so the reverse index can report
-        coverage honestly.
+        coverage honestly. A unique_id seen twice keeps its first row.
         """
-        tests: List[TestNode] = []
+        tests = TestTable()
 
         for node_id, node in self.manifest.get("nodes", {}).items():
             if node.get("resource_type") != "test":
@@ -297,11 +462,10 @@ class ManifestReader:
             else:
                 target_column = None
 
-            target_model = _model_name_from_unique_id(node.get("attached_node"))
+            target_model = self._model_name(node.get("attached_node"))
             if target_model is None:
                 model_deps = [
-                    _model_name_from_unique_id(dep)
-                    for dep in node.get("depends_on", {}).get("nodes", [])
+                    self._model_name(dep) for dep in node.get("depends_on", {}).get("nodes", [])
                 ]
                 model_deps = [m for m in model_deps if m is not None]
                 # Only attribute when unambiguous. A ``relationships`` test depends on
@@ -319,15 +483,13 @@ class ManifestReader:
                     referenced_column = field.lower()
 
             tests.append(
-                TestNode(
-                    unique_id=node.get("unique_id") or node_id,
-                    test_name=test_name,
-                    target_model=target_model,
-                    target_column=target_column,
-                    referenced_model=referenced_model,
-                    referenced_column=referenced_column,
-                    resource_path=node.get("original_file_path"),
-                )
+                node.get("unique_id") or node_id,
+                test_name,
+                target_model=target_model,
+                target_column=target_column,
+                referenced_model=referenced_model,
+                referenced_column=referenced_column,
+                resource_path=node.get("original_file_path"),
             )
 
         return tests
@@ -357,20 +519,8 @@ class ManifestReader:
 
             depends_on = exposure_data.get("depends_on", {})
             for dep_id in depends_on.get("nodes", []):
-                parts = dep_id.split(".")
-                if parts[0] == "model":
-                    dep_name = parts[-1].lower()
-                    exposure_deps[exposure_name].add(dep_name)
-                elif parts[0] == "source":
-                    source_node = self.manifest.get("sources", {}).get(dep_id, {})
-                    source_identifier = source_node.get("identifier")
-                    if source_identifier:
-                        exposure_deps[exposure_name].add(source_identifier.lower())
-                    else:
-                        source_name = parts[-1].lower()
-                        exposure_deps[exposure_name].add(source_name)
-                elif parts[0] == "snapshot":
-                    dep_name = parts[-1].lower()
+                dep_name = self._dependency_name(dep_id)
+                if dep_name is not None:
                     exposure_deps[exposure_name].add(dep_name)
 
         return exposure_deps
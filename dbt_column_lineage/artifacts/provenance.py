@@ -0,0 +1,37 @@
+"""What a file the tool writes was produced by: the tool's version and the artifacts read.
+
+The impact heatmap and the ``--impact-state`` file record :func:`tool_version` in their
+header and ignore a file written by another version. The heatmap also records
+:func:`artifacts_digest`, a digest of the content of ``manifest.json`` and
+``catalog.json``, so it can tell whether it describes the artifacts of the current run
+even after being copied between machines or restored from a CI cache.
+
+The lineage store keys itself differently (see
+:func:`~dbt_column_lineage.artifacts.lineage_store.artifact_fingerprint`): it is only
+reused on the machine that wrote it, and checking path, size and mtime there avoids
+reading a large manifest that the store exists to skip.
+"""
+
+import hashlib
+from importlib import metadata
+from pathlib import Path
+from typing import Union
+
+
+def tool_version() -> str:
+    """The installed ``dbt-col-lineage`` version, ``"unknown"`` when not installed."""
+    try:
+        return metadata.version("dbt-col-lineage")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def artifacts_digest(manifest_path: Union[str, Path], catalog_path: Union[str, Path]) -> str:
+    """A content digest of a manifest and a catalog."""
+    hasher = hashlib.sha256()
+    for path in (manifest_path, catalog_path):
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        hasher.update(b"\0")
+    return hasher.hexdigest()
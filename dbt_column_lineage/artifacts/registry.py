@@ -1,14 +1,22 @@
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Set
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+import hashlib
 import logging
+import sqlite3
 
+from dbt_column_lineage.artifacts.adapter_mapping import dialect_fallback_chain
 from dbt_column_lineage.artifacts.catalog import CatalogReader
+from dbt_column_lineage.artifacts.dbt_tests import TestIndex, TestTable
+from dbt_column_lineage.artifacts.lineage_store import (
+    LineageStore,
+    StoredModels,
+    artifact_fingerprint,
+)
 from dbt_column_lineage.artifacts.manifest import ManifestReader
+from dbt_column_lineage.models.core import ColumnNode, ModelNode
 from dbt_column_lineage.models.schema import (
-    Model,
-    Column,
     SQLParseResult,
-    ColumnLineage,
     Exposure,
     Coverage,
     TestNode,
@@ -18,7 +26,8 @@ from dbt_column_lineage.artifacts.exceptions import (
     RegistryNotLoadedError,
     RegistryError,
 )
-from dbt_column_lineage.parser import SQLColumnParser
+from dbt_column_lineage.parser import DialectCascadeParser
+from dbt_column_lineage.parser.dialect_cascade import DialectCascadeStats
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +39,37 @@ _MODEL_LIKE_RESOURCE_TYPES = frozenset({"model", "snapshot", "seed"})
 _COVERAGE_NAME_CAP = 25
 
 
+def topological_order(models: Dict[str, ModelNode]) -> List[str]:
+    """Model names ordered so each comes after its upstream models (DAG order).
+
+    Otherwise stable: ties keep the registry's order. A dependency cycle — which dbt
+    rejects, but hand-edited artifacts may contain — is broken at the back edge.
+    """
+    order: List[str] = []
+    state: Dict[str, bool] = {}  # name -> finished (False while on the DFS stack)
+    for root in models:
+        if root in state:
+            continue
+        state[root] = False
+        stack = [(root, iter(sorted(models[root].upstream)))]
+        while stack:
+            name, pending = stack[-1]
+            for upstream in pending:
+                if upstream in models and upstream not in state:
+                    state[upstream] = False
+                    stack.append((upstream, iter(sorted(models[upstream].upstream))))
+                    break
+            else:
+                stack.pop()
+                state[name] = True
+                order.append(name)
+    return order
+
+
+def _sql_digest(sql: str) -> bytes:
+    return hashlib.blake2b(sql.encode(), digest_size=16).digest()
+
+
 @dataclass
 class ParseStats:
     """Column-lineage parse outcome tallies."""
@@ -39,30 +79,98 @@ class ParseStats:
     skipped_no_sql: int = 0
     failed_model_names: List[str] = field(default_factory=list)
     skipped_model_names: List[str] = field(default_factory=list)
+    # Dialect fallback cascade outcome: models rescued per fallback dialect, cache hits
+    # and the extra parse time the cascade cost.
+    dialect_fallback: DialectCascadeStats = field(default_factory=DialectCascadeStats)
 
 
 @dataclass
 class RegistryState:
     """Immutable state of the registry."""
 
-    models: Dict[str, Model]
+    models: Mapping[str, ModelNode]
     exposures: Dict[str, Exposure]
     is_loaded: bool = False
 
 
+class LineageRegistry(Protocol):
+    """What lineage traversal, the changeset and the displays read from a registry.
+
+    Implemented by :class:`ModelRegistry` (one dbt project) and
+    :class:`~dbt_column_lineage.artifacts.federated.FederatedRegistry` (several).
+    """
+
+    @property
+    def is_loaded(self) -> bool: ...
+
+    def load(self) -> None: ...
+
+    def get_models(self) -> Mapping[str, ModelNode]: ...
+
+    def get_model(self, model_name: str) -> ModelNode: ...
+
+    def get_exposures(self) -> Dict[str, Exposure]: ...
+
+    def get_exposure(self, exposure_name: str) -> Exposure: ...
+
+    def get_coverage(self) -> Coverage: ...
+
+    def get_parse_failed_models(self) -> set: ...
+
+    def is_catalog_backed(self, model_name: str) -> bool: ...
+
+    def get_manifest_downstream(self) -> Dict[str, set]: ...
+
+    def get_filter_dependents(self, source_column: str) -> set: ...
+
+    def get_compiled_sql(self, model_name: str) -> str: ...
+
+    def get_column_tests(self, model: str, column: str) -> List[TestNode]: ...
+
+    def get_tests_referencing(self, model: str, column: str) -> List[TestNode]: ...
+
+    def get_model_tests(self, model: str) -> List[TestNode]: ...
+
+    def get_test_unique_ids(self) -> Set[str]: ...
+
+    def get_unattributable_test_count(self) -> int: ...
+
+    def get_unattributable_tests(self) -> List[TestNode]: ...
+
+
 class ModelRegistry:
     def __init__(
         self,
         catalog_path: str,
         manifest_path: str,
         adapter_override: Optional[str] = None,
+        dialect_cache_path: Optional[str] = None,
+        lineage_store_path: Optional[str] = None,
+        reuse_lineage_from: Optional["ModelRegistry"] = None,
     ):
         self._catalog_reader = CatalogReader(catalog_path)
         self._manifest_reader = ManifestReader(manifest_path)
         self._state = RegistryState(models={}, exposures={}, is_loaded=False)
-        self._sql_parser: Optional[SQLColumnParser] = None
+        self._sql_parser: Optional[DialectCascadeParser] = None
         self._dialect: Optional[str] = None
         self._adapter_override: Optional[str] = adapter_override
+        # Where per-model dialect fallback outcomes persist between runs (None: this run
+        # only). See parser.dialect_cascade.
+        self._dialect_cache_path: Optional[Path] = (
+            Path(dialect_cache_path) if dialect_cache_path else None
+        )
+        # Optional on-disk column graph (see artifacts.lineage_store): reused when it was
+        # built from these exact artifacts, otherwise rebuilt after a full load.
+        self._lineage_store_path: Optional[Path] = (
+            Path(lineage_store_path) if lineage_store_path else None
+        )
+        # A loaded registry over other artifacts of the same project (the head side of a
+        # two-manifest diff, for the base side): models whose inputs match it take their
+        # lineage from it instead of being parsed again. See _reusable_lineage.
+        self._lineage_donor: Optional[ModelRegistry] = reuse_lineage_from
+        # Digest of the compiled SQL each model's lineage was built from, so a registry
+        # using this one as its donor compares SQL without reading ours again.
+        self._compiled_sql_digests: Dict[str, bytes] = {}
         self._parse_stats: ParseStats = ParseStats()
         # Names of model-like nodes that have a real catalog entry (data types known).
         # A manifest node absent from this set is "catalog-missing": still analyzable via
@@ -71,31 +179,24 @@ class ModelRegistry:
         # Lazily-built reverse index: upstream column -> models that reference it ONLY in a
         # predicate (filter/join), i.e. a row-set dependency rather than a value one.
         self._filter_dependents: Optional[Dict[str, set]] = None
-        # Reverse index built at load time: (model, column) -> tests targeting that column.
-        # Keys are lowercased to match the codebase's case-insensitive model/column naming.
-        self._column_tests: Dict[Tuple[str, str], List[TestNode]] = {}
-        # Reverse index for the *referenced* side of relationships tests: (model, column) ->
-        # relationships tests pointing AT that column via ``to=``/``field=``. Removing this
-        # parent key breaks the child's relationships test just as surely as removing the
-        # child column does, so it is a distinct provable-break lookup.
-        self._referenced_tests: Dict[Tuple[str, str], List[TestNode]] = {}
-        # Tests we could not attribute to a (model, column) pair — kept for coverage honesty
-        # (counted, never guessed at). See :meth:`get_unattributable_test_count`.
-        self._unattributable_tests: List[TestNode] = []
+        # Reverse indexes over the manifest's tests, built at load time (keys lowercased to
+        # match the codebase's case-insensitive naming). Besides the (model, column) ->
+        # targeting tests index it holds: the *referenced* side of relationships tests
+        # (removing a parent key breaks the child's test just as surely as removing the
+        # child column); every test a wholesale model removal breaks (column-level recovery
+        # can miss a model's tested columns); and the tests we could not attribute to a
+        # (model, column) pair — counted for coverage honesty, never guessed at.
+        self._test_index: TestIndex = TestIndex(TestTable())
         # Every test node's unique_id present in this manifest. Lets the verdict classifier
         # confirm a base test STILL EXISTS in head before flagging it broken — so a rename
         # that updates the test's yml (new unique_id) is not a false break.
         self._test_unique_ids: Set[str] = set()
-        # model (lowercased) -> every test that breaks if the whole model is removed: those
-        # attached to it AND relationships tests referencing it. Column-level recovery can
-        # miss a model's tested columns, but a wholly-removed model breaks all of its tests.
-        self._model_tests: Dict[str, List[TestNode]] = {}
 
     @property
     def is_loaded(self) -> bool:
         return self._state.is_loaded
 
-    def _initialize_models(self) -> Dict[str, Model]:
+    def _initialize_models(self) -> Dict[str, ModelNode]:
         """Initialize the model universe from the *manifest*, enriched by the catalog.
 
         The manifest is the source of truth for which models exist: it lists every
@@ -117,7 +218,7 @@ class ModelRegistry:
         except Exception as e:
             raise RegistryError(f"Failed to initialize models: {e}")
 
-        models: Dict[str, Model] = {}
+        models: Dict[str, ModelNode] = {}
         catalog_backed: set = set()
 
         # 1) Seed the universe from manifest model-like nodes (model/snapshot/seed).
@@ -139,9 +240,9 @@ class ModelRegistry:
             else:
                 # Present in the manifest but absent from the catalog. Register it now;
                 # its output columns are derived from compiled SQL during lineage parsing.
-                models[name] = Model(
+                models[name] = ModelNode(
                     name=name,
-                    schema=node.get("schema") or "main",
+                    schema_name=node.get("schema") or "main",
                     database=node.get("database") or "main",
                     columns={},
                     resource_type=node.get("resource_type"),
@@ -161,7 +262,7 @@ class ModelRegistry:
             raise RegistryError("No models found in manifest or catalog")
         return models
 
-    def _apply_dependencies(self, models: Dict[str, Model]) -> None:
+    def _apply_dependencies(self, models: Dict[str, ModelNode]) -> None:
         """Apply upstream and downstream dependencies to models."""
         try:
             upstream_deps = self._manifest_reader.get_model_upstream()
@@ -195,7 +296,7 @@ class ModelRegistry:
         except Exception as e:
             raise RegistryError(f"Failed to apply dependencies: {e}")
 
-    def _apply_descriptions(self, models: Dict[str, Model]) -> None:
+    def _apply_descriptions(self, models: Dict[str, ModelNode]) -> None:
         """Populate model and column descriptions from the dbt-authored docs.
 
         The *manifest* is the primary source: dbt records the docs a person wrote in
@@ -263,44 +364,16 @@ class ModelRegistry:
         unattributable and merely counted (never guessed at) — they surface in the
         coverage honesty signal rather than silently disappearing.
         """
-        self._column_tests = {}
-        self._referenced_tests = {}
-        self._unattributable_tests = []
-        self._test_unique_ids = set()
-        self._model_tests = {}
-
-        def _attach_to_model(model_name: Optional[str], test: TestNode) -> None:
-            if model_name is None:
-                return
-            bucket = self._model_tests.setdefault(model_name.lower(), [])
-            if all(t.unique_id != test.unique_id for t in bucket):
-                bucket.append(test)
-
-        for test in self._manifest_reader.get_tests():
-            self._test_unique_ids.add(test.unique_id)
-            # Every test that a whole-model removal would break: attached to the model, or a
-            # relationships test pointing at it from elsewhere.
-            _attach_to_model(test.target_model, test)
-            _attach_to_model(test.referenced_model, test)
-            # A relationships test also depends on its *referenced* (parent) column; index
-            # that side too so a change to the parent key can be found. Both sides may be
-            # unknown independently.
-            if test.referenced_model is not None and test.referenced_column is not None:
-                ref_key = (test.referenced_model.lower(), test.referenced_column.lower())
-                self._referenced_tests.setdefault(ref_key, []).append(test)
-
-            if test.target_model is None or test.target_column is None:
-                self._unattributable_tests.append(test)
-                continue
-            key = (test.target_model.lower(), test.target_column.lower())
-            self._column_tests.setdefault(key, []).append(test)
+        table = self._manifest_reader.get_test_table()
+        self._test_unique_ids = set(table.unique_ids)
+        self._test_index = TestIndex(table)
 
     def get_column_tests(self, model: str, column: str) -> List[TestNode]:
         """Return the dbt tests targeting ``model.column`` (case-insensitive).
 
         Returns an empty list for an unknown (model, column) pair or one with no tests.
         """
-        return list(self._column_tests.get((model.lower(), column.lower()), []))
+        return self._test_index.column_tests(model, column)
 
     def get_tests_referencing(self, model: str, column: str) -> List[TestNode]:
         """Return relationships tests whose *referenced* (parent) side is ``model.column``.
@@ -309,7 +382,7 @@ class ModelRegistry:
         target the column directly (:meth:`get_column_tests`). Case-insensitive; empty when
         nothing references it.
         """
-        return list(self._referenced_tests.get((model.lower(), column.lower()), []))
+        return self._test_index.tests_referencing(model, column)
 
     def get_model_tests(self, model: str) -> List[TestNode]:
         """Every test that breaks if ``model`` is removed wholesale (case-insensitive).
@@ -318,7 +391,7 @@ class ModelRegistry:
         for whole-model removals, where incomplete column recovery would otherwise miss
         tests on columns we couldn't reconstruct from compiled SQL.
         """
-        return list(self._model_tests.get(model.lower(), []))
+        return self._test_index.model_tests(model)
 
     def get_test_unique_ids(self) -> Set[str]:
         """All dbt test unique_ids present in this manifest.
@@ -335,13 +408,13 @@ class ModelRegistry:
         These are kept out of the reverse index but counted here so later coverage
         reporting can stay honest about what the index does and does not cover.
         """
-        return len(self._unattributable_tests)
+        return len(self._test_index.unattributable)
 
     def get_unattributable_tests(self) -> List[TestNode]:
         """The test nodes whose (model, column) target could not be attributed."""
-        return list(self._unattributable_tests)
+        return self._test_index.unattributable_tests()
 
-    def _process_lineage(self, models: Dict[str, Model]) -> None:
+    def _process_lineage(self, models: Dict[str, ModelNode]) -> None:
         """Process and apply column lineage to models."""
         logger = logging.getLogger(__name__)
 
@@ -354,19 +427,41 @@ class ModelRegistry:
         failed_model_names = []
         skipped_model_names = []
 
-        # First pass: Process explicit column references
-        for model_name, model in models.items():
+        def upstream_columns(name: str) -> Optional[List[str]]:
+            # Models are parsed upstream-first, so a catalog-missing upstream already has
+            # the columns recovered from its own SQL when a downstream star reads it.
+            upstream = models.get(name)
+            return list(upstream.columns) if upstream is not None and upstream.columns else None
+
+        # SQL not embedded in the manifest is read from target/compiled in one batch, and
+        # every model's SQL is taken from it once: the donor comparison reuses it.
+        sql_models = [name for name, model in models.items() if model.language == "sql"]
+        self._manifest_reader.prefetch_compiled_sql(sql_models)
+        compiled_sql = {name: self._manifest_reader.get_compiled_sql(name) for name in sql_models}
+        self._compiled_sql_digests = {
+            name: _sql_digest(sql) for name, sql in compiled_sql.items() if sql
+        }
+        reusable = self._reusable_lineage(models, compiled_sql)
+        for model_name in topological_order(models):
+            model = models[model_name]
             if model.language != "sql":
                 continue
 
-            sql = self._manifest_reader.get_compiled_sql(model_name)
+            sql = compiled_sql.pop(model_name)
+            if model_name in reusable:
+                self._copy_lineage(model, reusable[model_name])
+                successful_parses += 1
+                continue
+
             if not sql:
                 skipped_models += 1
                 skipped_model_names.append(model_name)
                 continue
 
             try:
-                parse_result = self._sql_parser.parse_column_lineage(sql)
+                parse_result = self._sql_parser.parse_column_lineage(
+                    sql, model_name=model_name, schema=upstream_columns
+                )
                 self._apply_column_lineage(model, parse_result)
                 successful_parses += 1
             except Exception as e:
@@ -377,12 +472,15 @@ class ModelRegistry:
                 )
                 continue
 
+        fallback = self._sql_parser.stats
+        self._sql_parser.save_cache()
         self._parse_stats = ParseStats(
             parsed_ok=successful_parses,
             parse_failed=failed_parses,
             skipped_no_sql=skipped_models,
             failed_model_names=failed_model_names,
             skipped_model_names=skipped_model_names,
+            dialect_fallback=fallback,
         )
 
         logger.info(
@@ -390,18 +488,111 @@ class ModelRegistry:
             f"{failed_parses} failed, {skipped_models} skipped (no SQL)"
         )
 
+        if fallback.rescued or fallback.cache_hits:
+            rescued = ", ".join(
+                f"{dialect}: {count}"
+                for dialect, count in sorted(fallback.rescued_by_dialect.items())
+            )
+            logger.info(
+                f"Dialect fallback: {fallback.rescued} models rescued ({rescued or 'none'}), "
+                f"{fallback.cache_hits} parsed via cached dialect, "
+                f"cascade cost {fallback.cascade_seconds:.2f}s"
+            )
+
         if failed_model_names:
             logger.info(
                 f"Failed models ({len(failed_model_names)}): {', '.join(failed_model_names)}"
             )
 
-        # Second pass: Process star references
+    def _reusable_lineage(
+        self, models: Dict[str, ModelNode], compiled_sql: Mapping[str, Optional[str]]
+    ) -> Dict[str, ModelNode]:
+        """The donor's models whose lineage stands for ours, by name.
+
+        A model qualifies when the donor parsed it successfully from byte-identical
+        compiled SQL, with the same catalog backing and columns, under the same dialect,
+        and nothing upstream of it differs: an upstream change can alter how the parser
+        resolves its columns (star expansion, unqualified names), so the whole downstream
+        cone of every differing model is parsed afresh. A node without SQL (a source or a
+        seed) differs only when its catalog backing or columns do.
+        """
+        donor = self._lineage_donor
+        if donor is None or not donor.is_loaded or donor._dialect != self._dialect:
+            return {}
+        donor_models = donor.get_models()
+        donor_failed = donor.get_parse_failed_models()
+
+        candidates: Dict[str, ModelNode] = {}
+        differing: List[str] = []
+        for name, model in models.items():
+            theirs = donor_models.get(name)
+            if theirs is None or not self._same_columns(name, model, theirs):
+                differing.append(name)
+            elif model.language != "sql":
+                continue
+            elif name not in donor_failed and self._same_sql(name, compiled_sql[name]):
+                candidates[name] = theirs
+            else:
+                differing.append(name)
+
+        seen = set(differing)
+        while differing:
+            for child in models[differing.pop()].downstream:
+                if child in models and child not in seen:
+                    seen.add(child)
+                    candidates.pop(child, None)
+                    differing.append(child)
+
+        logger.info(f"Reusing the lineage of {len(candidates)} unchanged models")
+        return candidates
+
+    def _same_columns(self, model_name: str, model: ModelNode, theirs: ModelNode) -> bool:
+        """Same catalog backing as in the donor and, when the columns come from the catalog
+        (a backed model, or any node without SQL), the same typed columns."""
+        donor = self._lineage_donor
+        assert donor is not None
+        catalog_backed = model_name in self._catalog_backed_model_names
+        if catalog_backed != donor.is_catalog_backed(model_name):
+            return False
+        if not catalog_backed and model.language == "sql":
+            # Columns recovered from the SQL, which _same_sql compares.
+            return True
+        return [(n, c.data_type) for n, c in model.columns.items()] == [
+            (n, c.data_type) for n, c in theirs.columns.items()
+        ]
+
+    def _same_sql(self, model_name: str, sql: Optional[str]) -> bool:
+        """Whether ``sql`` is what the donor built the model's lineage from."""
+        donor = self._lineage_donor
+        assert donor is not None
+        if not sql:
+            return False
+        digest = donor._compiled_sql_digests.get(model_name)
+        if digest is not None:
+            return digest == _sql_digest(sql)
+        # A donor served from a lineage store parsed nothing in this process.
         try:
-            self._process_star_references(models)
-        except Exception as e:
-            logger.error(f"Failed to process star references: {e}", exc_info=True)
+            return sql == donor.get_compiled_sql(model_name)
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _copy_lineage(model: ModelNode, donor: ModelNode) -> None:
+        """What :meth:`_apply_column_lineage` would have set, taken from ``donor``."""
+        for col_name, column in donor.columns.items():
+            if col_name not in model.columns:
+                # Only catalog-missing models get here: their columns come from parsing.
+                model.columns[col_name] = ColumnNode(
+                    name=col_name, model_name=model.name, data_type=None
+                )
+            model.columns[col_name].lineage = list(column.lineage)
+        model.predicate_sources = set(donor.predicate_sources)
+        model.predicate_lineage = dict(donor.predicate_lineage)
+        if donor.metadata and donor.metadata.get("star_sources"):
+            model.metadata = model.metadata or {}
+            model.metadata["star_sources"] = list(donor.metadata["star_sources"])
 
-    def _apply_column_lineage(self, model: Model, parse_result: SQLParseResult) -> None:
+    def _apply_column_lineage(self, model: ModelNode, parse_result: SQLParseResult) -> None:
         """Apply parsed lineage to model columns.
 
         For a catalog-missing model (present in the manifest but absent from the
@@ -416,7 +607,7 @@ class ModelRegistry:
             if col_name not in model.columns:
                 if not catalog_missing:
                     continue
-                model.columns[col_name] = Column(
+                model.columns[col_name] = ColumnNode(
                     name=col_name,
                     model_name=model.name,
                     data_type=None,
@@ -430,46 +621,12 @@ class ModelRegistry:
             model.metadata = model.metadata or {}
             model.metadata["star_sources"] = list(parse_result.star_sources)
 
-    def _process_star_references(self, models: Dict[str, Model]) -> None:
-        """Process star references between models."""
-        for model in models.values():
-            if not model.metadata or "star_sources" not in model.metadata:
-                continue
-
-            for source_name in model.metadata["star_sources"]:
-                if source_name not in models:
-                    continue
-
-                self._apply_star_columns(model, source_name, models[source_name])
-
-    def _apply_star_columns(self, target: Model, source_name: str, source: Model) -> None:
-        """Apply star columns from source to target model."""
-        for col_name, source_col in source.columns.items():
-            if col_name not in target.columns:
-                continue
-
-            target_col = target.columns[col_name]
-            if not target_col.lineage:
-                target_col.lineage = []
-
-            star_lineage = ColumnLineage(
-                source_columns={f"{source_name}.{col_name}"},
-                transformation_type="direct",
-            )
-
-            if not any(
-                existing.source_columns == star_lineage.source_columns
-                for existing in target_col.lineage
-            ):
-                target_col.lineage.append(star_lineage)
-
     def load(self) -> None:
         """Load and initialize the registry."""
         if self.is_loaded:
             raise RegistryError("Registry has already been loaded")
 
         try:
-            self._catalog_reader.load()
             self._manifest_reader.load()
 
             # Ensure the dialect is set before initializing the parser
@@ -482,25 +639,85 @@ class ModelRegistry:
             else:
                 logger.warning("No dialect detected, the sql parser will be less accurate")
 
-            self._sql_parser = SQLColumnParser(dialect=self._dialect)
+            models: Mapping[str, ModelNode]
+            store = self._open_lineage_store()
+            if store is not None:
+                logger.info(f"Serving models from lineage store {store.path}")
+                models = self._models_from_store(store)
+            else:
+                # Catalog entries the manifest does not list are never read into models.
+                self._catalog_reader.load(keep=self._manifest_reader.get_relation_ids())
+                self._sql_parser = DialectCascadeParser(
+                    self._dialect,
+                    chain=dialect_fallback_chain(self._dialect),
+                    cache_path=self._dialect_cache_path,
+                )
 
-            models = self._initialize_models()
-            self._apply_dependencies(models)
-            self._process_lineage(models)
-            self._apply_descriptions(models)
+                built = self._initialize_models()
+                self._apply_dependencies(built)
+                self._process_lineage(built)
+                self._apply_descriptions(built)
+                models = self._write_lineage_store(built) if self._lineage_store_path else built
             exposures = self._load_exposures()
             self._build_test_index()
             self._state = RegistryState(models=models, exposures=exposures, is_loaded=True)
         except Exception as e:
             raise RegistryError(f"Failed to load registry: {e}")
 
-    def get_models(self) -> Dict[str, Model]:
+    def _store_fingerprint(self) -> Dict[str, Any]:
+        manifest_path = self._manifest_reader.manifest_path
+        assert manifest_path is not None  # the manifest has been loaded from it
+        return artifact_fingerprint(manifest_path, self._catalog_reader.catalog_path, self._dialect)
+
+    def _open_lineage_store(self) -> Optional[LineageStore]:
+        """The configured lineage store, if one exists for exactly these artifacts."""
+        if self._lineage_store_path is None:
+            return None
+        return LineageStore.open_if_fresh(self._lineage_store_path, self._store_fingerprint())
+
+    def _models_from_store(self, store: LineageStore) -> StoredModels:
+        stats = store.meta("parse_stats") or {}
+        self._parse_stats = ParseStats(
+            parsed_ok=stats.get("parsed_ok", 0),
+            parse_failed=stats.get("parse_failed", 0),
+            skipped_no_sql=stats.get("skipped_no_sql", 0),
+            failed_model_names=stats.get("failed_model_names", []),
+            skipped_model_names=stats.get("skipped_model_names", []),
+        )
+        self._catalog_backed_model_names = set(store.meta("catalog_backed") or [])
+        return StoredModels(store)
+
+    def _write_lineage_store(self, models: Dict[str, ModelNode]) -> Mapping[str, ModelNode]:
+        """Persist the freshly built models and serve them from the store from now on.
+
+        A store that cannot be written is not fatal: the in-memory models are kept.
+        """
+        assert self._lineage_store_path is not None
+        stats = self._parse_stats
+        meta = {
+            "parse_stats": {
+                "parsed_ok": stats.parsed_ok,
+                "parse_failed": stats.parse_failed,
+                "skipped_no_sql": stats.skipped_no_sql,
+                "failed_model_names": stats.failed_model_names,
+                "skipped_model_names": stats.skipped_model_names,
+            },
+            "catalog_backed": sorted(self._catalog_backed_model_names),
+        }
+        try:
+            LineageStore.write(self._lineage_store_path, models, self._store_fingerprint(), meta)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not write lineage store {self._lineage_store_path}: {e}")
+            return models
+        return StoredModels(LineageStore(self._lineage_store_path))
+
+    def get_models(self) -> Mapping[str, ModelNode]:
         """Get all models in the registry."""
         if not self.is_loaded:
             raise RegistryNotLoadedError("Registry must be loaded before accessing models")
         return self._state.models
 
-    def get_model(self, model_name: str) -> Model:
+    def get_model(self, model_name: str) -> ModelNode:
         """Get a specific model by name."""
         if not self.is_loaded:
             raise RegistryNotLoadedError("Registry must be loaded before accessing models")
@@ -569,6 +786,10 @@ class ModelRegistry:
             self._parse_stats.skipped_model_names
         )
 
+    def get_dialect_fallback_stats(self) -> DialectCascadeStats:
+        """How many models the dialect fallback cascade rescued, and what it cost."""
+        return self._parse_stats.dialect_fallback
+
     def get_parse_failed_models(self) -> set:
         """Names of models whose compiled SQL was present but failed to parse."""
         return set(self._parse_stats.failed_model_names)
@@ -577,6 +798,24 @@ class ModelRegistry:
         """Whether a model has a real catalog entry (known column types)."""
         return model_name.lower() in self._catalog_backed_model_names
 
+    def get_project_name(self) -> Optional[str]:
+        """The dbt project these artifacts were built for (``metadata.project_name``)."""
+        return self._manifest_reader.manifest.get("metadata", {}).get("project_name")
+
+    def get_model_packages(self) -> Dict[str, str]:
+        """Package of each model-like manifest node, by registry name (first node wins).
+
+        A node whose package is another dbt project is a cross-project reference: the
+        manifest lists it so refs resolve, but that other project defines it.
+        """
+        packages: Dict[str, str] = {}
+        for node_id, node in self._manifest_reader.manifest.get("nodes", {}).items():
+            if node.get("resource_type") not in _MODEL_LIKE_RESOURCE_TYPES:
+                continue
+            name = (node.get("name") or node_id.split(".")[-1]).lower()
+            packages.setdefault(name, self._manifest_reader.parse_unique_id(node_id).package)
+        return packages
+
     def get_manifest_downstream(self) -> Dict[str, set]:
         """Manifest-level downstream child map, covering every model (not just catalog ones)."""
         return self._manifest_reader.get_model_downstream()
@@ -589,6 +828,8 @@ class ModelRegistry:
         lineage misses. A model that also *projects* ``source_column`` is excluded here (it
         is already reported as a value impact), so this stays the purely-predicate set.
         """
+        if isinstance(self._state.models, StoredModels):
+            return self._state.models.store.filter_dependents(source_column)
         if self._filter_dependents is None:
             index: Dict[str, set] = {}
             for name, model in self.get_models().items():
@@ -652,3 +893,50 @@ class ModelRegistry:
             return compiled_sql
 
         raise ValueError(f"No compiled SQL found for model '{model_name}'")
+
+    def render_raw_sql(self, model_name: str, raw_sql: str) -> Optional[str]:
+        """A version of the model's Jinja source rendered against this manifest, or
+        ``None`` when it needs more than ``ref``/``source``/``config`` (see
+        :meth:`ManifestReader.render_raw_sql`)."""
+        self._check_loaded()
+        return self._manifest_reader.render_raw_sql(model_name, raw_sql)
+
+    def parse_model_sql(self, model_name: str, sql: str) -> ModelNode:
+        """A detached copy of the model carrying the column lineage ``sql`` gives it.
+
+        Parsed as at load, against this registry's upstream columns; the registry is left
+        untouched. Lets another version of a model's SQL be compared with the loaded one.
+        """
+        model = self.get_model(model_name)
+        models = self._state.models
+        metadata = {k: v for k, v in (model.metadata or {}).items() if k != "star_sources"}
+        detached = replace(
+            model,
+            columns=(
+                {
+                    name: ColumnNode(name=name, model_name=model.name, data_type=column.data_type)
+                    for name, column in model.columns.items()
+                }
+                if self.is_catalog_backed(model_name)
+                else {}
+            ),
+            metadata=metadata or None,
+            predicate_sources=set(),
+            predicate_lineage={},
+        )
+
+        def upstream_columns(name: str) -> Optional[List[str]]:
+            upstream = models.get(name)
+            return list(upstream.columns) if upstream is not None and upstream.columns else None
+
+        if self._sql_parser is None:  # served from the lineage store, nothing parsed yet
+            self._sql_parser = DialectCascadeParser(
+                self._dialect,
+                chain=dialect_fallback_chain(self._dialect),
+                cache_path=self._dialect_cache_path,
+            )
+        parse_result = self._sql_parser.parse_column_lineage(
+            sql, model_name=model.name, schema=upstream_columns
+        )
+        self._apply_column_lineage(detached, parse_result)
+        return detached
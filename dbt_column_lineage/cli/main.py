@@ -1,10 +1,12 @@
-import json
 import sys
 from pathlib import Path
 import click
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from dbt_column_lineage.artifacts import json_backend
+from dbt_column_lineage.artifacts.compression import find_artifact
+from dbt_column_lineage.artifacts.provenance import artifacts_digest
 from dbt_column_lineage.lineage.changeset import (
     ChangesetBuilder,
     ColumnChange,
@@ -13,14 +15,26 @@ from dbt_column_lineage.lineage.changeset import (
     git_changed_models,
     scope_changes_to_models,
 )
+from dbt_column_lineage.lineage.git_diff import GitDiff
+from dbt_column_lineage.lineage.heatmap import Heatmap
+from dbt_column_lineage.lineage.impact_state import ImpactState
+from dbt_column_lineage.lineage.sharding import (
+    merge_shard_reports,
+    parse_shard,
+    shard_positions,
+    shard_report_fields,
+)
 from dbt_column_lineage.lineage.verdict import classify_provable_breaks, decide_verdict
 from dbt_column_lineage.lineage.display import TextDisplay, DotDisplay, JsonDisplay
 from dbt_column_lineage.lineage.display.html.explore import LineageExplorer
 from dbt_column_lineage.lineage.display.markdown import render_changeset_markdown
-from dbt_column_lineage.lineage.service import LineageService, LineageSelector
+from dbt_column_lineage.lineage.service import (
+    LineageService,
+    LineageSelector,
+    aggregate_change_impacts,
+)
 from dbt_column_lineage.lineage.display.base import LineageStaticDisplay
 
-
 logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
 
 
@@ -43,13 +57,13 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
     "--catalog",
     type=click.Path(exists=True),
     default="target/catalog.json",
-    help="Path to the dbt catalog file",
+    help="Path to the dbt catalog file (may be .gz/.zst compressed)",
 )
 @click.option(
     "--manifest",
     type=click.Path(exists=True),
     default="target/manifest.json",
-    help="Path to the dbt manifest file",
+    help="Path to the dbt manifest file (may be .gz/.zst compressed)",
 )
 @click.option(
     "--format",
@@ -68,6 +82,24 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
     "--adapter",
     help="Override sqlglot dialect (e.g., tsql, snowflake, bigquery). If set, ignores adapter from manifest.",
 )
+@click.option(
+    "--dialect-cache",
+    type=click.Path(dir_okay=False),
+    help="JSON file remembering which fallback dialect parsed each model, so later runs "
+    "try it first. Created if missing; omit to keep fallback outcomes for this run only.",
+)
+@click.option(
+    "--lineage-store",
+    type=click.Path(dir_okay=False),
+    help="SQLite file to keep the parsed column graph in, queried on demand instead of "
+    "held in memory. Reused while manifest/catalog are unchanged, rebuilt otherwise.",
+)
+@click.option(
+    "--heatmap",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Impact heatmap written by `dbt-col-lineage heatmap`, served to the explorer "
+    "(only used with --explore).",
+)
 def cli(
     select: str,
     explore: bool,
@@ -77,6 +109,9 @@ def cli(
     output: str,
     port: int,
     adapter: Optional[str],
+    dialect_cache: Optional[str],
+    lineage_store: Optional[str],
+    heatmap: Optional[str],
 ) -> None:
     """DBT Column Lineage - Generate column-level lineage for DBT models."""
     if not select and not explore:
@@ -88,11 +123,19 @@ def cli(
         sys.exit(1)
 
     try:
-        service = LineageService(Path(catalog), Path(manifest), adapter=adapter)
+        service = LineageService(
+            Path(catalog),
+            Path(manifest),
+            adapter=adapter,
+            dialect_cache=Path(dialect_cache) if dialect_cache else None,
+            lineage_store=Path(lineage_store) if lineage_store else None,
+        )
 
         if explore:
             click.echo(f"Starting explore mode server on port {port}...")
-            lineage_explorer = LineageExplorer(port=port)
+            lineage_explorer = LineageExplorer(
+                port=port, heatmap=Heatmap.load(heatmap) if heatmap else None
+            )
             lineage_explorer.set_lineage_service(service)
             lineage_explorer.start()
             return
@@ -114,7 +157,7 @@ def cli(
                 else:
                     display = TextDisplay()
 
-                display.display_column_info(column)
+                display.display_column_info(column.to_api())
                 if isinstance(display, JsonDisplay):
                     display.set_model_description(model.description)
 
@@ -175,24 +218,26 @@ def cli(
     "--manifest",
     type=click.Path(exists=True),
     default="target/manifest.json",
-    help="Path to the current (head) dbt manifest file",
+    help="Path to the current (head) dbt manifest file (may be .gz/.zst compressed)",
 )
 @click.option(
     "--catalog",
     type=click.Path(exists=True),
     default="target/catalog.json",
-    help="Path to the current (head) dbt catalog file",
+    help="Path to the current (head) dbt catalog file (may be .gz/.zst compressed)",
 )
 @click.option(
     "--base-manifest",
     type=click.Path(exists=True),
-    help="Path to the base (target-branch) manifest. Enables two-manifest diff.",
+    help="Path to the base (target-branch) manifest, optionally .gz/.zst compressed. "
+    "Enables two-manifest diff.",
 )
 @click.option(
     "--base-catalog",
     type=click.Path(exists=True),
-    help="Path to the base (target-branch) catalog. Defaults to catalog.json next "
-    "to --base-manifest. Required for column-level (add/remove/type) diffing.",
+    help="Path to the base (target-branch) catalog. Defaults to catalog.json (or "
+    "catalog.json.gz/.zst) next to --base-manifest. Required for column-level "
+    "(add/remove/type) diffing.",
 )
 @click.option(
     "--git-base",
@@ -213,6 +258,32 @@ def cli(
     help="Output format for the impact report",
 )
 @click.option("--adapter", help="Override sqlglot dialect (e.g., tsql, snowflake, bigquery).")
+@click.option(
+    "--dialect-cache",
+    type=click.Path(dir_okay=False),
+    help="JSON file remembering which fallback dialect parsed each model, so later runs "
+    "try it first. Created if missing; omit to keep fallback outcomes for this run only.",
+)
+@click.option(
+    "--impact-state",
+    type=click.Path(dir_okay=False),
+    help="JSON file keeping each change's impact between runs (e.g. pushes to one PR): "
+    "changes whose model and downstream models are unchanged reuse it instead of being "
+    "traced again. Created if missing.",
+)
+@click.option(
+    "--heatmap",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Impact heatmap written by `dbt-col-lineage heatmap`. Each changed column gets "
+    "its project-wide blast radius from it; built from the head artifacts, it also "
+    "spares tracing changes that reach nothing downstream.",
+)
+@click.option(
+    "--shard",
+    help="Trace only shard i of N (e.g. 2/4) of the changeset, for a CI matrix; combine "
+    "the shards' reports with `dbt-col-lineage merge`. Changes are split by model, "
+    "balanced by downstream cone size. The partial report is always JSON.",
+)
 @click.option(
     "--ci",
     is_flag=True,
@@ -242,6 +313,12 @@ def cli(
     type=int,
     help="Pull request number (defaults to the GitHub Actions event payload).",
 )
+@click.option(
+    "--github-cache",
+    type=click.Path(dir_okay=False),
+    help="JSON file keeping the PR's comment listing between --ci runs, so unchanged "
+    "pages are revalidated with GitHub instead of downloaded again. Created if missing.",
+)
 def impact(
     manifest: str,
     catalog: str,
@@ -251,11 +328,16 @@ def impact(
     scope_git: Optional[str],
     format: str,
     adapter: Optional[str],
+    dialect_cache: Optional[str],
+    impact_state: Optional[str],
+    heatmap: Optional[str],
+    shard: Optional[str],
     ci: bool,
     fail_on: str,
     github_token: Optional[str],
     repo: Optional[str],
     pr_number: Optional[int],
+    github_cache: Optional[str],
 ) -> None:
     """Diff-driven impact: assess the blast radius of a whole change (PR).
 
@@ -264,16 +346,31 @@ def impact(
     sticky PR comment and gate the check with --fail-on.
     """
     try:
-        head_service = LineageService(Path(catalog), Path(manifest), adapter=adapter)
+        dialect_cache_path = Path(dialect_cache) if dialect_cache else None
+        head_service = LineageService(
+            Path(catalog), Path(manifest), adapter=adapter, dialect_cache=dialect_cache_path
+        )
 
         base_service: Optional[LineageService] = None
         changes: List[ColumnChange]
+        # The one git diff of this invocation, whichever mode runs it; its timings go
+        # into the report.
+        git_diff: Optional[GitDiff] = None
         # Whether structural checks (added/removed/type_changed) could run. They need a
         # real catalog on both sides; the two-manifest path decides this from the builder
         # below. The git-diff fallback is a separate, self-evident coarse mode, so it is
         # left as-is (no catalog note).
         structural_checks_available = True
 
+        if shard and ci:
+            click.echo(
+                "Error: --ci applies to the whole report; run it on `dbt-col-lineage merge` "
+                "of the shards instead of on each --shard.",
+                err=True,
+            )
+            sys.exit(1)
+        shard_spec = parse_shard(shard) if shard else None
+
         if scope_git and not base_manifest:
             click.echo(
                 "Error: --scope-git only applies to the two-manifest diff "
@@ -285,8 +382,8 @@ def impact(
         if base_manifest:
             resolved_base_catalog = base_catalog
             if not resolved_base_catalog:
-                sibling = Path(base_manifest).parent / "catalog.json"
-                if sibling.exists():
+                sibling = find_artifact(Path(base_manifest).parent, "catalog.json")
+                if sibling is not None:
                     resolved_base_catalog = str(sibling)
             if not resolved_base_catalog:
                 click.echo(
@@ -296,8 +393,14 @@ def impact(
                 )
                 sys.exit(1)
 
+            # Base models unchanged from head (and not downstream of a change) take head's
+            # lineage rather than being parsed a second time.
             base_service = LineageService(
-                Path(resolved_base_catalog), Path(base_manifest), adapter=adapter
+                Path(resolved_base_catalog),
+                Path(base_manifest),
+                adapter=adapter,
+                dialect_cache=dialect_cache_path,
+                reuse_lineage_from=head_service.registry,
             )
             builder = ChangesetBuilder(base_service.registry, head_service.registry)
             changes = builder.build()
@@ -308,11 +411,13 @@ def impact(
                 # Intersect the precise two-manifest changeset with the models the
                 # branch actually touched, so a stale base artifact can't leak
                 # already-merged changes into the report.
-                scoped_models = git_changed_models(head_service.registry, scope_git)
+                git_diff = GitDiff(scope_git)
+                scoped_models = git_changed_models(head_service.registry, scope_git, diff=git_diff)
                 changes = scope_changes_to_models(changes, scoped_models)
                 source = f"two-manifest scoped to git-diff ({scope_git})"
         elif git_base:
-            changes = build_git_changeset(head_service.registry, git_base)
+            git_diff = GitDiff(git_base)
+            changes = build_git_changeset(head_service.registry, git_base, diff=git_diff)
             source = f"git-diff ({git_base})"
         else:
             click.echo(
@@ -330,8 +435,40 @@ def impact(
                 err=True,
             )
 
-        aggregated = head_service.get_changeset_impact(changes, base_service=base_service)
+        # A shard traces only its part of the changeset; everything else covers it all.
+        positions = list(range(len(changes)))
+        if shard_spec is not None:
+            positions = shard_positions(changes, head_service.downstream_model_count, *shard_spec)
+        traced = [changes[position] for position in positions]
+
+        state = ImpactState(Path(impact_state)) if impact_state else None
+        heat = Heatmap.load(heatmap) if heatmap else None
+        # Counts from another build of the project annotate the report; only a heatmap of
+        # these very artifacts may stand in for a traversal.
+        heat_matches_head = heat is not None and heat.matches(artifacts_digest(manifest, catalog))
+        change_impacts = head_service.get_change_impacts(
+            traced,
+            base_service=base_service,
+            impact_state=state,
+            heatmap=heat if heat_matches_head else None,
+        )
+        confidence_inputs = head_service.get_confidence_inputs(traced)
+        aggregated = aggregate_change_impacts(change_impacts, confidence_inputs)
         report = build_changeset_report(source, changes, aggregated)
+        if state is not None:
+            state.save()
+            report["impact_state"] = state.summary()
+        if heat is not None:
+            _annotate_blast_radius(report, heat)
+            report["heatmap"] = {
+                "path": heatmap,
+                "matches_head": heat_matches_head,
+                "skipped_traversals": heat.skipped,
+            }
+        if git_diff is not None:
+            changeset_block = report["changeset"]
+            assert isinstance(changeset_block, dict)
+            changeset_block["git"] = git_diff.metadata()
         report["coverage"] = head_service.get_coverage().model_dump()
         report["structural_checks_available"] = structural_checks_available
 
@@ -355,8 +492,14 @@ def impact(
             "unattributable_tests": head_service.registry.get_unattributable_test_count(),
         }
 
-        if format == "json":
-            click.echo(json.dumps(report, indent=2, sort_keys=False))
+        if shard_spec is not None:
+            # The report's by_change entries are the change impacts' own, so any
+            # blast_radius annotated above travels to the merge with them.
+            report.update(
+                shard_report_fields(*shard_spec, positions, change_impacts, confidence_inputs)
+            )
+        if format == "json" or shard_spec is not None:
+            click.echo(json_backend.dumps_pretty(report))
         else:
             click.echo(render_changeset_markdown(report))
 
@@ -368,7 +511,171 @@ def impact(
     # the report is a hard error, but the CI gate deciding to fail the check
     # (exit 1) is a normal outcome we don't want to mask as "Error: 1".
     if ci:
-        _run_ci(report, fail_on, github_token, repo, pr_number)
+        _run_ci(
+            report,
+            fail_on,
+            github_token,
+            repo,
+            pr_number,
+            Path(github_cache) if github_cache else None,
+        )
+
+
+def _annotate_blast_radius(report: Dict[str, Any], heat: Heatmap) -> None:
+    """Add each changed column's heatmap counts to its ``by_change`` entry."""
+    for entry in report.get("by_change", []):
+        counts = heat.lookup(entry["model"], entry["column"])
+        if counts is not None:
+            entry["blast_radius"] = counts
+
+
+@click.command()
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True),
+    default="target/manifest.json",
+    help="Path to the dbt manifest file (may be .gz/.zst compressed)",
+)
+@click.option(
+    "--catalog",
+    type=click.Path(exists=True),
+    default="target/catalog.json",
+    help="Path to the dbt catalog file (may be .gz/.zst compressed)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default="target/impact_heatmap.json.gz",
+    help="Where to write the heatmap (gzip-compressed when the name ends in .gz)",
+)
+@click.option(
+    "--top",
+    type=int,
+    default=0,
+    help="Also print the N columns with the largest downstream reach.",
+)
+@click.option("--adapter", help="Override sqlglot dialect (e.g., tsql, snowflake, bigquery).")
+@click.option(
+    "--dialect-cache",
+    type=click.Path(dir_okay=False),
+    help="JSON file remembering which fallback dialect parsed each model, so later runs "
+    "try it first. Created if missing; omit to keep fallback outcomes for this run only.",
+)
+def heatmap(
+    manifest: str,
+    catalog: str,
+    output: str,
+    top: int,
+    adapter: Optional[str],
+    dialect_cache: Optional[str],
+) -> None:
+    """Precompute the blast radius of every column of the project.
+
+    Writes, per column, the downstream models, columns and exposures a change to it
+    reaches and how many of those are critical or row-set (filter) dependents, for
+    `impact --heatmap` and `--explore --heatmap` to look up instead of traversing.
+    """
+    try:
+        service = LineageService(
+            Path(catalog),
+            Path(manifest),
+            adapter=adapter,
+            dialect_cache=Path(dialect_cache) if dialect_cache else None,
+        )
+        heat = Heatmap.build(service.registry, artifacts_digest(manifest, catalog))
+        heat.save(output)
+        click.echo(f"Wrote the impact heatmap of {len(heat.columns)} columns to {output}")
+        for row in heat.hottest(top) if top > 0 else []:
+            click.echo(
+                f"  {row['column']}: {row['affected_columns']} columns, "
+                f"{row['affected_models']} models, {row['affected_exposures']} exposures"
+            )
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@click.command()
+@click.argument("reports", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--format",
+    "-f",
+    type=click.Choice(["markdown", "json"]),
+    default="markdown",
+    help="Output format for the merged impact report",
+)
+@click.option(
+    "--ci",
+    is_flag=True,
+    help="CI mode: post/update a sticky impact comment on the PR and apply the "
+    "--fail-on severity gate as an exit code.",
+)
+@click.option(
+    "--fail-on",
+    type=click.Choice(["none", "tests", "exposures", "critical", "any"]),
+    default="none",
+    help="Severity gate for --ci, as for `impact --fail-on`.",
+)
+@click.option(
+    "--github-token",
+    envvar="GITHUB_TOKEN",
+    help="GitHub token for posting the PR comment (defaults to $GITHUB_TOKEN).",
+)
+@click.option(
+    "--repo",
+    envvar="GITHUB_REPOSITORY",
+    help="owner/name of the repo (defaults to $GITHUB_REPOSITORY).",
+)
+@click.option(
+    "--pr-number",
+    type=int,
+    help="Pull request number (defaults to the GitHub Actions event payload).",
+)
+@click.option(
+    "--github-cache",
+    type=click.Path(dir_okay=False),
+    help="JSON file keeping the PR's comment listing between --ci runs, as for "
+    "`impact --github-cache`.",
+)
+def merge(
+    reports: Tuple[str, ...],
+    format: str,
+    ci: bool,
+    fail_on: str,
+    github_token: Optional[str],
+    repo: Optional[str],
+    pr_number: Optional[int],
+    github_cache: Optional[str],
+) -> None:
+    """Combine the JSON reports of every `impact --shard i/N` of one run.
+
+    The merged report is the one the unsharded `impact` would have written; add --ci to
+    post it and gate the check, as `impact --ci` does.
+    """
+    try:
+        partial = []
+        for path in reports:
+            with open(path, "rb") as handle:
+                partial.append(json_backend.loads(handle.read()))
+        report = merge_shard_reports(partial)
+        if format == "json":
+            click.echo(json_backend.dumps_pretty(report))
+        else:
+            click.echo(render_changeset_markdown(report))
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+    if ci:
+        _run_ci(
+            report,
+            fail_on,
+            github_token,
+            repo,
+            pr_number,
+            Path(github_cache) if github_cache else None,
+        )
 
 
 def _run_ci(
@@ -377,6 +684,7 @@ def _run_ci(
     token: Optional[str],
     repo: Optional[str],
     pr_number: Optional[int],
+    github_cache: Optional[Path] = None,
 ) -> None:
     """Post the sticky PR comment (best-effort) and exit per the severity gate."""
     from dbt_column_lineage.lineage.ci import (
@@ -402,7 +710,7 @@ def _run_ci(
         )
     else:
         try:
-            outcome = post_sticky_comment(context, body)
+            outcome = post_sticky_comment(context, body, cache_path=github_cache)
             click.echo(
                 f"CI mode: {outcome} impact comment on {context.repo}#{context.pr_number}.",
                 err=True,
@@ -424,10 +732,15 @@ def _run_ci(
 
 def main() -> None:
     # Keep `cli` fully backward-compatible (existing --select/--explore usage and
-    # tests target it directly) while exposing `impact` as a subcommand.
+    # tests target it directly) while exposing `impact`, `merge` and `heatmap` as
+    # subcommands.
     argv = sys.argv[1:]
     if argv and argv[0] == "impact":
         impact.main(args=argv[1:], prog_name="dbt-col-lineage impact")
+    elif argv and argv[0] == "merge":
+        merge.main(args=argv[1:], prog_name="dbt-col-lineage merge")
+    elif argv and argv[0] == "heatmap":
+        heatmap.main(args=argv[1:], prog_name="dbt-col-lineage heatmap")
     else:
         cli()
 
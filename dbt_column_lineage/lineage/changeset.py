@@ -12,12 +12,12 @@ from __future__ import annotations
 
 import logging
 import re
-import subprocess
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple
 
-from dbt_column_lineage.artifacts.registry import ModelRegistry
+from dbt_column_lineage.artifacts.registry import LineageRegistry
+from dbt_column_lineage.lineage.git_diff import FileChange, GitDiff
 from dbt_column_lineage.parser.sql_parser_utils import strip_sql_comments
 
 logger = logging.getLogger(__name__)
@@ -79,6 +79,11 @@ def _normalize_sql(sql: Optional[str]) -> Optional[str]:
     return strip_sql_comments(sql)
 
 
+def _column_fingerprint(model) -> Tuple[Tuple[str, str], ...]:
+    """A model's columns as (name, lowercased data type) pairs, in catalog order."""
+    return tuple((name, (column.data_type or "").lower()) for name, column in model.columns.items())
+
+
 class ChangesetBuilder:
     """Derive a :class:`ColumnChange` list from two loaded ``ModelRegistry`` instances.
 
@@ -88,7 +93,7 @@ class ChangesetBuilder:
     than one way, the highest-priority kind is kept (see :class:`ChangeKind`).
     """
 
-    def __init__(self, base: ModelRegistry, head: ModelRegistry):
+    def __init__(self, base: LineageRegistry, head: LineageRegistry):
         self.base = base
         self.head = head
 
@@ -126,6 +131,9 @@ class ChangesetBuilder:
 
             assert base_model is not None and head_model is not None
 
+            if self._unchanged(model_name, base_model, head_model):
+                continue
+
             # Structural column diffs (added/removed/type_changed) are only trustworthy
             # when BOTH sides are backed by a real catalog. For a catalog-missing model
             # the column set is recovered from parsing compiled SQL (best-effort, no data
@@ -169,6 +177,20 @@ class ChangesetBuilder:
 
         return sorted(chosen.values(), key=lambda c: (c.model, c.column, c.kind.value))
 
+    def _unchanged(self, model_name: str, base_model, head_model) -> bool:
+        """Fast path for the (usual) untouched model: same columns with the same types,
+        and byte-identical compiled SQL on both sides.
+
+        Neither a structural nor a logic diff can find anything then, so both are skipped
+        -- no SQL normalisation, no per-column lineage signatures. Any difference, even a
+        cosmetic one, falls through to the full diff.
+        """
+        if _column_fingerprint(base_model) != _column_fingerprint(head_model):
+            return False
+        return self._safe_compiled_sql(self.base, model_name) == self._safe_compiled_sql(
+            self.head, model_name
+        )
+
     def _both_catalog_backed(self, model_name: str) -> bool:
         """True when the model has a real catalog entry in BOTH base and head.
 
@@ -193,7 +215,7 @@ class ChangesetBuilder:
         return self._side_has_catalog(self.base) and self._side_has_catalog(self.head)
 
     @staticmethod
-    def _side_has_catalog(registry: ModelRegistry) -> bool:
+    def _side_has_catalog(registry: LineageRegistry) -> bool:
         return any(registry.is_catalog_backed(name) for name in registry.get_models())
 
     def _logic_changed(self, model_name: str) -> bool:
@@ -203,7 +225,8 @@ class ChangesetBuilder:
             return False
         return base_sql != head_sql
 
-    def _logic_changed_columns(self, base_model, head_model) -> Set[str]:
+    @staticmethod
+    def _logic_changed_columns(base_model, head_model) -> Set[str]:
         """Which output columns actually changed derivation between base and head.
 
         The model's compiled SQL differs, but usually only a few columns are responsible.
@@ -215,12 +238,20 @@ class ChangesetBuilder:
         - if NEITHER side has any parsed per-column lineage, flag all head columns;
         - a column parsed on exactly one side (its signature appeared or disappeared) is
           treated as changed.
+
+        A column is compared by expression fingerprints only when every lineage entry on
+        both sides has one; otherwise both sides are compared by normalized text, so a
+        fingerprint is never set against an expression and reported as a change.
         """
-        base_sigs = self._column_signatures(base_model)
-        head_sigs = self._column_signatures(head_model)
+        base_sigs = ChangesetBuilder._column_signatures(base_model)
+        head_sigs = ChangesetBuilder._column_signatures(head_model)
         if not base_sigs and not head_sigs:
             return set(head_model.columns)
 
+        fingerprinted = ChangesetBuilder._fingerprinted_columns(base_model)
+        fingerprinted &= ChangesetBuilder._fingerprinted_columns(head_model)
+        base_text: Optional[Dict[str, Tuple]] = None
+        head_text: Optional[Dict[str, Tuple]] = None
         changed: Set[str] = set()
         for column in head_model.columns:
             base_sig = base_sigs.get(column)
@@ -229,14 +260,35 @@ class ChangesetBuilder:
                 # Neither side parsed this column (e.g. a literal constant with no lineage);
                 # there's nothing to diff, so don't treat it as changed.
                 continue
+            if base_sig != head_sig and column not in fingerprinted:
+                if base_text is None or head_text is None:
+                    base_text = ChangesetBuilder._column_signatures(base_model, text=True)
+                    head_text = ChangesetBuilder._column_signatures(head_model, text=True)
+                base_sig, head_sig = base_text.get(column), head_text.get(column)
             if base_sig != head_sig:
                 changed.add(column)
         return changed
 
     @staticmethod
-    def _column_signatures(model) -> Dict[str, Tuple]:
+    def _fingerprinted_columns(model) -> Set[str]:
+        """Columns with parsed lineage whose every entry carries an expression fingerprint."""
+        fingerprinted: Set[str] = set()
+        for column_name, column in model.columns.items():
+            lineage = getattr(column, "lineage", None) or []
+            if lineage and all(entry.expression_fingerprint for entry in lineage):
+                fingerprinted.add(column_name)
+        return fingerprinted
+
+    @staticmethod
+    def _column_signatures(model, text: bool = False) -> Dict[str, Tuple]:
         """Per-column derivation signature: {column -> sorted lineage fingerprint}.
 
+        Parsed expressions are compared by the hash of their canonicalized AST, which the
+        parser stores with the lineage, so a column whose expression was only reformatted
+        (comments, case, quoting, parentheses, a renamed table alias) keeps its signature;
+        lineage without one, and every entry when ``text`` is set, uses the normalized
+        expression text instead.
+
         Columns with no parsed lineage are omitted (no signature), so the caller can tell
         "parsed, unchanged" apart from "not parsed".
         """
@@ -245,16 +297,17 @@ class ChangesetBuilder:
             lineage = getattr(column, "lineage", None) or []
             if not lineage:
                 continue
-            parts = []
+            parts = set()
             for entry in lineage:
-                expression = _normalize_sql(getattr(entry, "sql_expression", None)) or ""
-                sources = ",".join(sorted(entry.source_columns or []))
-                parts.append((entry.transformation_type or "", expression, sources))
+                transformation_type, expression, sources = entry.signature
+                if text or not entry.expression_fingerprint:
+                    expression = _normalize_sql(entry.sql_expression) or ""
+                parts.add((transformation_type, expression, sources))
             signatures[column_name] = tuple(sorted(parts))
         return signatures
 
     @staticmethod
-    def _safe_compiled_sql(registry: ModelRegistry, model_name: str) -> Optional[str]:
+    def _safe_compiled_sql(registry: LineageRegistry, model_name: str) -> Optional[str]:
         try:
             return registry.get_compiled_sql(model_name)
         except Exception:
@@ -263,7 +316,7 @@ class ChangesetBuilder:
             return None
 
 
-def _path_to_model_map(head: ModelRegistry) -> Dict[str, str]:
+def _path_to_model_map(head: LineageRegistry) -> Dict[str, str]:
     """Map each model's ``resource_path`` (dbt ``original_file_path``) to its name."""
     mapping: Dict[str, str] = {}
     for model_name, model in head.get_models().items():
@@ -273,44 +326,63 @@ def _path_to_model_map(head: ModelRegistry) -> Dict[str, str]:
 
 
 def git_changed_models(
-    head: ModelRegistry,
+    head: LineageRegistry,
     git_base: str,
     repo_dir: Optional[str] = None,
+    diff: Optional[GitDiff] = None,
 ) -> Set[str]:
     """Return the set of models whose ``.sql`` file changed against ``git_base``.
 
     Files with no matching model (macros, tests, deleted files) are ignored, so
-    this reflects only *model* edits — the unit the scope filter cares about.
+    this reflects only *model* edits — the unit the scope filter cares about. Pass
+    ``diff`` to reuse the git output of another lookup in the same invocation.
     """
+    return set(_changed_model_files(head, diff or GitDiff(git_base, repo_dir)))
+
+
+def _changed_model_files(head: LineageRegistry, diff: GitDiff) -> Dict[str, FileChange]:
+    """Changed model name -> its file in ``diff``."""
     path_to_model = _path_to_model_map(head)
-    changed: Set[str] = set()
-    for changed_file in _git_changed_sql_files(git_base, repo_dir):
-        matched = path_to_model.get(_norm_path(changed_file))
+    changed: Dict[str, FileChange] = {}
+    for change in diff.changes():
+        matched = path_to_model.get(_norm_path(change.path))
         if matched:
-            changed.add(matched)
+            changed[matched] = change
     return changed
 
 
 def build_git_changeset(
-    head: ModelRegistry,
+    head: LineageRegistry,
     git_base: str,
     repo_dir: Optional[str] = None,
+    diff: Optional[GitDiff] = None,
 ) -> List[ColumnChange]:
     """Fallback changeset: diff ``.sql`` model files against ``git_base``.
 
-    When only one manifest is available we cannot diff columns, so every column
-    of each touched model is reported as ``logic_changed`` — a coarse but honest
-    signal. Files are mapped to models via each model's ``resource_path``.
+    Files are mapped to models via each model's ``resource_path``. Only one manifest
+    is available, so columns cannot be diffed structurally; instead the file as of the
+    merge base is rendered against the head manifest, parsed, and its per-column lineage
+    signatures compared with head's (as :meth:`ChangesetBuilder._logic_changed_columns`
+    does), and only the columns whose derivation changed are reported as
+    ``logic_changed``. When that is not possible (see :func:`_git_changed_columns`)
+    every column of the touched model is reported — a coarse but honest signal.
+
+    Both versions of every changed file are read in a single ``git cat-file`` call.
     """
-    changed_models = git_changed_models(head, git_base, repo_dir)
+    diff = diff or GitDiff(git_base, repo_dir)
+    changed_models = _changed_model_files(head, diff)
     if not changed_models:
         return []
 
+    diff.prefetch(
+        blob for change in changed_models.values() for blob in (change.old_blob, change.new_blob)
+    )
     head_models = head.get_models()
     chosen: Dict[Tuple[str, str], ColumnChange] = {}
-    for model_name in changed_models:
+    for model_name, change in changed_models.items():
         model = head_models[model_name]
-        for column in sorted(model.columns):
+        columns = _git_changed_columns(head, model_name, change, diff)
+        for column in sorted(model.columns if columns is None else columns):
             chosen[(model_name, column)] = ColumnChange(
                 model_name, column, ChangeKind.LOGIC_CHANGED, detail=model.resource_path
             )
@@ -318,6 +390,43 @@ def build_git_changeset(
     return sorted(chosen.values(), key=lambda c: (c.model, c.column))
 
 
+def _git_changed_columns(
+    head: LineageRegistry,
+    model_name: str,
+    change: FileChange,
+    diff: GitDiff,
+) -> Optional[Set[str]]:
+    """The columns of ``model_name`` whose derivation changed since the merge base.
+
+    ``None`` when the model's SQL at the merge base cannot be reconstructed faithfully:
+    the registry cannot render or parse SQL, the file is new, or its Jinja is more than
+    ``ref``/``source``/``config``. The renderer is trusted only if, applied to the file
+    at ``HEAD``, it reproduces the compiled SQL dbt wrote to the head manifest.
+    """
+    render = getattr(head, "render_raw_sql", None)
+    parse = getattr(head, "parse_model_sql", None)
+    if render is None or parse is None or model_name in head.get_parse_failed_models():
+        return None
+
+    base_raw = diff.blob(change.old_blob)
+    head_raw = diff.blob(change.new_blob)
+    if base_raw is None or head_raw is None:
+        return None
+    head_rendered = render(model_name, head_raw)
+    head_sql = ChangesetBuilder._safe_compiled_sql(head, model_name)
+    if head_rendered is None or _normalize_sql(head_rendered) != _normalize_sql(head_sql):
+        return None
+    base_rendered = render(model_name, base_raw)
+    if base_rendered is None:
+        return None
+    try:
+        base_model = parse(model_name, base_rendered)
+    except Exception as exc:
+        logger.debug(f"Could not parse the merge-base version of {model_name}: {exc}")
+        return None
+    return ChangesetBuilder._logic_changed_columns(base_model, head.get_models()[model_name])
+
+
 def scope_changes_to_models(changes: List[ColumnChange], models: Set[str]) -> List[ColumnChange]:
     """Keep only changes whose model is in ``models``.
 
@@ -332,21 +441,6 @@ def _norm_path(path: str) -> str:
     return re.sub(r"^\./", "", path.strip()).lstrip("/")
 
 
-def _git_changed_sql_files(git_base: str, repo_dir: Optional[str]) -> List[str]:
-    try:
-        result = subprocess.run(
-            ["git", "diff", "--name-only", f"{git_base}...HEAD", "--", "*.sql"],
-            cwd=repo_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError) as exc:
-        raise RuntimeError(f"Failed to compute git diff against '{git_base}': {exc}") from exc
-
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
-
-
 def build_changeset_report(
     source: str,
     changes: List[ColumnChange],
@@ -9,9 +9,9 @@ the decision is made — the pull request — with two pieces:
   process exit code, defaulting to *warn* (never block) so a team can adopt the
   check before it enforces anything.
 
-Only the GitHub REST API is used (via ``requests``); the PR context is resolved
-from the standard GitHub Actions environment so the shipped ``action.yml`` needs
-no extra wiring.
+Only the GitHub REST API is used (via :class:`~.github_api.GitHubClient`); the PR
+context is resolved from the standard GitHub Actions environment so the shipped
+``action.yml`` needs no extra wiring.
 """
 
 from __future__ import annotations
@@ -21,9 +21,10 @@ import logging
 import os
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 from typing import Any, Dict, Optional
 
-import requests
+from dbt_column_lineage.lineage.github_api import GitHubClient
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,6 @@ logger = logging.getLogger(__name__)
 COMMENT_MARKER = "<!-- dbt-col-lineage:impact -->"
 
 _DEFAULT_API = "https://api.github.com"
-_TIMEOUT = 30
 
 
 class FailOn(str, Enum):
@@ -184,33 +184,13 @@ def resolve_context(
     return GitHubContext(repo=repo, pr_number=int(number), token=token, api_url=api_url)
 
 
-def _headers(token: str) -> Dict[str, str]:
-    return {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-
-
-def _find_comment_id(
-    session: Any, base_url: str, headers: Dict[str, str], marker: str
-) -> Optional[int]:
+def _find_comment_id(client: GitHubClient, url: str, marker: str) -> Optional[int]:
     """Return the id of the existing marked comment, paging through all comments."""
-    page = 1
-    while True:
-        resp = session.get(
-            base_url, headers=headers, params={"per_page": 100, "page": page}, timeout=_TIMEOUT
-        )
-        resp.raise_for_status()
-        comments = resp.json()
-        if not comments:
-            return None
+    for comments in client.pages(url):
         for comment in comments:
             if marker in (comment.get("body") or ""):
                 return comment.get("id")
-        if len(comments) < 100:
-            return None
-        page += 1
+    return None
 
 
 def post_sticky_comment(
@@ -218,30 +198,29 @@ def post_sticky_comment(
     body: str,
     marker: str = COMMENT_MARKER,
     session: Any = None,
+    cache_path: Optional[Path] = None,
 ) -> str:
     """Find-or-update the sticky impact comment on the PR.
 
     Returns ``"updated"`` if an existing marked comment was edited, else
     ``"created"``. The marker is injected into ``body`` if not already present.
+    ``cache_path`` keeps the comment listing between runs, so an unchanged page is
+    revalidated (``304 Not Modified``) rather than downloaded again.
     """
-    session = session or requests
-    headers = _headers(ctx.token)
+    client = GitHubClient(ctx.token, ctx.api_url, session=session, cache_path=cache_path)
     marked_body = with_marker(body) if marker == COMMENT_MARKER else body
-    issue_comments = f"{ctx.api_url}/repos/{ctx.repo}/issues/{ctx.pr_number}/comments"
+    issue_comments = f"{client.api_url}/repos/{ctx.repo}/issues/{ctx.pr_number}/comments"
 
-    existing_id = _find_comment_id(session, issue_comments, headers, marker)
+    existing_id = _find_comment_id(client, issue_comments, marker)
     if existing_id is not None:
-        resp = session.patch(
-            f"{ctx.api_url}/repos/{ctx.repo}/issues/comments/{existing_id}",
-            headers=headers,
-            json={"body": marked_body},
-            timeout=_TIMEOUT,
+        client.patch(
+            f"{client.api_url}/repos/{ctx.repo}/issues/comments/{existing_id}",
+            {"body": marked_body},
         )
-        resp.raise_for_status()
-        return "updated"
-
-    resp = session.post(
-        issue_comments, headers=headers, json={"body": marked_body}, timeout=_TIMEOUT
-    )
-    resp.raise_for_status()
-    return "created"
+        outcome = "updated"
+    else:
+        client.post(issue_comments, {"body": marked_body})
+        outcome = "created"
+    client.save_cache()
+    logger.debug(f"GitHub requests: {client.stats}")
+    return outcome
@@ -1,11 +1,13 @@
 from typing import Dict, Set, Optional, Any, Union
 from graphviz import Digraph  # type: ignore  # missing stubs for graphviz
 from dbt_column_lineage.models.schema import Column, ColumnLineage
-from dbt_column_lineage.artifacts.registry import ModelRegistry
+from dbt_column_lineage.artifacts.registry import LineageRegistry
 from dbt_column_lineage.lineage.display.base import LineageStaticDisplay
 
 class DotDisplay(LineageStaticDisplay):
-    def __init__(self, output_file: str = "lineage.dot", registry: Optional[ModelRegistry] = None):
+    def __init__(
+        self, output_file: str = "lineage.dot", registry: Optional[LineageRegistry] = None
+    ):
         self.dot = Digraph(comment='Column Lineage')
         self.dot.attr(rankdir='LR')
         self.dot.attr('node', fontname='Helvetica')
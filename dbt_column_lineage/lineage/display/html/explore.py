@@ -1,4 +1,4 @@
-from typing import Dict, Union, Set, List, Any, Optional, Mapping, TYPE_CHECKING
+from typing import AbstractSet, Dict, Union, Set, List, Any, Optional, Mapping, TYPE_CHECKING
 from pydantic import BaseModel, Field
 from fastapi import FastAPI, Request
 from fastapi.templating import Jinja2Templates
@@ -7,9 +7,11 @@ from fastapi.responses import HTMLResponse
 from pathlib import Path
 import uvicorn
 import logging
-from dbt_column_lineage.models.schema import Column, ColumnLineage, TestNode
+from dbt_column_lineage.models.core import ColumnNode
+from dbt_column_lineage.models.schema import ColumnLineage, TestNode
 
 if TYPE_CHECKING:
+    from dbt_column_lineage.lineage.heatmap import Heatmap
     from dbt_column_lineage.lineage.service import LineageService
 
 logger = logging.getLogger(__name__)
@@ -56,12 +58,16 @@ class GraphData(BaseModel):
 class LineageExplorer:
     """Interactive server for exploring column lineage."""
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 8000):
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 8000, heatmap: Optional["Heatmap"] = None
+    ):
         self.app = FastAPI()
         self.host = host
         self.port = port
         self.data = GraphData()
         self.lineage_service: Optional["LineageService"] = None
+        # Precomputed per-column blast radius counts (see lineage.heatmap), if supplied.
+        self.heatmap = heatmap
         self._start_model: Optional[str] = None
         self._start_column: Optional[str] = None
 
@@ -269,6 +275,21 @@ class LineageExplorer:
             except Exception as e:
                 return {"error": str(e)}
 
+        @self.app.get("/api/heatmap")
+        async def get_heatmap(limit: int = 20) -> Dict[str, Any]:
+            if not self.heatmap:
+                return {"error": "No impact heatmap loaded"}
+            return {"columns": len(self.heatmap.columns), "hottest": self.heatmap.hottest(limit)}
+
+        @self.app.get("/api/heatmap/{model}/{column}")
+        async def get_heatmap_entry(model: str, column: str) -> Dict[str, Any]:
+            if not self.heatmap:
+                return {"error": "No impact heatmap loaded"}
+            counts = self.heatmap.lookup(model, column)
+            if counts is None:
+                return {"error": f"Column '{model}.{column}' not in the impact heatmap"}
+            return {"model": model, "column": column, **counts}
+
         @self.app.get("/api/impact-analysis/{model}/{column}")
         async def get_impact_analysis(model: str, column: str) -> Dict[str, Any]:
             if not self.lineage_service:
@@ -633,7 +654,7 @@ class LineageExplorer:
         """Set the lineage service for the explore server."""
         self.lineage_service = lineage_service
 
-    def _set_column_info(self, column: Column) -> None:
+    def _set_column_info(self, column: ColumnNode) -> None:
         """Set the main column info for display."""
         model_name = column.model_name
 
@@ -813,7 +834,7 @@ class LineageExplorer:
 
     def _add_downstream_edges(
         self,
-        source_columns: Union[List[str], Set[str]],
+        source_columns: AbstractSet[str],
         target_node_id: str,
         edges: List[Dict[str, Any]],
     ) -> None:
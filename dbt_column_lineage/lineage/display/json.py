@@ -1,8 +1,8 @@
-import json
 from typing import Any, Dict, Optional, Set, Union
 
 import click
 
+from dbt_column_lineage.artifacts import json_backend
 from dbt_column_lineage.models.schema import Column, ColumnLineage, Coverage
 from .base import LineageStaticDisplay
 
@@ -94,4 +94,4 @@ class JsonDisplay(LineageStaticDisplay):
         self._result["coverage"] = coverage.model_dump()
 
     def save(self) -> None:
-        click.echo(json.dumps(self._result, indent=2, sort_keys=False))
+        click.echo(json_backend.dumps_pretty(self._result))
@@ -10,7 +10,7 @@ Reviewer-first layout (a reviewer's real question is *"should I worry?"*):
 with per-expression folds (oversized SQL truncated) and low-risk pass-through folded away.
 """
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Fold long dashboard lists so a huge blast radius stays scrollable.
 _MAX_DASHBOARDS_INLINE = 8
@@ -124,6 +124,19 @@ def _confidence_reason_words(confidence: Dict[str, Any]) -> str:
     return ""
 
 
+def _blast_radius_suffix(counts: Optional[Dict[str, int]]) -> str:
+    """` — feeds 3 models · 12 columns` for a changed column's heatmap counts."""
+    if not counts:
+        return ""
+    bits = [
+        _plural(counts.get("affected_models", 0), "model"),
+        _plural(counts.get("affected_columns", 0), "column"),
+    ]
+    if counts.get("affected_exposures"):
+        bits.append(_plural(counts["affected_exposures"], "exposure"))
+    return " — feeds " + " · ".join(bits)
+
+
 def render_changeset_markdown(report: Dict[str, Any]) -> str:
     """Render a changeset impact report (from ``build_changeset_report``) as Markdown."""
     changeset = report.get("changeset", {})
@@ -203,7 +216,16 @@ def render_changeset_markdown(report: Dict[str, Any]) -> str:
         kind_txt = ", ".join(f"{_kind_label(k)}: {v}" for k, v in sorted(by_kind.items()))
     out.append(f"**Changed:** {_plural(total_changes, 'column')} — {kind_txt}")
     if changed_nodes:
-        rows = [f"- `{model}.{column}`" for model, column in changed_nodes]
+        # Project-wide reach of each changed column, when an impact heatmap was supplied.
+        blast_radius = {
+            (c.get("model", "?"), c.get("column", "?")): c["blast_radius"]
+            for c in by_change
+            if c.get("blast_radius")
+        }
+        rows = [
+            f"- `{model}.{column}`" + _blast_radius_suffix(blast_radius.get((model, column)))
+            for model, column in changed_nodes
+        ]
         if len(rows) <= 10:
             out += [""] + rows
         else:
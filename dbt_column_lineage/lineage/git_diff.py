@@ -0,0 +1,157 @@
+"""Git access for the git-diff changeset: one ``git diff`` and one ``git cat-file`` per run.
+
+:class:`GitDiff` lists the files changed on a branch with a single
+``git diff --raw -z <base>...HEAD``, whose output carries the blob id of both sides of
+every file. The merge-base and ``HEAD`` versions of a file are then read by blob id, all
+of them through one ``git cat-file --batch`` process, rather than with a ``git show`` per
+file. Every git call is timed; :meth:`GitDiff.metadata` reports the timings alongside
+what was read.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# The blob id ``git diff --raw`` gives the missing side of an added or deleted file.
+_NULL_BLOB = "0" * 40
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """One file of the diff: its path at ``HEAD`` and the blobs of both versions.
+
+    ``old_blob`` is ``None`` for an added file and ``new_blob`` for a deleted one. A
+    renamed or copied file is listed under its new path, with its old content.
+    """
+
+    path: str
+    status: str
+    old_blob: Optional[str]
+    new_blob: Optional[str]
+
+
+class GitDiff:
+    """The ``.sql`` files changed in ``git diff <git_base>...HEAD`` and their contents.
+
+    The diff runs on first use and blobs are fetched in batches by :meth:`prefetch`;
+    both are cached for the lifetime of the object, so one instance serves every
+    lookup of an invocation.
+    """
+
+    def __init__(self, git_base: str, repo_dir: Optional[str] = None):
+        self.git_base = git_base
+        self.repo_dir = repo_dir
+        self.timings: Dict[str, float] = {"diff": 0.0, "cat_file": 0.0}
+        self._calls = 0
+        self._changes: Optional[List[FileChange]] = None
+        self._blobs: Dict[str, Optional[str]] = {}
+
+    def changes(self) -> List[FileChange]:
+        if self._changes is None:
+            output = self._run(
+                "diff",
+                ["diff", "--raw", "-z", "--no-abbrev", f"{self.git_base}...HEAD", "--", "*.sql"],
+            )
+            self._changes = _parse_raw_diff(output)
+        return self._changes
+
+    def changed_files(self) -> List[str]:
+        return [change.path for change in self.changes()]
+
+    def prefetch(self, blob_ids: Iterable[Optional[str]]) -> None:
+        """Read every blob in ``blob_ids`` not read yet, in one ``git cat-file --batch``."""
+        wanted = sorted({blob for blob in blob_ids if blob and blob not in self._blobs})
+        if not wanted:
+            return
+        try:
+            output = self._run("cat_file", ["cat-file", "--batch"], "\n".join(wanted) + "\n")
+        except RuntimeError as exc:
+            logger.debug(f"git cat-file failed: {exc}")
+            output = b""
+        contents = _parse_batch_output(output)
+        for blob in wanted:
+            self._blobs[blob] = contents.get(blob)
+
+    def blob(self, blob_id: Optional[str]) -> Optional[str]:
+        """A blob's content as text, or ``None`` when there is none or git cannot read it."""
+        if not blob_id:
+            return None
+        self.prefetch([blob_id])
+        return self._blobs[blob_id]
+
+    def metadata(self) -> Dict[str, object]:
+        """What was read from git and how long it took, for the report."""
+        return {
+            "base": self.git_base,
+            "changed_files": len(self._changes or []),
+            "blobs_read": sum(1 for content in self._blobs.values() if content is not None),
+            "git_calls": self._calls,
+            "seconds": {step: round(seconds, 4) for step, seconds in self.timings.items()},
+        }
+
+    def _run(self, step: str, args: List[str], stdin: Optional[str] = None) -> bytes:
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.repo_dir,
+                input=stdin.encode() if stdin is not None else None,
+                capture_output=True,
+                check=True,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError) as exc:
+            raise RuntimeError(
+                f"Failed to compute git diff against '{self.git_base}': {exc}"
+            ) from exc
+        finally:
+            self._calls += 1
+            self.timings[step] += time.perf_counter() - start
+        return result.stdout
+
+
+def _parse_raw_diff(output: bytes) -> List[FileChange]:
+    """Parse ``git diff --raw -z --no-abbrev``.
+
+    Each record is ``:<old mode> <new mode> <old blob> <new blob> <status>`` followed by
+    one NUL-terminated path, or two (source, destination) for a rename or copy.
+    """
+    fields = output.decode("utf-8", errors="surrogateescape").split("\0")
+    changes: List[FileChange] = []
+    i = 0
+    while i < len(fields) and fields[i].startswith(":"):
+        _, _, old_blob, new_blob, status = fields[i][1:].split(" ")
+        paths = 2 if status[0] in "RC" else 1
+        path = fields[i + paths]
+        changes.append(
+            FileChange(
+                path=path,
+                status=status[0],
+                old_blob=None if old_blob == _NULL_BLOB else old_blob,
+                new_blob=None if new_blob == _NULL_BLOB else new_blob,
+            )
+        )
+        i += 1 + paths
+    return changes
+
+
+def _parse_batch_output(output: bytes) -> Dict[str, str]:
+    """Parse ``git cat-file --batch``: ``<id> <type> <size>\\n<content>\\n`` per object,
+    ``<id> missing\\n`` for an unknown one."""
+    contents: Dict[str, str] = {}
+    pos = 0
+    while pos < len(output):
+        end = output.index(b"\n", pos)
+        header = output[pos:end].decode().split(" ")
+        pos = end + 1
+        if len(header) != 3:
+            continue
+        blob_id, _, size = header
+        contents[blob_id] = output[pos : pos + int(size)].decode("utf-8", errors="replace")
+        pos += int(size) + 1
+    return contents
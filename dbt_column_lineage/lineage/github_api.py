@@ -0,0 +1,189 @@
+"""GitHub REST access for the CI comment: one pooled session, retries, ETags, parallel pages.
+
+Finding the sticky comment means listing every comment of the pull request, 100 per
+page; on a busy PR that is many round trips. :class:`GitHubClient` keeps them cheap:
+
+- every request goes through one ``requests.Session``, so connections are kept alive
+  and reused, and transient failures (connection errors, 429 and 5xx responses) are
+  retried with exponential backoff, honouring ``Retry-After``. Creating a comment is
+  only retried when the request never reached GitHub, so it cannot be posted twice;
+- once the first page's ``Link`` header gives the number of the last page, the
+  remaining pages are fetched concurrently;
+- listings are conditional: the ``ETag`` of every page is kept and sent back as
+  ``If-None-Match``, and a ``304 Not Modified`` (which GitHub does not count against
+  the rate limit) is answered from the kept copy. With a ``cache_path`` the copies
+  outlive the process, so the next run on the same PR re-downloads only the pages
+  that changed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+_TIMEOUT = 30
+_PER_PAGE = 100
+# Bump when the layout of the cache file changes.
+_CACHE_VERSION = 1
+_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def _headers(token: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
+
+def _last_page(link: Optional[str]) -> Optional[int]:
+    """The page number of the ``rel="last"`` link of a ``Link`` header, if any."""
+    match = _LAST_PAGE_RE.search(link or "")
+    return int(match.group(1)) if match else None
+
+
+def _session(retries: int, backoff: float, pool_size: int) -> requests.Session:
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # POST is left out: a comment is only re-sent when the connection failed.
+        allowed_methods=frozenset({"GET", "PATCH"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class GitHubClient:
+    """Authenticated JSON requests against one GitHub API, through one session.
+
+    ``session`` replaces the pooled, retrying session the client creates itself; any
+    object with ``requests``-style ``get``/``post``/``patch`` methods will do.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        api_url: str,
+        session: Any = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_workers: int = 4,
+        cache_path: Optional[Path] = None,
+    ):
+        self.api_url = api_url.rstrip("/")
+        self.max_workers = max_workers
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.session = session or _session(retries, backoff, max_workers)
+        # Requests sent, and how many of them GitHub answered with 304 Not Modified.
+        self.stats = {"requests": 0, "not_modified": 0}
+        self._headers = _headers(token)
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, str]:
+        """The JSON body of a GET and its ``Link`` header, revalidated by ``ETag``."""
+        key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        with self._lock:
+            cached = self._cache.get(key)
+        headers = dict(self._headers)
+        if cached is not None:
+            headers["If-None-Match"] = cached["etag"]
+        resp = self.session.get(url, headers=headers, params=params, timeout=_TIMEOUT)
+        response_headers = getattr(resp, "headers", None) or {}
+        with self._lock:
+            self.stats["requests"] += 1
+            if cached is not None and getattr(resp, "status_code", 200) == 304:
+                self.stats["not_modified"] += 1
+                return cached["body"], cached["link"]
+        resp.raise_for_status()
+        body = resp.json()
+        link = response_headers.get("Link") or ""
+        etag = response_headers.get("ETag")
+        if etag:
+            with self._lock:
+                self._cache[key] = {"etag": etag, "body": body, "link": link}
+        return body, link
+
+    def pages(self, url: str) -> Iterator[List[Dict[str, Any]]]:
+        """Every page of a paginated listing, in order.
+
+        Pages after the first are fetched concurrently up to the last one the first
+        page announces, then one at a time while they come back full: a first page
+        answered from the cache may announce a last page that has since grown.
+        """
+        items, link = self.get(url, {"per_page": _PER_PAGE, "page": 1})
+        yield items
+        page = 2
+        last = _last_page(link)
+        if last is not None and last >= page and len(items) == _PER_PAGE:
+            pool = ThreadPoolExecutor(max_workers=min(self.max_workers, last - 1))
+            try:
+                for items in pool.map(
+                    lambda n: self.get(url, {"per_page": _PER_PAGE, "page": n})[0],
+                    range(page, last + 1),
+                ):
+                    yield items
+            finally:
+                # A caller that stops early (the comment is found) drops the pages not
+                # requested yet.
+                pool.shutdown(cancel_futures=True)
+            page = last + 1
+        while len(items) == _PER_PAGE:
+            items, _ = self.get(url, {"per_page": _PER_PAGE, "page": page})
+            if items:
+                yield items
+            page += 1
+
+    def post(self, url: str, payload: Dict[str, Any]) -> Any:
+        return self._send("post", url, payload)
+
+    def patch(self, url: str, payload: Dict[str, Any]) -> Any:
+        return self._send("patch", url, payload)
+
+    def _send(self, method: str, url: str, payload: Dict[str, Any]) -> Any:
+        resp = getattr(self.session, method)(
+            url, headers=self._headers, json=payload, timeout=_TIMEOUT
+        )
+        with self._lock:
+            self.stats["requests"] += 1
+        resp.raise_for_status()
+        return resp.json()
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            document = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable GitHub cache {self.cache_path}: {exc}")
+            return {}
+        if document.get("version") != _CACHE_VERSION:
+            return {}
+        return document.get("responses", {})
+
+    def save_cache(self) -> None:
+        """Write the kept responses to ``cache_path`` (a no-op without one)."""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": _CACHE_VERSION, "responses": self._cache}))
+        os.replace(tmp, self.cache_path)
@@ -0,0 +1,186 @@
+"""Project-wide impact heatmap: the blast radius of every column, computed in one sweep.
+
+:meth:`LineageService.get_column_impact` traverses the downstream lineage of one column.
+Asking it for every column of a project repeats the same traversals over and over: every
+column upstream of a mart re-walks the mart. :func:`build_heatmap` instead visits the
+columns once, downstream models first, and derives each column's reach from the reaches
+of the columns that consume it, which are already known. Reaches are bitmasks (Python
+ints) over columns, models and exposures, so merging a consumer's reach is one ``|``,
+and a mask is dropped as soon as every column that reads it has been visited.
+
+For each column the heatmap keeps the summary counts of its impact report: affected
+models, columns and exposures, critical (derived) columns, and row-set (filter)
+dependents. :class:`Heatmap` writes them to a compact JSON artifact (gzip-compressed when
+the path ends in ``.gz``) that ``impact``, the explorer and the Markdown report read
+instead of traversing.
+
+The counts match ``get_column_impact``'s summary, with one approximation: a downstream
+column with several lineage edges counts as critical only when all of them are
+``derived``, whereas a traversal judges it by the edge it reached it through.
+"""
+
+import gzip
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from dbt_column_lineage.artifacts import json_backend
+from dbt_column_lineage.artifacts.compression import open_artifact
+from dbt_column_lineage.artifacts.provenance import tool_version
+from dbt_column_lineage.artifacts.registry import LineageRegistry, topological_order
+from dbt_column_lineage.models.core import ModelNode
+
+# Bump when the entry layout or the counting rules change.
+_HEATMAP_VERSION = 1
+
+# The order of the counts in each artifact entry; also the keys of a lookup.
+FIELDS = (
+    "affected_models",
+    "affected_columns",
+    "affected_exposures",
+    "critical_count",
+    "filter_count",
+)
+
+
+def build_heatmap(registry: LineageRegistry) -> Dict[str, List[int]]:
+    """``{"model.column": [counts in FIELDS order]}`` for every column of ``registry``."""
+    models: Mapping[str, ModelNode] = registry.get_models()
+    exposures = registry.get_exposures()
+    # Downstream models first, so a column's consumers are visited before it.
+    order = list(reversed(topological_order(dict(models))))
+    model_bits = {name: 1 << i for i, name in enumerate(order)}
+    exposure_bits = {name: 1 << i for i, name in enumerate(sorted(exposures))}
+
+    column_bits: Dict[Tuple[str, str], int] = {}
+    for name in order:
+        for column_name in models[name].columns:
+            column_bits[(name, column_name)] = len(column_bits)
+
+    # "model.column" (lowercased) -> the columns whose lineage reads it, limited to models
+    # the traversal would follow: registry models downstream of the reader's model.
+    consumers: Dict[str, List[Tuple[str, str]]] = {}
+    derived = 0
+    for name in order:
+        for column_name, column in models[name].columns.items():
+            lineage = column.lineage or []
+            if lineage and all(edge.transformation_type == "derived" for edge in lineage):
+                derived |= 1 << column_bits[(name, column_name)]
+            sources = {src.lower() for edge in lineage for src in edge.source_columns}
+            for src in sources:
+                parent = src.rsplit(".", 1)[0]
+                if parent != name and parent in models and name in models[parent].downstream:
+                    consumers.setdefault(src, []).append((name, column_name))
+
+    model_exposures = {
+        name: _mask(exposure_bits, (n for n in models[name].downstream if n in exposures))
+        for name in order
+    }
+    # Reach masks of visited columns still awaited by an upstream reader.
+    pending = {key: 0 for keys in consumers.values() for key in keys}
+    for keys in consumers.values():
+        for key in keys:
+            pending[key] += 1
+    reaches: Dict[Tuple[str, str], Tuple[int, int, int, int]] = {}
+
+    heatmap: Dict[str, List[int]] = {}
+    for name in order:
+        for column_name in models[name].columns:
+            key = (name, column_name)
+            ref = f"{name}.{column_name}".lower()
+            columns_reach = models_reach = exposures_reach = 0
+            filter_reach = 0
+            for filter_model in registry.get_filter_dependents(ref):
+                if filter_model in model_bits:
+                    filter_reach |= model_bits[filter_model]
+                    exposures_reach |= model_exposures[filter_model]
+            for consumer in consumers.get(ref, []):
+                sub = reaches.get(consumer)
+                if sub is not None:
+                    columns_reach |= (1 << column_bits[consumer]) | sub[0]
+                    models_reach |= model_bits[consumer[0]] | sub[1]
+                    filter_reach |= sub[2]
+                    exposures_reach |= model_exposures[consumer[0]] | sub[3]
+                    pending[consumer] -= 1
+                    if not pending[consumer]:
+                        del reaches[consumer]
+            if pending.get(key):
+                reaches[key] = (columns_reach, models_reach, filter_reach, exposures_reach)
+
+            filter_count = (filter_reach & ~models_reach).bit_count()
+            heatmap[f"{name}.{column_name}"] = [
+                (models_reach | filter_reach).bit_count(),
+                columns_reach.bit_count() + filter_count,
+                (exposures_reach | model_exposures[name]).bit_count(),
+                (columns_reach & derived).bit_count(),
+                filter_count,
+            ]
+    return heatmap
+
+
+def _mask(bits: Dict[str, int], names: Iterable[str]) -> int:
+    mask = 0
+    for name in names:
+        mask |= bits[name]
+    return mask
+
+
+class Heatmap:
+    """The per-column blast radius counts of one project, looked up by column."""
+
+    def __init__(self, columns: Dict[str, List[int]], artifacts: Optional[str] = None):
+        self.columns = columns
+        self.artifacts = artifacts
+        # Impact traversals this heatmap made unnecessary (see reaches_nothing).
+        self.skipped = 0
+
+    @classmethod
+    def build(cls, registry: LineageRegistry, artifacts: Optional[str] = None) -> "Heatmap":
+        return cls(build_heatmap(registry), artifacts)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Heatmap":
+        with open_artifact(path) as f:
+            document = json_backend.loads(f.read())
+        header = document.get("header", {})
+        if header.get("version") != _HEATMAP_VERSION or header.get("fields") != list(FIELDS):
+            raise ValueError(f"{path} is not a heatmap this version of the tool can read")
+        return cls(document.get("columns", {}), header.get("artifacts"))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the artifact, gzip-compressed if ``path`` ends in ``.gz``."""
+        path = Path(path)
+        header = {
+            "version": _HEATMAP_VERSION,
+            "tool": tool_version(),
+            "artifacts": self.artifacts,
+            "fields": list(FIELDS),
+        }
+        document = {"header": header, "columns": self.columns}
+        data = json_backend.dumps(document)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(gzip.compress(data, mtime=0) if path.suffix == ".gz" else data)
+        os.replace(tmp, path)
+
+    def matches(self, artifacts: str) -> bool:
+        """Whether the heatmap was built from the artifacts with this digest."""
+        return self.artifacts is not None and self.artifacts == artifacts
+
+    def lookup(self, model: str, column: str) -> Optional[Dict[str, int]]:
+        """The counts for ``model.column``, or ``None`` for a column the heatmap lacks."""
+        entry = self.columns.get(f"{model.lower()}.{column}")
+        return dict(zip(FIELDS, entry)) if entry is not None else None
+
+    def reaches_nothing(self, model: str, column: str) -> bool:
+        """Whether nothing downstream reads ``model.column``; counted in ``skipped``."""
+        entry = self.columns.get(f"{model.lower()}.{column}")
+        if entry is None or any(entry):
+            return False
+        self.skipped += 1
+        return True
+
+    def hottest(self, limit: int = 20) -> List[Dict[str, object]]:
+        """The ``limit`` columns reaching the most downstream columns."""
+        ranked = sorted(self.columns.items(), key=lambda item: (-item[1][1], item[0]))
+        return [{"column": name, **dict(zip(FIELDS, entry))} for name, entry in ranked[:limit]]
@@ -0,0 +1,136 @@
+"""Per-change impacts carried over between ``impact`` runs on the same pull request.
+
+Every push to a PR re-runs ``impact``, yet between two pushes usually only a model or
+two changed. ``--impact-state <file>`` keeps each change's single-column impact (the
+result of :meth:`LineageService.get_column_impact`, the expensive part of the report)
+keyed by what that impact was computed from: the change, and a digest of the changed
+model and every model and exposure downstream of it in the manifest DAG. The next run
+reuses the impact of every change whose key is unchanged and traverses only the rest;
+aggregation, the verdict and the rendering are recomputed from the merged impacts, so the
+report is the same as a full run's.
+
+The file is JSON. It is rewritten after each run with only the entries that run used,
+so it never outgrows one report. A file written by another version of the tool is
+ignored.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from dbt_column_lineage.artifacts import json_backend
+from dbt_column_lineage.artifacts.provenance import tool_version
+from dbt_column_lineage.artifacts.registry import LineageRegistry
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored impact documents or the key derivation change.
+_STATE_VERSION = 1
+
+
+class ConeDigests:
+    """Digests of the downstream cones of one registry's models, memoised per model.
+
+    A model's impact depends on the columns, lineage, predicates and descriptions of the
+    models downstream of it, on the exposures they feed, and (for the confidence block) on
+    which of them failed to parse. All of that is hashed; nothing upstream is.
+    """
+
+    def __init__(self, registry: LineageRegistry):
+        self._models = registry.get_models()
+        self._downstream = registry.get_manifest_downstream()
+        self._parse_failed = registry.get_parse_failed_models()
+        self._exposures = registry.get_exposures()
+        self._node_digests: Dict[str, str] = {}
+        self._cone_digests: Dict[str, str] = {}
+
+    def cone(self, model_name: str) -> str:
+        start = model_name.lower()
+        digest = self._cone_digests.get(start)
+        if digest is None:
+            cone: Set[str] = {start}
+            queue = [start]
+            while queue:
+                for child in self._downstream.get(queue.pop(), set()):
+                    if child not in cone:
+                        cone.add(child)
+                        queue.append(child)
+            # Exposures hang off the models' registry downstream, not the manifest map.
+            for name in list(cone):
+                model = self._models.get(name)
+                if model is not None:
+                    cone.update(n for n in model.downstream if n in self._exposures)
+            hasher = hashlib.sha256()
+            for name in sorted(cone):
+                hasher.update(f"{name}\0{self._node_digest(name)}\n".encode())
+            digest = self._cone_digests[start] = hasher.hexdigest()
+        return digest
+
+    def _node_digest(self, name: str) -> str:
+        digest = self._node_digests.get(name)
+        if digest is None:
+            model = self._models.get(name)
+            if model is not None:
+                document = model.to_api().model_dump_json()
+                document += "\0parse_failed" if name in self._parse_failed else ""
+            elif name in self._exposures:
+                document = self._exposures[name].model_dump_json()
+            else:
+                document = ""
+            digest = self._node_digests[name] = hashlib.sha256(document.encode()).hexdigest()
+        return digest
+
+
+class ImpactState:
+    """The per-change impacts of the previous run, and those of this one as it goes."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.reused = 0
+        self.computed = 0
+        self._header = {"version": _STATE_VERSION, "tool": tool_version()}
+        self._previous: Dict[str, Any] = {}
+        self._current: Dict[str, Any] = {}
+        self._digests: Dict[int, ConeDigests] = {}
+        if self.path.exists():
+            try:
+                document = json_backend.loads(self.path.read_bytes())
+            except ValueError as e:
+                logger.warning(f"Ignoring unreadable impact state {self.path}: {e}")
+                return
+            if document.get("header") == self._header:
+                self._previous = document.get("impacts", {})
+            else:
+                logger.info(f"Ignoring impact state {self.path} from another tool version")
+
+    def key(self, registry: LineageRegistry, model: str, column: str) -> str:
+        """What the impact of ``model.column`` in ``registry`` was computed from."""
+        digests = self._digests.get(id(registry))
+        if digests is None:
+            digests = self._digests[id(registry)] = ConeDigests(registry)
+        return f"{model.lower()}.{column}:{digests.cone(model)}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        impact = self._current.get(key) or self._previous.get(key)
+        if impact is not None:
+            self._current[key] = impact
+            self.reused += 1
+        return impact
+
+    def put(self, key: str, impact: Dict[str, Any]) -> None:
+        self._current[key] = impact
+        self.computed += 1
+
+    def save(self) -> None:
+        """Write this run's entries, replacing the file atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(
+            json_backend.dumps_pretty({"header": self._header, "impacts": self._current})
+        )
+        os.replace(tmp, self.path)
+
+    def summary(self) -> Dict[str, Any]:
+        return {"path": str(self.path), "reused": self.reused, "computed": self.computed}
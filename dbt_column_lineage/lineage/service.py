@@ -3,10 +3,12 @@ from typing import Dict, List, Literal, Set, Optional, Any, Tuple, Union, TYPE_C
 from dataclasses import dataclass, field
 import logging
 
-from dbt_column_lineage.artifacts.registry import ModelRegistry
+from dbt_column_lineage.artifacts.registry import LineageRegistry, ModelRegistry
 
 if TYPE_CHECKING:
     from dbt_column_lineage.lineage.changeset import ColumnChange
+    from dbt_column_lineage.lineage.heatmap import Heatmap
+    from dbt_column_lineage.lineage.impact_state import ImpactState
 from dbt_column_lineage.models.schema import ColumnLineage, Coverage, ImpactConfidence
 from dbt_column_lineage.parser.sql_parser_utils import strip_sql_comments
 
@@ -32,6 +34,15 @@ _MECHANISM_LABELS: Dict[str, str] = {
 }
 
 
+def _normalize_column_name(column_name: str) -> str:
+    """Normalize a column name handed to a traversal by a caller (CLI, explorer, tests).
+
+    Names stored in the registry are already comment-free — the parser strips them once,
+    at parse time — so traversals only normalize their entry argument, never per hop.
+    """
+    return strip_sql_comments(column_name).lower()
+
+
 def _mechanism_breakdown(affected_columns: List[Dict[str, Any]]) -> Dict[str, int]:
     """Count affected downstream columns by the mechanism that propagates the change.
 
@@ -47,6 +58,25 @@ def _mechanism_breakdown(affected_columns: List[Dict[str, Any]]) -> Dict[str, in
     return breakdown
 
 
+def _confidence_block(
+    reachable_models: int, resolved_models: int, parse_failed: Set[str], no_column_info: Set[str]
+) -> Dict[str, Any]:
+    """The confidence block of an impact, from the unanalyzable reachable models."""
+    unanalyzable_reachable = parse_failed | no_column_info
+    level: Literal["full", "partial"] = "full" if not unanalyzable_reachable else "partial"
+    cap = _IMPACT_CONFIDENCE_NAME_CAP
+    return ImpactConfidence(
+        reachable_models=reachable_models,
+        resolved_models=resolved_models,
+        unanalyzable_models=len(unanalyzable_reachable),
+        no_column_info=len(no_column_info),
+        parse_failed=len(parse_failed),
+        no_column_info_models=sorted(no_column_info)[:cap],
+        parse_failed_models=sorted(parse_failed)[:cap],
+        level=level,
+    ).model_dump()
+
+
 @dataclass
 class LineageSelector:
     model: str
@@ -120,17 +150,49 @@ class LineageReferences:
 class LineageService:
     """Service for handling lineage operations."""
 
-    def __init__(self, catalog_path: Path, manifest_path: Path, adapter: Optional[str] = None):
-        self.registry = ModelRegistry(
-            str(catalog_path), str(manifest_path), adapter_override=adapter
+    def __init__(
+        self,
+        catalog_path: Path,
+        manifest_path: Path,
+        adapter: Optional[str] = None,
+        dialect_cache: Optional[Path] = None,
+        lineage_store: Optional[Path] = None,
+        reuse_lineage_from: Optional[LineageRegistry] = None,
+    ):
+        self._attach(
+            ModelRegistry(
+                str(catalog_path),
+                str(manifest_path),
+                adapter_override=adapter,
+                dialect_cache_path=str(dialect_cache) if dialect_cache else None,
+                lineage_store_path=str(lineage_store) if lineage_store else None,
+                reuse_lineage_from=(
+                    reuse_lineage_from if isinstance(reuse_lineage_from, ModelRegistry) else None
+                ),
+            )
         )
-        self.registry.load()
-        self._coverage: Coverage = self.registry.get_coverage()
+
+    @classmethod
+    def from_registry(cls, registry: LineageRegistry) -> "LineageService":
+        """A service over an already-constructed registry, e.g. a ``FederatedRegistry``."""
+        service = cls.__new__(cls)
+        service._attach(registry)
+        return service
+
+    def _attach(self, registry: LineageRegistry) -> None:
+        self.registry: LineageRegistry = registry
+        if not registry.is_loaded:
+            registry.load()
+        self._coverage: Coverage = registry.get_coverage()
 
     def get_coverage(self) -> Coverage:
         """Return coverage for the loaded artifacts."""
         return self._coverage
 
+    def downstream_model_count(self, model_name: str) -> int:
+        """How many models are downstream of ``model_name`` in the manifest DAG."""
+        return len(self._dag_reachable_models(model_name))
+
     def _dag_reachable_models(self, model_name: str) -> Set[str]:
         """Transitive downstream models of model_name in the manifest DAG."""
         downstream_map = self.registry.get_manifest_downstream()
@@ -161,6 +223,11 @@ class LineageService:
           a non-table relation such as a semantic view, a python model, or a relation
           dbt has not built/compiled. We deliberately do NOT claim these are "not built".
         """
+        parse_failed, no_column_info = self._unanalyzable_models(reachable)
+        return _confidence_block(len(reachable), resolved_models, parse_failed, no_column_info)
+
+    def _unanalyzable_models(self, reachable: Set[str]) -> Tuple[Set[str], Set[str]]:
+        """The ``reachable`` models without columns to inspect: (parse_failed, no_column_info)."""
         models = self.registry.get_models()
         parse_failed_names = self.registry.get_parse_failed_models()
 
@@ -174,20 +241,7 @@ class LineageService:
                 parse_failed.add(name)
             else:
                 no_column_info.add(name)
-
-        unanalyzable_reachable = parse_failed | no_column_info
-        level: Literal["full", "partial"] = "full" if not unanalyzable_reachable else "partial"
-        cap = _IMPACT_CONFIDENCE_NAME_CAP
-        return ImpactConfidence(
-            reachable_models=len(reachable),
-            resolved_models=resolved_models,
-            unanalyzable_models=len(unanalyzable_reachable),
-            no_column_info=len(no_column_info),
-            parse_failed=len(parse_failed),
-            no_column_info_models=sorted(no_column_info)[:cap],
-            parse_failed_models=sorted(parse_failed)[:cap],
-            level=level,
-        ).model_dump()
+        return parse_failed, no_column_info
 
     def get_model_info(self, selector: LineageSelector) -> Dict[str, Any]:
         """Get model information based on selector."""
@@ -228,12 +282,11 @@ class LineageService:
         """Split a fully qualified name into model and column parts. Returns None if invalid."""
         if "." not in qualified_name:
             return None
-        qualified_name = strip_sql_comments(qualified_name)
         parts = qualified_name.split(".")
         if len(parts) < 2:
             return None
         model_part = ".".join(parts[:-1])
-        column_part = strip_sql_comments(parts[-1]).lower()
+        column_part = parts[-1].lower()
         return (model_part, column_part)
 
     def _process_source_reference(
@@ -295,8 +348,9 @@ class LineageService:
         """Recursively get all upstream column references."""
         if visited is None:
             visited = set()
-
-        column_name = strip_sql_comments(column_name).lower()
+            column_name = _normalize_column_name(column_name)
+        else:
+            column_name = column_name.lower()
         current_ref = f"{model_name}.{column_name}"
         if current_ref in visited:
             return {}
@@ -326,7 +380,7 @@ class LineageService:
                         upstream_refs.direct_refs.add(source)
                         continue
 
-                    split_result = self._split_qualified_name(strip_sql_comments(source))
+                    split_result = self._split_qualified_name(source)
                     if split_result is None:
                         continue
                     src_model, src_column = split_result
@@ -344,7 +398,7 @@ class LineageService:
         self, model_name: str, column_name: str
     ) -> Dict[str, Union[Dict[str, ColumnLineage], Set[str]]]:
         """Get only immediate (non-recursive) downstream column references."""
-        column_name = strip_sql_comments(column_name).lower()
+        column_name = _normalize_column_name(column_name)
         current_ref = f"{model_name}.{column_name}"
         downstream_refs = LineageReferences()
         current_model = self.registry.get_model(model_name)
@@ -420,7 +474,7 @@ class LineageService:
 
         Uses breadth-first traversal without shared mutable state to ensure determinism.
         """
-        column_name = strip_sql_comments(column_name).lower()
+        column_name = _normalize_column_name(column_name)
         start_ref = f"{model_name}.{column_name}"
 
         queue = [(model_name, column_name)]
@@ -730,6 +784,44 @@ class LineageService:
             logger.error(f"Error in impact analysis for {model_name}.{column_name}: {e}")
             raise
 
+    @staticmethod
+    def _column_impact(
+        service: "LineageService", change: "ColumnChange", impact_state: Optional["ImpactState"]
+    ) -> Dict[str, Any]:
+        """``service.get_column_impact`` for the change, through ``impact_state`` if given."""
+        registry = getattr(service, "registry", None)
+        if impact_state is None or registry is None:
+            return service.get_column_impact(change.model, change.column)
+        key = impact_state.key(registry, change.model, change.column)
+        impact = impact_state.get(key)
+        if impact is None:
+            impact = service.get_column_impact(change.model, change.column)
+            impact_state.put(key, impact)
+        return impact
+
+    def _unreached_impact(self, model_name: str) -> Dict[str, Any]:
+        """The impact of a column nothing downstream reads, as the heatmap recorded it.
+
+        Shaped like :meth:`get_column_impact`: the confidence block still reflects the
+        models downstream of ``model_name``, only the column trace is skipped.
+        """
+        reachable = self._dag_reachable_models(model_name)
+        return {
+            "summary": {
+                "affected_models": 0,
+                "affected_columns": 0,
+                "affected_exposures": 0,
+                "critical_count": 0,
+                "low_impact_count": 0,
+                "filter_count": 0,
+                "by_mechanism": _mechanism_breakdown([]),
+            },
+            "affected_models": [],
+            "affected_columns": [],
+            "affected_exposures": [],
+            "confidence": self._impact_confidence(reachable, 0),
+        }
+
     @staticmethod
     def _lookup_column_description(
         registry: Any, model_name: str, column_name: str
@@ -753,6 +845,8 @@ class LineageService:
         self,
         changes: List["ColumnChange"],
         base_service: Optional["LineageService"] = None,
+        impact_state: Optional["ImpactState"] = None,
+        heatmap: Optional["Heatmap"] = None,
     ) -> Dict[str, Any]:
         """Aggregate single-column impact across a changeset into one blast radius.
 
@@ -768,95 +862,195 @@ class LineageService:
         Returns a dict with the same top-level keys as :meth:`get_column_impact`
         (``summary``, ``affected_models``, ``affected_columns``,
         ``affected_exposures``) plus a ``by_change`` breakdown.
+
+        With an ``impact_state``, a change whose model and downstream cone are unchanged
+        since the previous run takes that run's impact instead of being traversed again.
+        With a ``heatmap`` built from the head artifacts, a head-side change whose column
+        reaches nothing downstream is not traversed at all.
+
+        The traversals are :meth:`get_change_impacts` and the deduplication is
+        :func:`aggregate_change_impacts`, so a changeset split across shards (``impact
+        --shard``) aggregates to the same result.
         """
-        # Deferred import: changeset depends on the registry, not the service, so
-        # importing here keeps module load order simple and avoids any cycle.
-        from dbt_column_lineage.lineage.changeset import ChangeKind
+        change_impacts = _change_impacts(self, changes, base_service, impact_state, heatmap)
+        # Guarded so a stub service without a real registry omits confidence rather than erroring.
+        confidence_inputs: Optional[Dict[str, List[str]]] = None
+        if getattr(self, "registry", None) is not None:
+            confidence_inputs = self.get_confidence_inputs(changes)
+        return aggregate_change_impacts(change_impacts, confidence_inputs)
+
+    def get_change_impacts(
+        self,
+        changes: List["ColumnChange"],
+        base_service: Optional["LineageService"] = None,
+        impact_state: Optional["ImpactState"] = None,
+        heatmap: Optional["Heatmap"] = None,
+    ) -> List[Dict[str, Any]]:
+        """Each change's own impact, in changeset order, for :func:`aggregate_change_impacts`.
+
+        An entry holds the change's ``by_change`` row and, when its impact resolved, the
+        ``affected_models``, ``affected_columns`` and ``affected_exposures`` of that
+        impact (``None`` otherwise). Entries are plain JSON documents.
+        """
+        return _change_impacts(self, changes, base_service, impact_state, heatmap)
 
-        affected_models: Dict[str, Dict[str, Any]] = {}
-        affected_columns: Dict[Tuple[str, str], Dict[str, Any]] = {}
-        affected_exposures: Dict[str, Dict[str, Any]] = {}
-        by_change: List[Dict[str, Any]] = []
-        unresolved = 0
+    def get_confidence_inputs(self, changes: List["ColumnChange"]) -> Dict[str, List[str]]:
+        """The models downstream of the changed models, and those of them not analyzable.
 
+        What the confidence block of a changeset impact is built from; the inputs of
+        two parts of a changeset combine by union.
+        """
+        reachable: Set[str] = set()
         for change in changes:
-            service = self
-            if change.kind == ChangeKind.REMOVED and base_service is not None:
-                service = base_service
-
-            # The changed column's own dbt docs — "what X is" — so a reviewer sees the
-            # meaning of what changed, not just its name. Sourced from whichever side
-            # still has the column (base for a removed column, head otherwise).
-            change_description = LineageService._lookup_column_description(
-                getattr(service, "registry", None), change.model, change.column
-            )
+            reachable |= self._dag_reachable_models(change.model)
+        parse_failed, no_column_info = self._unanalyzable_models(reachable)
+        return {
+            "reachable": sorted(reachable),
+            "parse_failed": sorted(parse_failed),
+            "no_column_info": sorted(no_column_info),
+        }
 
-            try:
-                impact = service.get_column_impact(change.model, change.column)
-            except Exception as e:
-                logger.info(
-                    f"Could not resolve impact for {change.model}.{change.column} "
-                    f"({change.kind.value}): {e}"
-                )
-                unresolved += 1
-                by_change.append(
-                    {**change.to_dict(), "resolved": False, "description": change_description}
-                )
-                continue
-
-            for model in impact["affected_models"]:
-                affected_models[model["name"]] = model
-
-            for column in impact["affected_columns"]:
-                key = (column["model"], column["column"])
-                existing = affected_columns.get(key)
-                if existing is None or _SEVERITY_RANK.get(
-                    column["severity"], 0
-                ) > _SEVERITY_RANK.get(existing["severity"], 0):
-                    affected_columns[key] = column
-
-            for exposure in impact["affected_exposures"]:
-                affected_exposures[exposure["name"]] = exposure
-
-            by_change.append(
+
+def _change_impacts(
+    head: LineageService,
+    changes: List["ColumnChange"],
+    base_service: Optional[LineageService],
+    impact_state: Optional["ImpactState"],
+    heatmap: Optional["Heatmap"],
+) -> List[Dict[str, Any]]:
+    """:meth:`LineageService.get_change_impacts` of ``head``.
+
+    A function rather than a method so that ``get_changeset_impact`` also runs on a stub
+    service that only provides ``get_column_impact``.
+    """
+    # Deferred import: changeset depends on the registry, not the service, so
+    # importing here keeps module load order simple and avoids any cycle.
+    from dbt_column_lineage.lineage.changeset import ChangeKind
+
+    change_impacts: List[Dict[str, Any]] = []
+    for change in changes:
+        service = head
+        if change.kind == ChangeKind.REMOVED and base_service is not None:
+            service = base_service
+
+        # The changed column's own dbt docs — "what X is" — so a reviewer sees the
+        # meaning of what changed, not just its name. Sourced from whichever side
+        # still has the column (base for a removed column, head otherwise).
+        change_description = LineageService._lookup_column_description(
+            getattr(service, "registry", None), change.model, change.column
+        )
+
+        try:
+            if (
+                heatmap is not None
+                and service is head
+                and heatmap.reaches_nothing(change.model, change.column)
+            ):
+                impact = head._unreached_impact(change.model)
+            else:
+                impact = LineageService._column_impact(service, change, impact_state)
+        except Exception as e:
+            logger.info(
+                f"Could not resolve impact for {change.model}.{change.column} "
+                f"({change.kind.value}): {e}"
+            )
+            change_impacts.append(
                 {
+                    "by_change": {
+                        **change.to_dict(),
+                        "resolved": False,
+                        "description": change_description,
+                    },
+                    "impact": None,
+                }
+            )
+            continue
+
+        change_impacts.append(
+            {
+                "by_change": {
                     **change.to_dict(),
                     "resolved": True,
                     "summary": impact["summary"],
                     "description": change_description,
-                }
-            )
+                },
+                "impact": {
+                    key: impact[key]
+                    for key in ("affected_models", "affected_columns", "affected_exposures")
+                },
+            }
+        )
+    return change_impacts
 
-        deduped_columns = [affected_columns[key] for key in sorted(affected_columns)]
-        critical_count = sum(1 for c in deduped_columns if c["severity"] == "critical")
-        # Row-set (filter/join) dependents are a distinct band, mirroring the single-column
-        # summary — without this key a filter-only changeset would read as SAFE in the JSON
-        # verdict while the markdown banner (which counts filter columns) says REVIEW.
-        filter_count = sum(1 for c in deduped_columns if c["severity"] == "filter")
-        low_impact_count = len(deduped_columns) - critical_count - filter_count
 
-        # Guarded so a stub service without a real registry omits confidence rather than erroring.
-        confidence: Optional[Dict[str, Any]] = None
-        if getattr(self, "registry", None) is not None:
-            reachable: Set[str] = set()
-            for change in changes:
-                reachable |= self._dag_reachable_models(change.model)
-            confidence = self._impact_confidence(reachable, len(affected_models))
+def aggregate_change_impacts(
+    change_impacts: List[Dict[str, Any]],
+    confidence_inputs: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, Any]:
+    """Combine per-change impacts (from :meth:`LineageService.get_change_impacts`).
 
-        return {
-            "summary": {
-                "affected_models": len(affected_models),
-                "affected_columns": len(deduped_columns),
-                "affected_exposures": len(affected_exposures),
-                "critical_count": critical_count,
-                "low_impact_count": low_impact_count,
-                "filter_count": filter_count,
-                "unresolved_changes": unresolved,
-                "by_mechanism": _mechanism_breakdown(deduped_columns),
-            },
-            "affected_models": [affected_models[name] for name in sorted(affected_models)],
-            "affected_columns": deduped_columns,
-            "affected_exposures": [affected_exposures[name] for name in sorted(affected_exposures)],
-            "by_change": by_change,
-            "confidence": confidence,
-        }
+    Downstream nodes are deduplicated by ``(model, column)``, keeping the highest
+    severity per node (the first change's row on a tie); the result does not depend on
+    how the entries were computed, only on their order.
+    """
+    affected_models: Dict[str, Dict[str, Any]] = {}
+    affected_columns: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    affected_exposures: Dict[str, Dict[str, Any]] = {}
+    by_change: List[Dict[str, Any]] = []
+    unresolved = 0
+
+    for entry in change_impacts:
+        by_change.append(entry["by_change"])
+        impact = entry["impact"]
+        if impact is None:
+            unresolved += 1
+            continue
+
+        for model in impact["affected_models"]:
+            affected_models[model["name"]] = model
+
+        for column in impact["affected_columns"]:
+            key = (column["model"], column["column"])
+            existing = affected_columns.get(key)
+            if existing is None or _SEVERITY_RANK.get(column["severity"], 0) > _SEVERITY_RANK.get(
+                existing["severity"], 0
+            ):
+                affected_columns[key] = column
+
+        for exposure in impact["affected_exposures"]:
+            affected_exposures[exposure["name"]] = exposure
+
+    deduped_columns = [affected_columns[key] for key in sorted(affected_columns)]
+    critical_count = sum(1 for c in deduped_columns if c["severity"] == "critical")
+    # Row-set (filter/join) dependents are a distinct band, mirroring the single-column
+    # summary — without this key a filter-only changeset would read as SAFE in the JSON
+    # verdict while the markdown banner (which counts filter columns) says REVIEW.
+    filter_count = sum(1 for c in deduped_columns if c["severity"] == "filter")
+    low_impact_count = len(deduped_columns) - critical_count - filter_count
+
+    confidence: Optional[Dict[str, Any]] = None
+    if confidence_inputs is not None:
+        confidence = _confidence_block(
+            len(confidence_inputs["reachable"]),
+            len(affected_models),
+            set(confidence_inputs["parse_failed"]),
+            set(confidence_inputs["no_column_info"]),
+        )
+
+    return {
+        "summary": {
+            "affected_models": len(affected_models),
+            "affected_columns": len(deduped_columns),
+            "affected_exposures": len(affected_exposures),
+            "critical_count": critical_count,
+            "low_impact_count": low_impact_count,
+            "filter_count": filter_count,
+            "unresolved_changes": unresolved,
+            "by_mechanism": _mechanism_breakdown(deduped_columns),
+        },
+        "affected_models": [affected_models[name] for name in sorted(affected_models)],
+        "affected_columns": deduped_columns,
+        "affected_exposures": [affected_exposures[name] for name in sorted(affected_exposures)],
+        "by_change": by_change,
+        "confidence": confidence,
+    }
@@ -0,0 +1,168 @@
+"""Splitting one ``impact`` run across CI workers, and merging their reports back.
+
+``impact --shard i/N`` derives the whole changeset, as an unsharded run does, but only
+traverses the impact of the changes that fall in shard ``i``. Changes are assigned by
+model, all changes of a model to the same shard, and models are spread so every shard
+gets about the same work: a model weighs its number of changes times the size of its
+downstream cone in the manifest DAG, and each model, heaviest first, goes to the
+lightest shard so far.
+
+A shard writes a *partial* report: the report of a normal run over the whole changeset
+(the changeset, the provable breaks and the coverage blocks are computed in full, as
+they are lookups rather than traversals) whose impact covers only its own changes, plus
+those changes' individual impacts and the inputs of the confidence block.
+``merge`` (:func:`merge_shard_reports`) aggregates the individual impacts of all
+shards in changeset order, with the same function an unsharded run uses, and decides
+the verdict again; the result is the report the unsharded run would have produced.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from dbt_column_lineage.lineage.changeset import ColumnChange
+from dbt_column_lineage.lineage.service import aggregate_change_impacts
+from dbt_column_lineage.lineage.verdict import decide_verdict
+from dbt_column_lineage.models.schema import BreakFinding
+
+# Keys a shard adds to its report; a merged report has none of them.
+_SHARD_KEYS = ("shard", "change_impacts", "confidence_inputs")
+
+# What each shard's own git process did (``changeset.git`` of a ``--git-base`` run): it
+# differs from shard to shard, so it is summed rather than required to agree.
+_GIT_WORK_KEYS = ("blobs_read", "git_calls", "seconds")
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """``"i/N"`` as ``(i, N)``, with shards numbered from 1."""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}': expected i/N, e.g. 2/4")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}': i must be between 1 and N")
+    return index, count
+
+
+def shard_positions(
+    changes: Sequence[ColumnChange], cone_size: Callable[[str], int], index: int, count: int
+) -> List[int]:
+    """The positions in ``changes`` of the changes of shard ``index`` of ``count``.
+
+    ``cone_size`` estimates the downstream cone of a model; it is called once per model.
+    The assignment only depends on the changeset and the cone sizes, so every shard of a
+    run computes the same partition.
+    """
+    positions: Dict[str, List[int]] = {}
+    for position, change in enumerate(changes):
+        positions.setdefault(change.model.lower(), []).append(position)
+    weights = {model: len(found) * (1 + cone_size(model)) for model, found in positions.items()}
+
+    loads = [0] * count
+    mine: List[int] = []
+    for model in sorted(weights, key=lambda name: (-weights[name], name)):
+        shard = min(range(count), key=lambda i: (loads[i], i))
+        loads[shard] += weights[model]
+        if shard == index - 1:
+            mine.extend(positions[model])
+    return sorted(mine)
+
+
+def shard_report_fields(
+    index: int,
+    count: int,
+    positions: List[int],
+    change_impacts: List[Dict[str, Any]],
+    confidence_inputs: Optional[Dict[str, List[str]]],
+) -> Dict[str, Any]:
+    """What a shard adds to its report for :func:`merge_shard_reports`."""
+    return {
+        "shard": {"index": index, "count": count, "changes": len(positions)},
+        "change_impacts": [
+            {"position": position, **entry} for position, entry in zip(positions, change_impacts)
+        ],
+        "confidence_inputs": confidence_inputs,
+    }
+
+
+def _run_invariant(report: Mapping[str, Any], key: str) -> Any:
+    """``report[key]`` without the parts that legitimately differ between shards."""
+    value = report.get(key)
+    if key == "changeset" and isinstance(value, Mapping) and "git" in value:
+        git = {name: v for name, v in value["git"].items() if name not in _GIT_WORK_KEYS}
+        value = {**value, "git": git}
+    return value
+
+
+def _merged_git_block(gits: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """The ``changeset.git`` blocks of every shard, their git work added up."""
+    seconds = {
+        step: round(sum(git["seconds"].get(step, 0.0) for git in gits), 4)
+        for step in gits[0]["seconds"]
+    }
+    return {
+        **gits[0],
+        "blobs_read": sum(git["blobs_read"] for git in gits),
+        "git_calls": sum(git["git_calls"] for git in gits),
+        "seconds": seconds,
+    }
+
+
+def merge_shard_reports(reports: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Combine the partial reports of every shard of one run into the whole report.
+
+    Raises ``ValueError`` unless ``reports`` are exactly the shards ``1..N`` of the same
+    changeset.
+    """
+    if not reports or any("shard" not in report for report in reports):
+        raise ValueError("Every report to merge must come from `impact --shard`")
+    count = reports[0]["shard"]["count"]
+    indexes = sorted(report["shard"]["index"] for report in reports)
+    if any(report["shard"]["count"] != count for report in reports) or indexes != list(
+        range(1, count + 1)
+    ):
+        raise ValueError(f"Expected shards 1..{count} exactly once each, got {indexes}")
+    for key in ("changeset", "provable_breaks"):
+        expected = _run_invariant(reports[0], key)
+        if any(_run_invariant(report, key) != expected for report in reports):
+            raise ValueError(f"Shards disagree on '{key}': they are not from the same run")
+
+    entries = sorted(
+        (entry for report in reports for entry in report["change_impacts"]),
+        key=lambda entry: entry["position"],
+    )
+    total = reports[0]["changeset"]["total_changes"]
+    if [entry["position"] for entry in entries] != list(range(total)):
+        raise ValueError("The shards do not cover every change of the changeset exactly once")
+
+    confidence_inputs: Optional[Dict[str, List[str]]] = None
+    if all(report["confidence_inputs"] is not None for report in reports):
+        confidence_inputs = {
+            key: sorted({name for report in reports for name in report["confidence_inputs"][key]})
+            for key in ("reachable", "parse_failed", "no_column_info")
+        }
+    aggregated = aggregate_change_impacts(
+        [{key: entry[key] for key in ("by_change", "impact")} for entry in entries],
+        confidence_inputs,
+    )
+
+    # The first shard's report fixes the key order; every key keeps its place.
+    merged = {key: value for key, value in reports[0].items() if key not in _SHARD_KEYS}
+    merged.update(aggregated)
+    # Per-run counters add up; the rest of these blocks is the same on every shard.
+    for key, counters in (
+        ("impact_state", ("reused", "computed")),
+        ("heatmap", ("skipped_traversals",)),
+    ):
+        if key in merged:
+            totals = {
+                counter: sum(report[key][counter] for report in reports) for counter in counters
+            }
+            merged[key] = {**merged[key], **totals}
+    if "git" in merged["changeset"]:
+        gits = [report["changeset"]["git"] for report in reports]
+        merged["changeset"] = {**merged["changeset"], "git": _merged_git_block(gits)}
+
+    breaks = [BreakFinding.model_validate(found) for found in merged.get("provable_breaks", [])]
+    summary = merged["summary"]
+    merged["verdict"] = decide_verdict(breaks, summary)
+    summary["provable_break_count"] = len(breaks)
+    return merged
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Set
 
-from dbt_column_lineage.artifacts.registry import ModelRegistry
+from dbt_column_lineage.artifacts.registry import LineageRegistry
 from dbt_column_lineage.lineage.changeset import ChangeKind, ColumnChange
 from dbt_column_lineage.models.schema import BreakFinding, TestNode
 
@@ -24,24 +24,10 @@ from dbt_column_lineage.models.schema import BreakFinding, TestNode
 _COLUMN_GONE_KINDS = (ChangeKind.REMOVED,)
 
 
-def _column_missing_in_head(head: ModelRegistry, model: str, column: str) -> bool:
-    """True when ``model.column`` no longer exists in the head registry.
-
-    This is the guard that keeps a break *provable*: we only flag a test as broken when the
-    column it targets is genuinely absent from head — either the whole model was removed, or
-    the column was dropped/renamed away. If head still exposes the column (e.g. a mis-derived
-    change, or a removal the PR reverted), we do NOT flag it.
-    """
-    head_model = head.get_models().get(model.lower())
-    if head_model is None:
-        return True  # whole model gone → its columns are certainly gone
-    return column.lower() not in {c.lower() for c in head_model.columns}
-
-
 def classify_provable_breaks(
     changes: List[ColumnChange],
-    head_registry: ModelRegistry,
-    base_registry: Optional[ModelRegistry] = None,
+    head_registry: LineageRegistry,
+    base_registry: Optional[LineageRegistry] = None,
 ) -> List[BreakFinding]:
     """Return the dbt tests that a changeset provably breaks (BREAK-TEST).
 
@@ -63,6 +49,7 @@ def classify_provable_breaks(
     """
     source = base_registry or head_registry
     head_test_ids = head_registry.get_test_unique_ids()
+    head_models = head_registry.get_models()
     findings: List[BreakFinding] = []
     # Dedup across the whole changeset: a relationships test whose child column AND
     # referenced parent key are both removed in one PR must count once, not twice.
@@ -86,15 +73,25 @@ def classify_provable_breaks(
             )
         )
 
+    # One pass over the changeset, grouping the column-gone changes by model: a big model
+    # deprecation removes thousands of columns of the same model, and each model's head
+    # state is looked up once rather than per change.
+    gone_by_model: Dict[str, List[ColumnChange]] = {}
+    for change in changes:
+        if change.kind in _COLUMN_GONE_KINDS:
+            gone_by_model.setdefault(change.model, []).append(change)
+
     # A model absent from head entirely takes ALL its tests down with it — including tests on
     # columns we couldn't recover from compiled SQL (incomplete column recovery would
     # otherwise make a dropped model read as SAFE). Handle these once per model.
-    wholly_removed = {
-        c.model
-        for c in changes
-        if c.kind in _COLUMN_GONE_KINDS and head_registry.get_models().get(c.model.lower()) is None
-    }
-    for model in wholly_removed:
+    head_columns: Dict[str, Set[str]] = {}
+    for model in gone_by_model:
+        head_model = head_models.get(model.lower())
+        if head_model is not None:
+            # Lowercased once per model; the guard that keeps a break *provable* is that the
+            # column a test targets is genuinely absent from head.
+            head_columns[model] = {c.lower() for c in head_model.columns}
+            continue
         for test in source.get_model_tests(model):
             attached_here = (test.target_model or "").lower() == model.lower()
             # The column that's gone: the tested column for an attached test, or the parent
@@ -102,18 +99,17 @@ def classify_provable_breaks(
             column = (test.target_column if attached_here else test.referenced_column) or model
             _emit(model, column, ChangeKind.REMOVED.value, test, via_reference=not attached_here)
 
-    for change in changes:
-        if change.kind not in _COLUMN_GONE_KINDS or change.model in wholly_removed:
-            continue
-        if not _column_missing_in_head(head_registry, change.model, change.column):
-            # The column still exists in head — no orphaned test, nothing provable.
-            continue
-
-        for test in source.get_column_tests(change.model, change.column):
-            _emit(change.model, change.column, change.kind.value, test, via_reference=False)
-        # relationships tests whose *referenced* parent key is this removed column.
-        for test in source.get_tests_referencing(change.model, change.column):
-            _emit(change.model, change.column, change.kind.value, test, via_reference=True)
+    for model, columns in head_columns.items():
+        for change in gone_by_model[model]:
+            if change.column.lower() in columns:
+                # The column still exists in head (e.g. a mis-derived change, or a removal
+                # the PR reverted) — no orphaned test, nothing provable.
+                continue
+            for test in source.get_column_tests(model, change.column):
+                _emit(model, change.column, change.kind.value, test, via_reference=False)
+            # relationships tests whose *referenced* parent key is this removed column.
+            for test in source.get_tests_referencing(model, change.column):
+                _emit(model, change.column, change.kind.value, test, via_reference=True)
 
     return findings
 
@@ -0,0 +1,85 @@
+"""Slotted in-memory representations of models and columns, used by the registry.
+
+A registry holds every column of every model, and a large project has hundreds of
+thousands of them. As Pydantic models each column carries a ``__dict__`` plus the
+validator's bookkeeping, several times the size of its actual data. The registry and
+the traversals over it therefore work on these plain slotted dataclasses, which expose
+the same attribute names as :class:`~dbt_column_lineage.models.schema.Model` and
+:class:`~dbt_column_lineage.models.schema.Column`; ``to_api()`` converts one to its
+Pydantic counterpart where it leaves the process (display, JSON).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from dbt_column_lineage.models.schema import Column, ColumnLineage, Model, ResourceType
+
+
+@dataclass(slots=True)
+class ColumnNode:
+    name: str
+    model_name: str
+    description: Optional[str] = None
+    data_type: Optional[str] = None
+    lineage: List[ColumnLineage] = field(default_factory=list)
+    metadata: Optional[Dict[str, Any]] = None
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.model_name}.{self.name}"
+
+    def to_api(self) -> Column:
+        return Column(
+            name=self.name,
+            model_name=self.model_name,
+            description=self.description,
+            data_type=self.data_type,
+            lineage=list(self.lineage),
+            metadata=self.metadata,
+        )
+
+
+@dataclass(slots=True)
+class ModelNode:
+    name: str
+    schema_name: str
+    database: str
+    resource_type: ResourceType
+    columns: Dict[str, ColumnNode] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+    unique_id: Optional[str] = None
+    upstream: Set[str] = field(default_factory=set)
+    downstream: Set[str] = field(default_factory=set)
+    # Upstream columns this model uses only in predicates (WHERE / JOIN / HAVING / QUALIFY).
+    predicate_sources: Set[str] = field(default_factory=set)
+    # Upstream column -> the predicate condition text it appears in.
+    predicate_lineage: Dict[str, str] = field(default_factory=dict)
+    compiled_sql: Optional[str] = None
+    language: Optional[str] = None
+    resource_path: Optional[str] = None
+    source_identifier: Optional[str] = None
+    source_name: Optional[str] = None
+    description: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+
+    def to_api(self) -> Model:
+        return Model(
+            name=self.name,
+            schema=self.schema_name,
+            database=self.database,
+            columns={name: column.to_api() for name, column in self.columns.items()},
+            metadata=self.metadata,
+            unique_id=self.unique_id,
+            upstream=set(self.upstream),
+            downstream=set(self.downstream),
+            predicate_sources=set(self.predicate_sources),
+            predicate_lineage=dict(self.predicate_lineage),
+            compiled_sql=self.compiled_sql,
+            language=self.language,
+            resource_type=self.resource_type,
+            resource_path=self.resource_path,
+            source_identifier=self.source_identifier,
+            source_name=self.source_name,
+            description=self.description,
+            tags=list(self.tags),
+        )
@@ -1,12 +1,70 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Set, Dict, Literal, Any
+import sys
+
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import AbstractSet, FrozenSet, List, Optional, Set, Dict, Literal, Any, Tuple
 
 
 class ColumnLineage(BaseModel):
-    source_columns: Set[str]
+    """One lineage edge: the upstream columns an output column is derived from, and how.
+
+    Immutable and hashable, so edges dedupe through sets/dicts instead of pairwise
+    comparison. A large project holds millions of these, most naming the same few
+    thousand upstream columns: source strings are interned, and the hash and the
+    change-detection :attr:`signature` are computed once and kept in slots rather
+    than in the per-instance ``__dict__``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+    __slots__ = ("_hash", "_signature")
+
+    # Any set-like input is accepted; it is stored as a frozenset of interned strings.
+    source_columns: AbstractSet[str]
     transformation_type: Literal["direct", "renamed", "derived"]
     sql_expression: Optional[str] = None
     description: Optional[str] = None
+    # Hash of the canonicalized AST of ``sql_expression``, set by the parser (see
+    # ``expression_fingerprint``); compared instead of the text. Not part of the API.
+    expression_fingerprint: Optional[str] = Field(default=None, exclude=True)
+
+    @field_validator("source_columns", mode="after")
+    @classmethod
+    def _intern_sources(cls, value: AbstractSet[str]) -> FrozenSet[str]:
+        return frozenset(map(sys.intern, value))
+
+    def __hash__(self) -> int:
+        # Filled lazily rather than at construction: copies and unpickled instances
+        # come back without the slot set and simply recompute it.
+        try:
+            return self._hash  # type: ignore[attr-defined]
+        except AttributeError:
+            value = hash(
+                (
+                    self.transformation_type,
+                    self.sql_expression,
+                    self.description,
+                    self.source_columns,
+                )
+            )
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    @property
+    def signature(self) -> Tuple[str, str, Tuple[str, ...]]:
+        """``(transformation_type, expression, sorted sources)`` — what a derivation
+        change is judged by (the free-text ``description`` is deliberately left out).
+
+        The expression is the :attr:`expression_fingerprint` when the parser computed
+        one, else the ``sql_expression`` text."""
+        try:
+            return self._signature  # type: ignore[attr-defined]
+        except AttributeError:
+            value = (
+                self.transformation_type,
+                self.expression_fingerprint or self.sql_expression or "",
+                tuple(sorted(self.source_columns)),
+            )
+            object.__setattr__(self, "_signature", value)
+            return value
 
 
 class Column(BaseModel):
@@ -92,6 +150,9 @@ class BreakFinding(BaseModel):
         return "BREAK-TEST"
 
 
+ResourceType = Literal["model", "source", "seed", "test", "exposure", "snapshot"]
+
+
 class ModelDependency(BaseModel):
     model_name: str
     depends_on: Set[str]
@@ -114,7 +175,7 @@ class Model(BaseModel):
     predicate_lineage: Dict[str, str] = Field(default_factory=dict)
     compiled_sql: Optional[str] = None
     language: Optional[str] = None
-    resource_type: Literal["model", "source", "seed", "test", "exposure", "snapshot"]
+    resource_type: ResourceType
     resource_path: Optional[str] = None
     source_identifier: Optional[str] = None
     source_name: Optional[str] = None
@@ -1,3 +1,4 @@
 from dbt_column_lineage.parser.sql_parser import SQLColumnParser
+from dbt_column_lineage.parser.dialect_cascade import DialectCascadeParser
 
-__all__ = ["SQLColumnParser"]
+__all__ = ["SQLColumnParser", "DialectCascadeParser"]
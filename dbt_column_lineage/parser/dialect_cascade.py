@@ -0,0 +1,200 @@
+"""Dialect fallback cascade for model SQL, with per-model outcomes cached across runs.
+
+A model that fails to parse under the declared dialect — or a project whose adapter
+sqlglot does not know at all — used to be counted as ``parse_failed`` outright. The
+cascade instead retries the model down a chain of dialects (declared → closest family
+→ generic, see ``adapter_mapping.dialect_fallback_chain``) and keeps the first lineage
+that parses.
+
+Which rung rescued each model is remembered in a small JSON file, so the next run tries
+that dialect first instead of failing through the declared one again. The cache is a
+hint, not a verdict: when the remembered dialect no longer parses the model (its SQL
+changed), the full cascade runs and the entry is refreshed.
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from dbt_column_lineage.models.schema import SQLParseResult
+from dbt_column_lineage.parser.sql_parser import SchemaProvider, SQLColumnParser
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache layout changes; a mismatching file is ignored, not migrated.
+_CACHE_VERSION = 1
+
+# Label used for sqlglot's generic dialect (``None``) in stats and the cache file.
+GENERIC_DIALECT_LABEL = "generic"
+
+
+def _label(dialect: Optional[str]) -> str:
+    return dialect or GENERIC_DIALECT_LABEL
+
+
+@dataclass
+class DialectCascadeStats:
+    """How the cascade fared over one registry load."""
+
+    # Models that needed a fallback rung, by the rung ("postgres", "generic", ...) that
+    # finally parsed them.
+    rescued_by_dialect: Dict[str, int] = field(default_factory=dict)
+    # Models parsed straight away by a dialect remembered from a previous run.
+    cache_hits: int = 0
+    # Wall time spent on attempts after a model's first one failed — the cost of the
+    # cascade itself (zero when nothing ever falls back).
+    cascade_seconds: float = 0.0
+
+    @property
+    def rescued(self) -> int:
+        return sum(self.rescued_by_dialect.values())
+
+
+class DialectOutcomeCache:
+    """Per-model dialect that last parsed successfully, when it was not the declared one.
+
+    Only fallback outcomes are stored: a model the declared dialect handles needs no
+    hint. Entries are scoped to the declared dialect, so switching adapters (or passing
+    ``--adapter``) starts from a clean slate.
+    """
+
+    def __init__(self, path: Optional[Path], declared: Optional[str]):
+        self.path = path
+        self.declared = _label(declared)
+        self._models: Dict[str, str] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable dialect cache {self.path}: {e}")
+            return
+        if not isinstance(data, dict):
+            logger.warning(f"Ignoring dialect cache {self.path}: not a JSON object")
+            return
+        if data.get("version") != _CACHE_VERSION or data.get("declared") != self.declared:
+            return
+        models = data.get("models") or {}
+        if not isinstance(models, dict):
+            logger.warning(f"Ignoring dialect cache {self.path}: 'models' is not an object")
+            return
+        self._models = {str(k): str(v) for k, v in models.items()}
+
+    def get(self, model_name: str) -> Optional[str]:
+        return self._models.get(model_name)
+
+    def remember(self, model_name: str, label: Optional[str]) -> None:
+        """Record ``label`` as the model's working dialect; ``None`` clears the hint."""
+        if label is None or label == self.declared:
+            if self._models.pop(model_name, None) is not None:
+                self._dirty = True
+        elif self._models.get(model_name) != label:
+            self._models[model_name] = label
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        payload = {
+            "version": _CACHE_VERSION,
+            "declared": self.declared,
+            "models": dict(sorted(self._models.items())),
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(payload, f, indent=2)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write dialect cache {self.path}: {e}")
+
+
+class DialectCascadeParser:
+    """Parse model SQL down a dialect fallback chain, remembering what worked per model.
+
+    Drop-in for :class:`SQLColumnParser` where the registry is concerned: the same
+    ``parse_column_lineage`` call (``schema`` included), plus an optional ``model_name``
+    that keys the cache.
+    The last rung's exception propagates when every dialect fails, so callers keep
+    counting the model as ``parse_failed``.
+
+    ``declared`` is the project's dialect; ``chain`` the rungs to try (defaults to the
+    declared dialect then generic). The declared dialect may be absent from ``chain``
+    when sqlglot does not know it — every model parsed is then a rescue.
+    """
+
+    def __init__(
+        self,
+        declared: Optional[str],
+        chain: Optional[List[Optional[str]]] = None,
+        cache_path: Optional[Path] = None,
+        use_compiled_tokenizer: Optional[bool] = None,
+    ):
+        if chain is None:
+            chain = [declared] if declared else []
+        if None not in chain:
+            chain = [*chain, None]
+        self.declared = declared
+        self.chain = chain
+        self._parsers: Dict[str, SQLColumnParser] = {
+            _label(dialect): SQLColumnParser(
+                dialect=dialect, use_compiled_tokenizer=use_compiled_tokenizer
+            )
+            for dialect in chain
+        }
+        self._cache = DialectOutcomeCache(cache_path, declared)
+        self._cache.load()
+        self.stats = DialectCascadeStats()
+
+    def _hint_for(self, model_name: Optional[str]) -> Optional[str]:
+        hint = self._cache.get(model_name) if model_name else None
+        return hint if hint in self._parsers else None
+
+    def parse_column_lineage(
+        self,
+        sql: str,
+        model_name: Optional[str] = None,
+        schema: Optional[SchemaProvider] = None,
+    ) -> SQLParseResult:
+        declared = _label(self.declared)
+        hint = self._hint_for(model_name)
+        order = [_label(dialect) for dialect in self.chain]
+        if hint is not None:
+            order.remove(hint)
+            order.insert(0, hint)
+        last_error: Optional[Exception] = None
+
+        for attempt, label in enumerate(order):
+            started = time.perf_counter()
+            try:
+                result = self._parsers[label].parse_column_lineage(sql, schema=schema)
+            except Exception as e:
+                last_error = e
+                if attempt:
+                    self.stats.cascade_seconds += time.perf_counter() - started
+                continue
+            if attempt:
+                self.stats.cascade_seconds += time.perf_counter() - started
+
+            if attempt == 0 and hint is not None:
+                self.stats.cache_hits += 1
+            elif label != declared:
+                rescued = self.stats.rescued_by_dialect
+                rescued[label] = rescued.get(label, 0) + 1
+            if model_name:
+                self._cache.remember(model_name, label)
+            return result
+
+        assert last_error is not None
+        raise last_error
+
+    def save_cache(self) -> None:
+        """Persist per-model outcomes (a no-op without a cache path or new outcomes)."""
+        self._cache.save()
@@ -0,0 +1,93 @@
+"""Reusable, per-thread sqlglot tokenizer/parser instances keyed by dialect.
+
+``sqlglot.parse_one(sql, dialect=...)`` resolves the dialect and builds a fresh
+``Tokenizer`` and ``Parser`` on every call. Over a project with thousands of models
+that setup is pure overhead: the dialect never changes within a registry load, and
+both objects ``reset()`` themselves at the start of each run. This module keeps one
+tokenizer/parser pair per dialect and reuses it for every model.
+
+sqlglot tokenizers and parsers carry per-run state, so they are not safe to share
+between threads. The pool is therefore thread-local; worker *processes* naturally get
+their own module-level pool.
+
+sqlglot can also tokenize with its optional compiled (Rust) tokenizer, shipped as the
+``sqlglotrs`` package (``pip install "sqlglot[rs]"``). It is used when installed unless
+explicitly disabled (``use_compiled_tokenizer=False`` or sqlglot's own
+``SQLGLOTRS_TOKENIZER=0``); see :func:`compiled_tokenizer_available`.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ParseError
+
+
+@lru_cache(maxsize=None)
+def compiled_tokenizer_available() -> bool:
+    """Whether sqlglot's optional compiled tokenizer (``sqlglotrs``) is importable."""
+    try:
+        import sqlglotrs  # type: ignore # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class DialectParserPool:
+    """A cache of ``(tokenizer, parser)`` pairs, one per ``(dialect, tokenizer choice)`` key.
+
+    Not thread-safe by design — obtain one per thread via :func:`get_parser_pool`.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[Optional[str], Optional[bool]], Tuple[Any, Any]] = {}
+
+    def _entry(
+        self, dialect: Optional[str], use_compiled_tokenizer: Optional[bool]
+    ) -> Tuple[Any, Any]:
+        key = (dialect, use_compiled_tokenizer)
+        entry = self._entries.get(key)
+        if entry is None:
+            resolved = Dialect.get_or_raise(dialect)
+            tokenizer = resolved.tokenizer(use_rs_tokenizer=use_compiled_tokenizer)
+            parser = resolved.parser()
+            entry = (tokenizer, parser)
+            self._entries[key] = entry
+        return entry
+
+    def parse_one(
+        self,
+        sql: str,
+        dialect: Optional[str] = None,
+        use_compiled_tokenizer: Optional[bool] = None,
+    ) -> exp.Expression:
+        """Parse the first statement of ``sql``, mirroring ``sqlglot.parse_one``.
+
+        ``use_compiled_tokenizer=None`` keeps sqlglot's default (compiled when installed);
+        requesting it while ``sqlglotrs`` is missing falls back to the Python tokenizer.
+        """
+        if use_compiled_tokenizer and not compiled_tokenizer_available():
+            use_compiled_tokenizer = False
+        tokenizer, parser = self._entry(dialect, use_compiled_tokenizer)
+        expressions = parser.parse(tokenizer.tokenize(sql), sql)
+        for expression in expressions:
+            if not expression:
+                raise ParseError(f"No expression was parsed from '{sql}'")
+        return expressions[0]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_local = threading.local()
+
+
+def get_parser_pool() -> DialectParserPool:
+    """Return the calling thread's :class:`DialectParserPool`, creating it on first use."""
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = DialectParserPool()
+        _local.pool = pool
+    return pool
@@ -1,20 +1,60 @@
 import re
 import logging
 from dataclasses import dataclass, field
-from sqlglot import parse_one, exp
-from typing import Dict, List, Set, Optional, Any, Callable, Literal, cast
+from sqlglot import exp
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 from dbt_column_lineage.models.schema import ColumnLineage, SQLParseResult
+from dbt_column_lineage.parser.dialect_pool import get_parser_pool
 from dbt_column_lineage.parser.sql_parser_utils import (
     get_table_aliases,
+    expression_fingerprint,
     get_table_context,
     get_all_tables_from_select,
-    get_final_selects,
+    iter_final_selects,
     split_qualified_name,
     strip_sql_comments,
 )
 
 logging.getLogger("sqlglot").setLevel(logging.ERROR)
 
+# Column names of an upstream relation (model, seed, snapshot or source), looked up by
+# its lowercased unqualified name; ``None`` when the relation's columns are unknown.
+# With one, ``SELECT *`` expands to per-column lineage during parsing.
+SchemaProvider = Callable[[str], Optional[Sequence[str]]]
+
+
+def _merge_lineage(
+    columns: Dict[str, List[ColumnLineage]],
+    seen_lineage: Dict[str, Tuple[List[ColumnLineage], Set[ColumnLineage]]],
+    target_col: str,
+    lineage: Iterable[ColumnLineage],
+) -> None:
+    """Add ``lineage`` to ``columns[target_col]``, skipping entries it already holds."""
+    bucket = columns.setdefault(target_col, [])
+    tracked = seen_lineage.get(target_col)
+    if tracked is None or tracked[0] is not bucket:
+        # First sighting, or a star expansion replaced the column's list.
+        tracked = (bucket, set(bucket))
+        seen_lineage[target_col] = tracked
+    seen = tracked[1]
+    for lin in lineage:
+        if lin not in seen:
+            seen.add(lin)
+            bucket.append(lin)
+
 
 @dataclass
 class ParserContext:
@@ -26,12 +66,15 @@ class ParserContext:
     cte_to_model: Optional[Dict[str, str]]
     cte_transformation_types: Dict[str, Dict[str, str]] = field(default_factory=dict)
     cte_sql_expressions: Dict[str, Dict[str, Optional[str]]] = field(default_factory=dict)
+    # The ``expression_fingerprint`` of each entry of ``cte_sql_expressions``, if any.
+    cte_expression_fingerprints: Dict[str, Dict[str, str]] = field(default_factory=dict)
     cte_base_tables: Dict[str, Set[str]] = field(default_factory=dict)
     # Additional per-column sources contributed by non-left UNION branches of a CTE.
     # cte_sources holds a single primary source per column; these are merged in on top
     # so a CTE built from a UNION is not reduced to only its left-most branch.
     cte_extra_sources: Dict[str, Dict[str, Set[str]]] = field(default_factory=dict)
     column_definitions: Optional[Dict[str, Any]] = None
+    schema: Optional[SchemaProvider] = None
 
 
 class CTEHandler:
@@ -106,10 +149,11 @@ class StarExpressionHandler:
 
     def get_cte_transformation_info(
         self, context: ParserContext, cte_name: str, col_name: str
-    ) -> tuple[str, Optional[str]]:
+    ) -> tuple[str, Optional[str], Optional[str]]:
         trans_type = context.cte_transformation_types.get(cte_name, {}).get(col_name, "direct")
         sql_expr = context.cte_sql_expressions.get(cte_name, {}).get(col_name)
-        return trans_type, sql_expr
+        fingerprint = context.cte_expression_fingerprints.get(cte_name, {}).get(col_name)
+        return trans_type, sql_expr, fingerprint
 
     def expand_from_join_tables(
         self,
@@ -125,7 +169,7 @@ class StarExpressionHandler:
                 if len(context.cte_sources[join_table]) > 0:
                     for col_name, col_source in sorted(context.cte_sources[join_table].items()):
                         if col_name.lower() not in excluded_col_names:
-                            trans_type, sql_expr = self.get_cte_transformation_info(
+                            trans_type, sql_expr, fingerprint = self.get_cte_transformation_info(
                                 context, join_table, col_name
                             )
                             columns[col_name.lower()] = [
@@ -135,6 +179,7 @@ class StarExpressionHandler:
                                         Literal["direct", "renamed", "derived"], trans_type
                                     ),
                                     sql_expression=sql_expr,
+                                    expression_fingerprint=fingerprint,
                                 )
                             ]
                 if join_table in context.cte_base_tables:
@@ -145,6 +190,8 @@ class StarExpressionHandler:
                     )
             elif context.cte_to_model and join_table in context.cte_to_model:
                 star_sources.add(context.cte_to_model[join_table])
+            else:
+                star_sources.add(join_table)
 
     def expand_from_cte(
         self,
@@ -158,7 +205,7 @@ class StarExpressionHandler:
             if len(context.cte_sources[source_table]) > 0:
                 for col_name, col_source in sorted(context.cte_sources[source_table].items()):
                     if col_name.lower() not in excluded_col_names:
-                        trans_type, sql_expr = self.get_cte_transformation_info(
+                        trans_type, sql_expr, fingerprint = self.get_cte_transformation_info(
                             context, source_table, col_name
                         )
                         columns[col_name.lower()] = [
@@ -168,6 +215,7 @@ class StarExpressionHandler:
                                     Literal["direct", "renamed", "derived"], trans_type
                                 ),
                                 sql_expression=sql_expr,
+                                expression_fingerprint=fingerprint,
                             )
                         ]
 
@@ -181,6 +229,25 @@ class StarExpressionHandler:
             return True
         return False
 
+    def expand_from_schema(
+        self,
+        tables: Iterable[str],
+        excluded_col_names: Set[str],
+        schema: SchemaProvider,
+    ) -> Iterator[Tuple[str, ColumnLineage]]:
+        """``(column, lineage)`` for every column a star reads from known base relations.
+
+        Relations the schema does not know are skipped; they stay in ``star_sources``.
+        """
+        for table in sorted(tables):
+            for col_name in schema(table) or ():
+                col_name = col_name.lower()
+                if col_name in excluded_col_names:
+                    continue
+                yield col_name, ColumnLineage(
+                    source_columns={f"{table}.{col_name}"}, transformation_type="direct"
+                )
+
 
 class ExpressionAnalyzer:
     def __init__(self, parser: "SQLColumnParser") -> None:
@@ -233,24 +300,43 @@ class ExpressionAnalyzer:
                 source_columns=normalized_source_cols,
                 transformation_type="derived",
                 sql_expression=str(expr),
+                expression_fingerprint=expression_fingerprint(
+                    expr, context.aliases, context.table_context
+                ),
             )
         ]
 
 
 class SQLColumnParser:
-    def __init__(self, dialect: Optional[str] = None):
+    def __init__(
+        self, dialect: Optional[str] = None, use_compiled_tokenizer: Optional[bool] = None
+    ):
         self.dialect = dialect
+        # None: sqlglot's default (its compiled tokenizer when installed). See dialect_pool.
+        self.use_compiled_tokenizer = use_compiled_tokenizer
         self._cte_handler = CTEHandler()
         self._star_handler = StarExpressionHandler()
         self._star_handler._cte_handler = self._cte_handler
         self._expression_analyzer = ExpressionAnalyzer(self)
 
-    def parse_column_lineage(self, sql: str) -> SQLParseResult:
-        parsed = parse_one(sql, dialect=self.dialect)
+    def parse_column_lineage(
+        self, sql: str, schema: Optional[SchemaProvider] = None
+    ) -> SQLParseResult:
+        """Parse a model's compiled SQL into per-column lineage.
+
+        ``schema`` supplies upstream relations' column lists; ``SELECT *`` over a relation
+        it knows expands into one ``direct`` lineage entry per column (honouring
+        ``EXCLUDE``/``EXCEPT``). Relations it does not know are reported in
+        ``star_sources`` only.
+        """
+        # Tokenizer/parser instances are reused per thread and dialect rather than rebuilt
+        # for every model, as a bare ``sqlglot.parse_one`` would.
+        parsed = get_parser_pool().parse_one(sql, self.dialect, self.use_compiled_tokenizer)
         cte_to_model = self._cte_handler.extract_cte_model_mappings_from_parsed(parsed)
 
         cte_transformation_types: Dict[str, Dict[str, str]] = {}
         cte_sql_expressions: Dict[str, Dict[str, Optional[str]]] = {}
+        cte_expression_fingerprints: Dict[str, Dict[str, str]] = {}
         cte_base_tables: Dict[str, Set[str]] = {}
         cte_extra_sources: Dict[str, Dict[str, Set[str]]] = {}
 
@@ -263,38 +349,19 @@ class SQLColumnParser:
             cte_to_model,
             cte_transformation_types,
             cte_sql_expressions,
+            cte_expression_fingerprints,
             cte_base_tables,
             cte_extra_sources,
+            schema,
         )
 
         columns: Dict[str, List[ColumnLineage]] = {}
         star_sources: Set[str] = set()
 
-        final_selects = get_final_selects(parsed)
-        if not final_selects:
-            selects_to_process: List[Any] = list(parsed.find_all(exp.Select))
-        else:
-            selects_to_process = list(final_selects)
-            # `select * from <cte>`: expand the CTE's own SELECT(s). Using
-            # get_final_selects on the CTE body pulls in *every* union branch,
-            # not just the left-most one.
-            if len(final_selects) == 1:
-                final_select = final_selects[0]
-                if len(final_select.expressions) == 1:
-                    expr = final_select.expressions[0]
-                    if self._star_handler.is_star_expression(expr):
-                        from_clause = final_select.find(exp.From)
-                        if from_clause:
-                            table = from_clause.find(exp.Table)
-                            if table:
-                                table_name = str(table.name).lower()
-                                for cte in parsed.find_all(exp.CTE):
-                                    if cte.alias.lower() == table_name:
-                                        cte_selects = get_final_selects(cte.this)
-                                        if cte_selects:
-                                            selects_to_process = cte_selects
-                                        break
-
+        # Union branches stream through one at a time; each output column keeps a hashed
+        # set of the lineage it already holds, so merging N branches stays linear.
+        seen_lineage: Dict[str, Tuple[List[ColumnLineage], Set[ColumnLineage]]] = {}
+        selects_to_process = self._iter_selects_to_process(parsed)
         for select in selects_to_process:
             table_context = get_table_context(select)
 
@@ -312,9 +379,11 @@ class SQLColumnParser:
                 cte_to_model=cte_to_model,
                 cte_transformation_types=cte_transformation_types,
                 cte_sql_expressions=cte_sql_expressions,
+                cte_expression_fingerprints=cte_expression_fingerprints,
                 cte_base_tables=cte_base_tables,
                 cte_extra_sources=cte_extra_sources,
                 column_definitions=column_definitions,
+                schema=schema,
             )
 
             for expr in select.expressions:
@@ -325,42 +394,15 @@ class SQLColumnParser:
                         else []
                     )
                     excluded_col_names = {col.lower() for col in excluded_columns}
-                    source_table = self._star_handler.get_star_source_table(
-                        expr, context.aliases, context.table_context
-                    )
-
-                    all_tables = get_all_tables_from_select(select)
-                    if len(all_tables) > 1 and not isinstance(expr, exp.Column):
-                        self._star_handler.expand_from_join_tables(
-                            select,
-                            all_tables,
-                            excluded_col_names,
-                            context,
-                            columns,
-                            star_sources,
-                        )
-                        continue
-
-                    if self._star_handler.expand_from_cte(
-                        source_table,
-                        excluded_col_names,
-                        context,
-                        columns,
-                        star_sources,
-                    ):
-                        continue
-
-                    if context.cte_to_model and source_table in context.cte_to_model:
-                        base_table = context.cte_to_model[source_table]
-                        star_sources.add(base_table)
-                        continue
-
-                    self._cte_handler.trace_base_tables(
-                        source_table,
-                        context.cte_to_model,
-                        context.cte_sources,
-                        star_sources,
+                    star_tables = self._resolve_star(
+                        expr, select, excluded_col_names, context, columns
                     )
+                    star_sources.update(star_tables)
+                    if schema is not None:
+                        for col_name, lin in self._star_handler.expand_from_schema(
+                            star_tables, excluded_col_names, schema
+                        ):
+                            _merge_lineage(columns, seen_lineage, col_name, [lin])
                     continue
 
                 target_col = expr.alias_or_name.lower()
@@ -370,12 +412,7 @@ class SQLColumnParser:
                 # Merge rather than overwrite: when processing multiple UNION branch
                 # SELECTs, each branch contributes its own sources for the same output
                 # column, so keep every distinct branch's lineage.
-                if target_col in columns:
-                    for lin in lineage:
-                        if lin not in columns[target_col]:
-                            columns[target_col].append(lin)
-                else:
-                    columns[target_col] = list(lineage)
+                _merge_lineage(columns, seen_lineage, target_col, lineage)
 
         predicate_lineage = self._extract_predicate_lineage(
             parsed,
@@ -393,6 +430,97 @@ class SQLColumnParser:
             predicate_lineage=predicate_lineage,
         )
 
+    def _resolve_star(
+        self,
+        expr: Any,
+        select: Any,
+        excluded_col_names: Set[str],
+        context: ParserContext,
+        columns: Dict[str, List[ColumnLineage]],
+    ) -> Set[str]:
+        """Expand a star over CTEs into ``columns``; return the base relations it reads."""
+        star_tables: Set[str] = set()
+        source_table = self._star_handler.get_star_source_table(
+            expr, context.aliases, context.table_context
+        )
+
+        all_tables = get_all_tables_from_select(select)
+        if len(all_tables) > 1 and not isinstance(expr, exp.Column):
+            self._star_handler.expand_from_join_tables(
+                select,
+                all_tables,
+                excluded_col_names,
+                context,
+                columns,
+                star_tables,
+            )
+        elif self._star_handler.expand_from_cte(
+            source_table,
+            excluded_col_names,
+            context,
+            columns,
+            star_tables,
+        ):
+            pass
+        elif context.cte_to_model and source_table in context.cte_to_model:
+            star_tables.add(context.cte_to_model[source_table])
+        else:
+            self._cte_handler.trace_base_tables(
+                source_table,
+                context.cte_to_model,
+                context.cte_sources,
+                star_tables,
+            )
+        return star_tables
+
+    def _iter_selects_to_process(self, parsed: Any) -> Iterator[Any]:
+        """Yield the SELECTs whose projections define the model's output columns.
+
+        Normally the top-level branch SELECT(s) of the statement. Two special cases:
+        a statement with no recognizable final SELECT falls back to every SELECT in the
+        tree, and ``select * from <cte>`` expands the CTE's own branch SELECT(s) —
+        every union branch of the CTE body, not just the left-most one.
+        """
+        branches = iter_final_selects(parsed)
+        first = next(branches, None)
+        if first is None:
+            yield from parsed.find_all(exp.Select)
+            return
+        second = next(branches, None)
+        if second is not None:
+            yield first
+            yield second
+            yield from branches
+            return
+
+        cte_body = self._star_cte_body(parsed, first)
+        if cte_body is not None:
+            cte_branches = iter_final_selects(cte_body)
+            cte_first = next(cte_branches, None)
+            if cte_first is not None:
+                yield cte_first
+                yield from cte_branches
+                return
+        yield first
+
+    def _star_cte_body(self, parsed: Any, final_select: Any) -> Optional[Any]:
+        """The CTE body a lone ``select * from <cte>`` reads, or ``None``."""
+        if len(final_select.expressions) != 1:
+            return None
+        if not self._star_handler.is_star_expression(final_select.expressions[0]):
+            return None
+        from_clause = final_select.find(exp.From)
+        if not from_clause:
+            return None
+        table = from_clause.find(exp.Table)
+        if not table:
+            return None
+        table_name = str(table.name).lower()
+        for cte in parsed.find_all(exp.CTE):
+            if cte.alias.lower() == table_name:
+                return cte.this
+        return None
+
     def _extract_predicate_lineage(
         self,
         parsed: Any,
@@ -493,8 +621,10 @@ class SQLColumnParser:
         cte_to_model: Optional[Dict[str, str]],
         cte_transformation_types: Dict[str, Dict[str, str]],
         cte_sql_expressions: Dict[str, Dict[str, Optional[str]]],
+        cte_expression_fingerprints: Dict[str, Dict[str, str]],
         cte_base_tables: Dict[str, Set[str]],
         cte_extra_sources: Dict[str, Dict[str, Set[str]]],
+        schema: Optional[SchemaProvider] = None,
     ) -> Dict[str, Dict[str, str]]:
         cte_sources: Dict[str, Dict[str, str]] = {}
 
@@ -503,11 +633,12 @@ class SQLColumnParser:
             cte_sources[cte_name] = {}
             cte_transformation_types[cte_name] = {}
             cte_sql_expressions[cte_name] = {}
+            cte_expression_fingerprints[cte_name] = {}
             cte_extra_sources.setdefault(cte_name, {})
 
             # A CTE body may be a UNION: process *every* branch SELECT so all branches'
             # sources are captured, not just the left-most one.
-            for select in get_final_selects(cte.this):
+            for select in iter_final_selects(cte.this):
                 table_context = get_table_context(select)
                 aliases = get_table_aliases(select)
 
@@ -525,9 +656,11 @@ class SQLColumnParser:
                     cte_to_model=cte_to_model,
                     cte_transformation_types=cte_transformation_types,
                     cte_sql_expressions=cte_sql_expressions,
+                    cte_expression_fingerprints=cte_expression_fingerprints,
                     cte_base_tables=cte_base_tables,
                     cte_extra_sources=cte_extra_sources,
                     column_definitions=column_definitions,
+                    schema=schema,
                 )
 
                 for expr in select.expressions:
@@ -559,6 +692,9 @@ class SQLColumnParser:
                         else:
                             if from_table not in cte_sources:
                                 cte_base_tables[cte_name].add(from_table)
+                                self._copy_schema_columns(
+                                    from_table, cte_name, excluded_col_names, context
+                                )
                     else:
                         lineage_list = self._expression_analyzer.analyze(expr, context)
                         if lineage_list:
@@ -634,9 +770,32 @@ class SQLColumnParser:
                         )
                     else:
                         context.cte_sql_expressions[cte_name][src_col_name] = None
+                    fingerprint = context.cte_expression_fingerprints.get(from_table, {}).get(
+                        src_col_name
+                    )
+                    if fingerprint is not None:
+                        context.cte_expression_fingerprints[cte_name][src_col_name] = fingerprint
             if from_table in context.cte_base_tables:
                 context.cte_base_tables[cte_name].update(context.cte_base_tables[from_table])
 
+    def _copy_schema_columns(
+        self,
+        from_table: str,
+        cte_name: str,
+        excluded_col_names: Set[str],
+        context: ParserContext,
+    ) -> None:
+        """Give a CTE's star over a base relation the relation's columns, when known."""
+        if context.schema is None:
+            return
+        for col_name in context.schema(from_table) or ():
+            col_name = col_name.lower()
+            if col_name in excluded_col_names or col_name in context.cte_sources[cte_name]:
+                continue
+            context.cte_sources[cte_name][col_name] = f"{from_table}.{col_name}"
+            context.cte_transformation_types[cte_name][col_name] = "direct"
+            context.cte_sql_expressions[cte_name][col_name] = None
+
     def _store_column_lineage_in_cte(
         self,
         cte_name: str,
@@ -654,6 +813,8 @@ class SQLColumnParser:
                 context.cte_sources[cte_name][col_name] = col_name
         context.cte_transformation_types[cte_name][col_name] = lineage.transformation_type
         context.cte_sql_expressions[cte_name][col_name] = lineage.sql_expression
+        if lineage.expression_fingerprint is not None:
+            context.cte_expression_fingerprints[cte_name][col_name] = lineage.expression_fingerprint
 
     def _resolve_column_source(
         self,
@@ -728,6 +889,9 @@ class SQLColumnParser:
                         source_columns=forward_sources,
                         transformation_type="derived",
                         sql_expression=str(expr),
+                        expression_fingerprint=expression_fingerprint(
+                            expr, context.aliases, context.table_context
+                        ),
                     )
                 ]
         return None
@@ -750,9 +914,11 @@ class SQLColumnParser:
 
         trans_type = "direct"
         sql_expr = None
+        fingerprint = None
         if table in context.cte_sources and col_name in context.cte_sources[table]:
             trans_type = context.cte_transformation_types.get(table, {}).get(col_name, "direct")
             sql_expr = context.cte_sql_expressions.get(table, {}).get(col_name)
+            fingerprint = context.cte_expression_fingerprints.get(table, {}).get(col_name)
         elif is_aliased:
             trans_type = "renamed"
 
@@ -774,6 +940,7 @@ class SQLColumnParser:
                 source_columns=source_columns,
                 transformation_type=cast(Literal["direct", "renamed", "derived"], trans_type),
                 sql_expression=sql_expr,
+                expression_fingerprint=fingerprint,
             )
         ]
 
@@ -1,6 +1,19 @@
+import hashlib
 import re
+from functools import lru_cache
 from sqlglot import exp
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
+
+
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", flags=re.DOTALL)
+_LINE_COMMENT = re.compile(r"--.*?$", flags=re.MULTILINE)
+_WHITESPACE_RUN = re.compile(r"\s+")
+# Anything strip_sql_comments would change: a comment opener, a whitespace run, any
+# whitespace other than a plain space, or whitespace at either end. Column names and
+# qualified sources almost never match, so one search replaces three substitutions.
+_NEEDS_STRIPPING = re.compile(r"--|/\*|\s\s|[^\S ]|^\s|\s$")
+# Identifiers recur across models; whole compiled SQL bodies do not and are not memoized.
+_MEMO_MAX_LENGTH = 256
 
 
 def strip_sql_comments(text: str) -> str:
@@ -9,22 +22,30 @@ def strip_sql_comments(text: str) -> str:
     Removes both /* ... */ and -- style comments.
     Normalizes whitespace (multiple spaces become single space).
     """
-    if not text:
+    if not text or not _NEEDS_STRIPPING.search(text):
         return text
+    if len(text) <= _MEMO_MAX_LENGTH:
+        return _strip_sql_comments_memo(text)
+    return _strip_sql_comments(text)
 
+
+def _strip_sql_comments(text: str) -> str:
     # Remove /* ... */ style comments
-    text = re.sub(r"/\*.*?\*/", "", text, flags=re.DOTALL)
+    text = _BLOCK_COMMENT.sub("", text)
 
     # Remove -- style comments (everything after -- until end of line)
-    text = re.sub(r"--.*?$", "", text, flags=re.MULTILINE)
+    text = _LINE_COMMENT.sub("", text)
 
     # Normalize whitespace (multiple spaces/tabs/newlines become single space)
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RUN.sub(" ", text)
 
     # Clean up any extra whitespace that might be left
     return text.strip()
 
 
+_strip_sql_comments_memo = lru_cache(maxsize=4096)(_strip_sql_comments)
+
+
 def get_table_aliases(parsed: Any) -> Dict[str, str]:
     aliases = {}
     for table in parsed.find_all((exp.Table, exp.From, exp.Join)):
@@ -81,37 +102,91 @@ def get_final_select(parsed: Any) -> Optional[Any]:
     return None
 
 
-def get_final_selects(parsed: Any) -> List[Any]:
-    """Return every top-level branch SELECT to process.
+def iter_final_selects(parsed: Any) -> Iterator[Any]:
+    """Yield every top-level branch SELECT to process, left to right.
 
-    For a ``UNION`` / ``UNION ALL`` (including chained/nested unions), returns the
+    For a ``UNION`` / ``UNION ALL`` (including chained/nested unions), yields the
     SELECT of *every* branch so per-column lineage from all branches can be merged —
     otherwise only the left-most branch is traced and downstream blast radius is
-    under-reported. For a plain query, returns the single final SELECT.
+    under-reported. For a plain query, yields the single final SELECT.
+
+    sqlglot builds a chain of N unions as a left-deep tree N levels tall, so the walk
+    uses an explicit stack rather than recursion: generated models with thousands of
+    branches would otherwise exhaust the interpreter's recursion limit. Branches are
+    produced one at a time so callers can process them without materializing the list.
     """
-    query = parsed
-    # Unwrap outer wrappers (e.g. a Subquery/paren) until we reach a Select or Union,
-    # so a union nested inside a wrapper is still flattened into its branches.
-    while (
-        hasattr(query, "this")
-        and query.this is not None
-        and not isinstance(query, (exp.Select, exp.Union))
-    ):
-        query = query.this
+    stack = [parsed]
+    while stack:
+        query = stack.pop()
+        # Unwrap outer wrappers (e.g. a Subquery/paren) until we reach a Select or Union,
+        # so a union nested inside a wrapper is still flattened into its branches.
+        while (
+            hasattr(query, "this")
+            and query.this is not None
+            and not isinstance(query, (exp.Select, exp.Union))
+        ):
+            query = query.this
+
+        if isinstance(query, exp.Union):
+            # Right pushed first so the left branch is yielded first.
+            stack.append(query.expression)
+            stack.append(query.this)
+        elif isinstance(query, exp.Select):
+            yield query
+        elif isinstance(query, exp.Query) and isinstance(query.this, exp.Select):
+            yield query.this
 
-    if isinstance(query, exp.Union):
-        selects: List[Any] = []
-        for side in (query.this, query.expression):
-            selects.extend(get_final_selects(side))
-        return selects
 
-    if isinstance(query, exp.Select):
-        return [query]
+def get_final_selects(parsed: Any) -> List[Any]:
+    """Return every top-level branch SELECT to process (see :func:`iter_final_selects`)."""
+    return list(iter_final_selects(parsed))
 
-    if isinstance(query, exp.Query):
-        return [query.this] if isinstance(query.this, exp.Select) else []
 
-    return []
+def expression_fingerprint(expr: Any, aliases: Dict[str, str], table_context: str) -> str:
+    """A short hash of ``expr`` that ignores how the expression is written.
+
+    Hashes the AST rather than the text: whitespace and keyword case never reach it, and
+    comments, redundant parentheses, identifier case and quoting are dropped on the way.
+    Columns are keyed by the relation they resolve to (through ``aliases``, or
+    ``table_context`` when unqualified), so renaming a table alias changes nothing.
+    String literals keep their case. Equal fingerprints mean the same computation over
+    the same columns.
+    """
+    parts: List[str] = []
+    stack: List[Any] = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            # A closing marker pushed below.
+            parts.append(node)
+            continue
+        while isinstance(node, exp.Paren):
+            node = node.this
+        if isinstance(node, exp.Column) and not isinstance(node.this, exp.Star):
+            table = node.table
+            table = aliases.get(table, table).lower() if table else table_context
+            parts.append(f"column:{table}.{node.name.lower()}")
+            continue
+        if isinstance(node, (exp.Identifier, exp.Var)):
+            parts.append(f"{node.key}:{node.name.lower()}")
+            continue
+        parts.append(f"{node.key}(")
+        stack.append(")")
+        # Pushed in reverse so arguments are visited in sorted order.
+        for key in sorted(node.args, reverse=True):
+            value = node.args[key]
+            if value is None or value is False or value == []:
+                continue
+            stack.append(")")
+            values = value if isinstance(value, list) else [value]
+            for item in reversed(values):
+                if isinstance(item, exp.Expression):
+                    stack.append(item)
+                else:
+                    text = str(item)
+                    stack.append("=" + (text.lower() if isinstance(node, exp.Anonymous) else text))
+            stack.append(f"{key}=(")
+    return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=8).hexdigest()
 
 
 def split_qualified_name(qualified_name: str) -> tuple[str, str]:
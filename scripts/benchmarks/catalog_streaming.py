@@ -0,0 +1,154 @@
+"""Catalog load time and peak RSS: whole-document ``json.load`` vs. the streaming reader.
+
+Usage::
+
+    python -m scripts.benchmarks.catalog_streaming [--size-mb 1024] [--manifest-share 0.25]
+
+Writes a synthetic ``catalog.json`` of about ``--size-mb`` MiB, entry by entry. Every
+relation carries a ``stats`` block and wide, commented columns, as warehouse catalogs
+do; only ``--manifest-share`` of the relations are listed in the (simulated) manifest.
+Each mode then runs in a fresh interpreter (a forked child would inherit the parent's
+peak RSS) and builds the registry's catalog models:
+
+- ``json.load``: the whole document decoded, then :meth:`CatalogReader.get_models_nodes`;
+- ``streaming``: :meth:`CatalogReader.load` with the manifest's unique_ids as ``keep``.
+
+The baseline holds the full document at once: at the default 1 GiB it needs several GiB
+of RAM.
+"""
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from dbt_column_lineage.artifacts.catalog import CatalogReader
+
+_MODES = ("json.load", "streaming")
+_COLUMNS = 40
+
+
+def _entry(index: int, rng: random.Random) -> Dict[str, Any]:
+    name = f"model_{index}"
+    return {
+        "unique_id": f"model.bench.{name}",
+        "metadata": {
+            "type": "BASE TABLE",
+            "schema": "main",
+            "name": name,
+            "database": "bench",
+            "comment": f"Table {name}, rebuilt nightly by the analytics team.",
+            "owner": "transformer",
+        },
+        "stats": {
+            key: {
+                "id": key,
+                "label": key.replace("_", " ").title(),
+                "value": rng.randrange(1, 10**9),
+                "include": True,
+                "description": f"{key} as reported by the warehouse information schema",
+            }
+            for key in ("row_count", "bytes", "last_modified", "clustering_key", "has_stats")
+        },
+        "columns": {
+            f"col_{j}": {
+                "type": "NUMBER(38,0)" if j % 2 else "VARCHAR(16777216)",
+                "index": j + 1,
+                "name": f"col_{j}",
+                "comment": f"Column {j} of {name}: " + "lorem ipsum " * rng.randrange(2, 12),
+            }
+            for j in range(_COLUMNS)
+        },
+    }
+
+
+def _write_catalog(path: Path, size_mb: int, share: float, seed: int) -> List[str]:
+    """Write the catalog; returns the unique_ids the manifest would list."""
+    rng = random.Random(seed)
+    target = size_mb * 2**20
+    keep: List[str] = []
+    with open(path, "w") as f:
+        f.write('{"metadata": {"dbt_version": "1.7.0"}, "nodes": {')
+        index = 0
+        while f.tell() < target:
+            entry = _entry(index, rng)
+            f.write(("," if index else "") + json.dumps(entry["unique_id"]) + ": ")
+            f.write(json.dumps(entry))
+            if rng.random() < share:
+                keep.append(entry["unique_id"])
+            index += 1
+        f.write('}, "sources": {}, "errors": null}')
+    return keep
+
+
+def _child(mode: str, directory: Path) -> Dict[str, Any]:
+    keep = set(json.loads((directory / "keep.json").read_text()))
+    reader = CatalogReader(str(directory / "catalog.json"))
+    start = time.perf_counter()
+    if mode == "json.load":
+        with open(reader.catalog_path) as f:
+            reader.catalog = json.load(f)
+    else:
+        reader.load(keep=keep)
+    models = reader.get_models_nodes()
+    elapsed = time.perf_counter() - start
+    columns = sum(len(model.columns) for model in models.values())
+    return {
+        "seconds": elapsed,
+        "models": len(models),
+        "columns": columns,
+        "peak": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _run_child(mode: str, directory: Path) -> Dict[str, Any]:
+    command = [
+        sys.executable,
+        "-m",
+        "scripts.benchmarks.catalog_streaming",
+        "--child",
+        mode,
+        "--dir",
+        str(directory),
+    ]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--size-mb", type=int, default=1024)
+    arg_parser.add_argument("--manifest-share", type=float, default=0.25)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    arg_parser.add_argument("--child", choices=_MODES, help=argparse.SUPPRESS)
+    arg_parser.add_argument("--dir", type=Path, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.child, args.dir)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        keep = _write_catalog(
+            directory / "catalog.json", args.size_mb, args.manifest_share, args.seed
+        )
+        (directory / "keep.json").write_text(json.dumps(keep))
+        size = (directory / "catalog.json").stat().st_size / 2**20
+        print(f"catalog {size:,.0f} MiB, {len(keep):,} relations in the manifest")
+        for mode in _MODES:
+            r = _run_child(mode, directory)
+            print(
+                f"  {mode:<9} {r['seconds']:6.2f}s  {r['models']:,} models"
+                f"  {r['columns']:,} columns  peak {r['peak']:7.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
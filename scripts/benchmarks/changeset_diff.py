@@ -0,0 +1,108 @@
+"""Two-manifest changeset build time: full diff of every model vs. the unchanged fast path.
+
+Usage::
+
+    python -m scripts.benchmarks.changeset_diff [--models 6000] [--changed 10] [--runs 3]
+
+Writes a base and a head project (``synthetic.write_project``) that differ in
+``--changed`` models: half get a new expression in their compiled SQL, half a retyped
+catalog column. Both registries are loaded once; then, best of ``--runs``:
+
+- ``full``: every model common to both sides goes through the structural diff and the
+  normalised-SQL comparison (the builder before the fast path, reproduced by disabling
+  it);
+- ``fast``: :meth:`ChangesetBuilder.build`, which skips models whose columns and
+  compiled SQL are identical.
+
+Both must produce the same changeset.
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from dbt_column_lineage.artifacts.registry import ModelRegistry
+from dbt_column_lineage.lineage.changeset import ChangesetBuilder, ColumnChange
+from scripts.benchmarks.synthetic import write_project
+
+
+class _FullDiffBuilder(ChangesetBuilder):
+    def _unchanged(self, model_name, base_model, head_model) -> bool:
+        return False
+
+
+def _edit_head(directory: Path, changed: int, seed: int) -> List[str]:
+    """Change ``changed`` models of the project in ``directory``; returns their names."""
+    manifest_path = directory / "manifest.json"
+    catalog_path = directory / "catalog.json"
+    manifest = json.loads(manifest_path.read_text())
+    catalog = json.loads(catalog_path.read_text())
+    rng = random.Random(seed)
+    targets = rng.sample(sorted(manifest["nodes"]), k=changed)
+    for i, unique_id in enumerate(targets):
+        if i % 2:
+            column = next(iter(catalog["nodes"][unique_id]["columns"].values()))
+            column["type"] = "BIGINT"
+        else:
+            node = manifest["nodes"][unique_id]
+            node["compiled_code"] = node["compiled_code"].replace(" as col_2", " + 1 as col_2")
+            node["compiled_code"] = node["compiled_code"].replace(
+                " as metric_2", " * 2 as metric_2"
+            )
+    manifest_path.write_text(json.dumps(manifest))
+    catalog_path.write_text(json.dumps(catalog))
+    return [unique_id.split(".")[-1] for unique_id in targets]
+
+
+def _load(directory: Path) -> ModelRegistry:
+    registry = ModelRegistry(str(directory / "catalog.json"), str(directory / "manifest.json"))
+    registry.load()
+    return registry
+
+
+def _best(run: Callable[[], List[ColumnChange]], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=6000)
+    arg_parser.add_argument("--changed", type=int, default=10)
+    arg_parser.add_argument("--runs", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir, head_dir = Path(tmp) / "base", Path(tmp) / "head"
+        write_project(base_dir, args.models, seed=args.seed)
+        write_project(head_dir, args.models, seed=args.seed)
+        changed = _edit_head(head_dir, args.changed, args.seed)
+        start = time.perf_counter()
+        base, head = _load(base_dir), _load(head_dir)
+        print(
+            f"{args.models:,} models, {len(changed)} changed;"
+            f" both registries loaded in {time.perf_counter() - start:.1f}s"
+        )
+
+        full_changes = _FullDiffBuilder(base, head).build()
+        fast_changes = ChangesetBuilder(base, head).build()
+        assert fast_changes == full_changes, "fast path changed the changeset"
+        assert {c.model for c in fast_changes} == set(changed)
+
+        full = _best(lambda: _FullDiffBuilder(base, head).build(), args.runs)
+        fast = _best(lambda: ChangesetBuilder(base, head).build(), args.runs)
+        print(f"  full diff  {full * 1e3:8.1f} ms")
+        print(f"  fast path  {fast * 1e3:8.1f} ms  ({len(fast_changes)} column changes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Bytes per column held by the registry's model/column objects (tracemalloc).
+
+Usage::
+
+    python -m scripts.benchmarks.column_memory [--models 6000] [--width 50]
+
+Builds every catalog model of a synthetic project twice from the same parsed
+``catalog.json``: once as the Pydantic :class:`Model`/:class:`Column` the catalog
+reader used to produce, once through :meth:`CatalogReader.get_models_nodes` (slotted
+:class:`ModelNode`/:class:`ColumnNode`). The default 6k models x 50 columns is a
+300k-column project.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+from dbt_column_lineage.artifacts.catalog import CatalogReader
+from dbt_column_lineage.models.schema import Model
+from scripts.benchmarks.synthetic import write_project
+
+
+def _pydantic_models(catalog: Dict[str, Any]) -> Dict[str, Model]:
+    """The catalog reader's previous output shape, kept here only as the baseline."""
+    models = {}
+    for node_id, node in catalog["nodes"].items():
+        metadata = node.get("metadata", {})
+        name = metadata["name"].lower()
+        columns = {
+            col_name.lower(): {
+                "name": col_name.lower(),
+                "model_name": name,
+                "description": col_data.get("description"),
+                "data_type": col_data.get("type"),
+                "lineage": [],
+            }
+            for col_name, col_data in node.get("columns", {}).items()
+        }
+        models[name] = Model(
+            name=name,
+            schema=metadata["schema"],
+            database=metadata["database"],
+            columns=columns,
+            resource_type=node_id.split(".")[0],
+        )
+    return models
+
+
+def _measure(build: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    models = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return models, elapsed, current
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=6000)
+    arg_parser.add_argument("--width", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path, _ = write_project(Path(tmp), args.models, width=args.width)
+        reader = CatalogReader(str(catalog_path))
+        reader.load()
+
+    columns = sum(len(node["columns"]) for node in reader.catalog["nodes"].values())
+    print(f"{args.models:,} models, {columns:,} columns")
+
+    results = {}
+    for label, build in (
+        ("pydantic", lambda: _pydantic_models(reader.catalog)),
+        ("slotted", reader.get_models_nodes),
+    ):
+        models, elapsed, current = _measure(build)
+        assert len(models) == args.models
+        results[label] = current
+        print(
+            f"  {label:<9} build {elapsed:6.2f}s  memory {current / 2**20:8.1f} MiB"
+            f"  {current / columns:6.0f} bytes/column"
+        )
+        del models
+
+    print(f"  {results['pydantic'] / results['slotted']:.2f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
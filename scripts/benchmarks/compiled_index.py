@@ -0,0 +1,140 @@
+"""Compiled-SQL lookup for manifests without embedded ``compiled_code``.
+
+Usage::
+
+    python -m scripts.benchmarks.compiled_index [--models 20000] [--drifted 0.1]
+
+Writes a manifest whose nodes carry no compiled SQL and a ``target/compiled`` tree
+nested like a real project (``<package>/models/<domain>/<layer>/<model>.sql``), where
+``--drifted`` of the models were moved since the manifest was written, so their exact
+path misses and they are recovered by filename. Then, as ``impact`` does for a base and
+a head registry over the same target, two readers fetch every model's SQL:
+
+- ``before``: per model, an ``is_file()`` per candidate path, one serial ``rglob``
+  per reader for the drifted models, and a ``read_text()`` per model (the previous code,
+  reproduced here);
+- ``after``: :meth:`ManifestReader.prefetch_compiled_sql` over the shared scandir index,
+  then ``get_compiled_sql`` per model.
+
+Each variant runs in a fresh interpreter. With ``--cold`` (Linux, root) the page cache
+is dropped before each one, as on a CI runner that just restored the target from cache;
+otherwise both read a warm tree.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from dbt_column_lineage.artifacts.manifest import ManifestReader
+from scripts.benchmarks.synthetic import staging_sql
+
+_VARIANTS = ("before", "after")
+
+
+def _write_target(directory: Path, count: int, drifted: float, seed: int) -> None:
+    rng = random.Random(seed)
+    target = directory / "target"
+    nodes: Dict[str, Dict[str, str]] = {}
+    for i in range(count):
+        name = f"model_{i}"
+        domain, layer = f"domain_{i % 25}", ("staging", "intermediate", "marts")[i % 3]
+        original = f"models/{domain}/{layer}/{name}.sql"
+        on_disk = f"models/{domain}/moved/{name}.sql" if rng.random() < drifted else original
+        path = target / "compiled" / "bench" / on_disk
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(staging_sql(i))
+        nodes[f"model.bench.{name}"] = {
+            "name": name,
+            "unique_id": f"model.bench.{name}",
+            "resource_type": "model",
+            "package_name": "bench",
+            "original_file_path": original,
+        }
+    (target / "manifest.json").write_text(json.dumps({"nodes": nodes}))
+
+
+def _before(reader: ManifestReader, names: List[str]) -> None:
+    assert reader.manifest_path is not None
+    target_dir = reader.manifest_path.parent
+    index: Optional[Dict[str, List[Path]]] = None
+    for name in names:
+        node = reader._find_node(name)
+        assert node is not None
+        path = target_dir / "compiled" / node["package_name"] / node["original_file_path"]
+        found: Optional[Path] = path
+        if not path.is_file():
+            if index is None:
+                index = {}
+                for sql_file in (target_dir / "compiled").rglob("*.sql"):
+                    index.setdefault(sql_file.name, []).append(sql_file)
+            matches = index.get(path.name, [])
+            found = matches[0] if len(matches) == 1 else None
+        if found is not None:
+            found.read_text()
+
+
+def _after(reader: ManifestReader, names: List[str]) -> None:
+    reader.prefetch_compiled_sql(names)
+    for name in names:
+        reader.get_compiled_sql(name)
+
+
+def _child(variant: str, directory: Path) -> float:
+    manifest = directory / "target" / "manifest.json"
+    readers = [ManifestReader(str(manifest)) for _ in ("base", "head")]
+    for reader in readers:
+        reader.load()
+    names = [node["name"] for node in readers[0].manifest["nodes"].values()]
+    run = _before if variant == "before" else _after
+    start = time.perf_counter()
+    for reader in readers:
+        run(reader, names)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=20000)
+    arg_parser.add_argument("--drifted", type=float, default=0.1)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    arg_parser.add_argument("--cold", action="store_true", help="drop the page cache first")
+    arg_parser.add_argument("--child", choices=_VARIANTS, help=argparse.SUPPRESS)
+    arg_parser.add_argument("--dir", type=Path, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.child, args.dir)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        _write_target(directory, args.models, args.drifted, args.seed)
+        print(f"{args.models:,} models, {args.drifted:.0%} drifted, {os.cpu_count()} CPUs")
+        for variant in _VARIANTS:
+            if args.cold:
+                os.sync()
+                Path("/proc/sys/vm/drop_caches").write_text("3\n")
+            command = [
+                sys.executable,
+                "-m",
+                "scripts.benchmarks.compiled_index",
+                "--child",
+                variant,
+                "--dir",
+                str(directory),
+            ]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            seconds = json.loads(output.strip().splitlines()[-1])
+            cache = "cold" if args.cold else "warm"
+            print(f"  {variant:<6} base + head {seconds:6.2f}s ({cache} page cache)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Artifact load time: decompress-to-disk-then-load vs. loading compressed artifacts.
+
+Usage::
+
+    python -m scripts.benchmarks.compressed_artifacts [--models 20000] [--runs 3]
+
+Writes a synthetic project (see ``synthetic.write_project``), compresses both artifacts
+with gzip (and zstd when ``zstandard`` is installed), then for each format times, best
+of ``--runs``:
+
+- ``decompress+load``: what CI did before: write the decompressed JSON next to the
+  archive, then load the plain files;
+- ``direct``: hand the compressed files to the readers, which decode while loading.
+
+"Load" is :meth:`ManifestReader.load` plus :meth:`CatalogReader.load` and
+``get_models_nodes`` -- the artifact-reading part of a registry load, without the SQL
+parsing that follows either way.
+"""
+
+import argparse
+import gzip
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, IO, List, Tuple
+
+from dbt_column_lineage.artifacts.catalog import CatalogReader
+from dbt_column_lineage.artifacts.manifest import ManifestReader
+from scripts.benchmarks.synthetic import write_project
+
+
+def _load(manifest_path: Path, catalog_path: Path) -> None:
+    manifest = ManifestReader(str(manifest_path))
+    manifest.load()
+    catalog = CatalogReader(str(catalog_path))
+    catalog.load(keep=manifest.get_relation_ids())
+    catalog.get_models_nodes()
+
+
+# format -> (open for compressed writing, open for decompressed reading).
+_Codec = Tuple[Callable[[Path], IO[bytes]], Callable[[Path], IO[bytes]]]
+
+
+def _codecs() -> Dict[str, _Codec]:
+    codecs: Dict[str, _Codec] = {
+        "gz": (lambda path: gzip.open(path, "wb"), lambda path: gzip.open(path, "rb")),
+    }
+    try:
+        import zstandard  # type: ignore
+    except ImportError:
+        return codecs
+    codecs["zst"] = (
+        lambda path: zstandard.ZstdCompressor().stream_writer(open(path, "wb")),
+        lambda path: zstandard.ZstdDecompressor().stream_reader(open(path, "rb")),
+    )
+    return codecs
+
+
+def _best(run: Callable[[], None], runs: int) -> float:
+    timings: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=20000)
+    arg_parser.add_argument("--runs", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        catalog_path, manifest_path = write_project(directory / "plain", args.models)
+        plain_mib = (catalog_path.stat().st_size + manifest_path.stat().st_size) / 2**20
+        plain = _best(lambda: _load(manifest_path, catalog_path), args.runs)
+        print(f"{args.models:,} models, {plain_mib:.0f} MiB of JSON; plain load {plain:.2f}s")
+
+        for suffix, (compress, decompress) in _codecs().items():
+            archives = []
+            for path in (manifest_path, catalog_path):
+                archive = directory / f"{path.name}.{suffix}"
+                with open(path, "rb") as src, compress(archive) as dst:
+                    shutil.copyfileobj(src, dst)
+                archives.append(archive)
+            packed_mib = sum(archive.stat().st_size for archive in archives) / 2**20
+
+            def decompress_then_load() -> None:
+                unpacked = []
+                for archive in archives:
+                    target = directory / "unpacked" / archive.stem
+                    target.parent.mkdir(exist_ok=True)
+                    with decompress(archive) as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+                    unpacked.append(target)
+                _load(*unpacked)
+
+            indirect = _best(decompress_then_load, args.runs)
+            direct = _best(lambda: _load(*archives), args.runs)
+            print(
+                f"  {suffix:<3} ({packed_mib:5.1f} MiB)  decompress+load {indirect:6.2f}s"
+                f"  direct {direct:6.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Test-node ingestion and reverse-index construction for a large synthetic manifest.
+
+Usage::
+
+    python -m scripts.benchmarks.dbt_test_ingestion [--models 2000] [--tests 100000]
+
+* per-node: a Pydantic ``TestNode`` per test, model buckets deduped by scanning the
+  bucket (the registry's previous ``_build_test_index``);
+* columnar: ``ManifestReader.get_test_table`` + ``TestIndex``, nodes built on demand.
+
+Both then answer the same lookups — every column of 200 models, as a verdict over a
+large PR would — and must agree.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from dbt_column_lineage.artifacts.dbt_tests import TestIndex
+from dbt_column_lineage.artifacts.manifest import ManifestReader
+from dbt_column_lineage.models.schema import TestNode
+from scripts.benchmarks.synthetic import manifest_with_tests
+
+
+def _per_node(reader: ManifestReader):
+    tests = reader.get_tests()
+    column_tests: Dict[Tuple[str, str], List[TestNode]] = {}
+    model_tests: Dict[str, List[TestNode]] = {}
+    for test in tests:
+        for model in (test.target_model, test.referenced_model):
+            if model is None:
+                continue
+            bucket = model_tests.setdefault(model, [])
+            if all(t.unique_id != test.unique_id for t in bucket):
+                bucket.append(test)
+        if test.target_model is not None and test.target_column is not None:
+            column_tests.setdefault((test.target_model, test.target_column), []).append(test)
+    return column_tests, model_tests
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=2000)
+    arg_parser.add_argument("--tests", type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "manifest.json"
+        path.write_text(json.dumps(manifest_with_tests(args.models, args.tests)))
+        reader = ManifestReader(str(path))
+        reader.load()
+
+    lookups = [(f"model_{m}", f"col_{c}") for m in range(0, args.models, 10) for c in range(12)]
+    print(f"{args.tests} tests over {args.models} models, {len(lookups)} column lookups")
+
+    start = time.perf_counter()
+    column_tests, model_tests = _per_node(reader)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = [
+        ([t.unique_id for t in column_tests.get(key, [])], len(model_tests.get(key[0], [])))
+        for key in lookups
+    ]
+    queried = time.perf_counter() - start
+    print(f"  per-node  build {built * 1000:8.1f} ms  lookups {queried * 1000:7.1f} ms")
+
+    start = time.perf_counter()
+    index = TestIndex(reader.get_test_table())
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = [
+        ([t.unique_id for t in index.column_tests(*key)], len(index.model_tests(key[0])))
+        for key in lookups
+    ]
+    queried = time.perf_counter() - start
+    print(f"  columnar  build {built * 1000:8.1f} ms  lookups {queried * 1000:7.1f} ms")
+    assert actual == expected
+
+
+if __name__ == "__main__":
+    main()
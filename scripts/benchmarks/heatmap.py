@@ -0,0 +1,74 @@
+"""Project-wide blast radius: one impact traversal per column vs. the heatmap sweep.
+
+Usage::
+
+    python -m scripts.benchmarks.heatmap [--models 1000] [--runs 3]
+
+Writes a synthetic project (``synthetic.write_project``), loads it once, then times:
+
+- ``per-column``: :meth:`LineageService.get_column_impact` for every column, keeping its
+  summary counts (what answering "how big is the blast radius of X" for all X costs
+  without the artifact; timed once);
+- ``sweep``: :func:`build_heatmap`, best of ``--runs``;
+- ``lookup``: :meth:`Heatmap.lookup` of every column from the saved artifact.
+
+Both must produce the same counts.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from dbt_column_lineage.lineage.heatmap import FIELDS, Heatmap, build_heatmap
+from dbt_column_lineage.lineage.service import LineageService
+from scripts.benchmarks.synthetic import write_project
+
+
+def _best(run: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=1000)
+    arg_parser.add_argument("--runs", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path, manifest_path = write_project(Path(tmp), args.models, seed=args.seed)
+        service = LineageService(catalog_path, manifest_path)
+        columns = [
+            (name, column)
+            for name, model in service.registry.get_models().items()
+            for column in model.columns
+        ]
+        print(f"{args.models:,} models, {len(columns):,} columns")
+
+        start = time.perf_counter()
+        traversed = {}
+        for name, column in columns:
+            summary = service.get_column_impact(name, column)["summary"]
+            traversed[f"{name}.{column}"] = [summary[field] for field in FIELDS]
+        per_column = time.perf_counter() - start
+        assert build_heatmap(service.registry) == traversed, "sweep changed the counts"
+
+        sweep = _best(lambda: build_heatmap(service.registry), args.runs)
+        path = Path(tmp) / "heatmap.json.gz"
+        Heatmap.build(service.registry).save(path)
+        heat = Heatmap.load(path)
+        lookup = _best(lambda: [heat.lookup(name, column) for name, column in columns], args.runs)
+        print(f"  per-column {per_column * 1e3:10.1f} ms")
+        print(f"  sweep      {sweep * 1e3:10.1f} ms  (artifact {path.stat().st_size:,} bytes)")
+        print(f"  lookup     {lookup * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Profile a hub-column impact query on a synthetic project.
+
+Usage::
+
+    python -m scripts.benchmarks.hub_impact_profile [--models 1000] [--top 15]
+
+Loads a generated project (see ``synthetic.write_project``), then profiles the impact of
+``stg_0.col_0`` — a column every mart joins on — plus the upstream lineage of every mart
+column, the two traversals a PR comment runs. Prints the wall time, the share spent in
+``strip_sql_comments`` and the top functions by cumulative time.
+"""
+
+import argparse
+import cProfile
+import pstats
+import tempfile
+import time
+from pathlib import Path
+
+from dbt_column_lineage.lineage.service import LineageService
+from scripts.benchmarks.synthetic import write_project
+
+
+def _queries(service: LineageService) -> None:
+    service.get_column_impact("stg_0", "col_0")
+    for name, model in service.registry.get_models().items():
+        if name.startswith("mart_"):
+            for column in model.columns:
+                service._get_upstream_lineage(name, column)
+
+
+def _share(stats: pstats.Stats, function_name: str) -> float:
+    total = stats.total_tt  # type: ignore[attr-defined]
+    spent = sum(
+        cumulative
+        for (_, _, name), (_, _, _, cumulative, _) in stats.stats.items()  # type: ignore[attr-defined]
+        if name == function_name
+    )
+    return spent / total if total else 0.0
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=1000)
+    arg_parser.add_argument("--top", type=int, default=15)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path, manifest_path = write_project(Path(tmp), args.models)
+        start = time.perf_counter()
+        service = LineageService(catalog_path, manifest_path)
+        print(f"loaded {args.models} models in {time.perf_counter() - start:.2f}s")
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.runcall(_queries, service)
+    elapsed = time.perf_counter() - start
+
+    stats = pstats.Stats(profiler)
+    print(f"queries: {elapsed:.2f}s wall (profiled)")
+    print(f"strip_sql_comments share: {_share(stats, 'strip_sql_comments'):.1%}")
+    stats.sort_stats("cumulative").print_stats(args.top)
+
+
+if __name__ == "__main__":
+    main()
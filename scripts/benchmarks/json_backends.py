@@ -0,0 +1,89 @@
+"""JSON backend matrix: artifact decoding and report encoding per installed backend.
+
+Usage::
+
+    python -m scripts.benchmarks.json_backends [--sizes 500,5000,20000] [--runs 5]
+
+For each size, builds a synthetic manifest (``synthetic.write_project``, with generic
+tests added from ``synthetic.manifest_with_tests``) and an impact-style report (every
+mart column affected, as the ``--format json`` document lists them), then times, best of
+``--runs``, for every backend in :func:`json_backend.available_backends`:
+
+- ``decode``: ``loads`` of the manifest text, as :meth:`ManifestReader.load` does;
+- ``report``: ``dumps_pretty`` of the report, as ``--format json`` does.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from dbt_column_lineage.artifacts import json_backend
+from scripts.benchmarks.synthetic import manifest_with_tests, write_project
+
+
+def _manifest_text(models: int) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        _, manifest_path = write_project(Path(tmp), models)
+        manifest = json.loads(manifest_path.read_text())
+    tests = manifest_with_tests(models, tests=models * 2)
+    manifest["nodes"].update(
+        (uid, node) for uid, node in tests["nodes"].items() if node["resource_type"] == "test"
+    )
+    return json.dumps(manifest)
+
+
+def _report(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    affected: List[Dict[str, Any]] = []
+    for node in manifest["nodes"].values():
+        if not node.get("name", "").startswith("mart_"):
+            continue
+        for j in range(12):
+            affected.append(
+                {
+                    "model": node["name"],
+                    "column": f"metric_{j}",
+                    "transformation": "derived",
+                    "sql_expression": f"sum(s0.col_{j})",
+                    "path": ["stg_0.col_0", f"{node['name']}.metric_{j}"],
+                }
+            )
+    return {"impact": {"affected_columns": affected, "affected_models": len(affected) // 12}}
+
+
+def _best(run: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--sizes", default="500,5000,20000")
+    arg_parser.add_argument("--runs", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    backends = json_backend.available_backends()
+    print(f"backends: {', '.join(backends)}")
+    for models in (int(size) for size in args.sizes.split(",")):
+        text = _manifest_text(models)
+        report = _report(json.loads(text))
+        report_mib = len(json.dumps(report, indent=2)) / 2**20
+        print(
+            f"{models:,} models: manifest {len(text) / 2**20:.1f} MiB,"
+            f" report {report_mib:.1f} MiB"
+        )
+        for name in backends:
+            backend = json_backend.get_backend(name)
+            decode = _best(lambda: backend.loads(text), args.runs)
+            encode = _best(lambda: backend.dumps_pretty(report), args.runs)
+            print(f"  {name:<8} decode {decode * 1e3:8.1f} ms  report {encode * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Base-side registry load in a two-manifest diff, with and without head's lineage.
+
+Usage::
+
+    python -m scripts.benchmarks.lazy_base [--models 2000] [--changed 10]
+
+Writes a base and a head project (``synthetic.write_project``) that differ in
+``--changed`` models, as ``changeset_diff`` does, loads the head registry, then times
+loading the base registry:
+
+- ``parse all``: every base model parsed (the ``impact`` command before);
+- ``reuse head``: ``reuse_lineage_from=head``, so only the changed models and their
+  downstream cone are parsed.
+
+Both must produce the same models.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from dbt_column_lineage.artifacts.registry import ModelRegistry
+from scripts.benchmarks.changeset_diff import _edit_head
+from scripts.benchmarks.synthetic import write_project
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=2000)
+    arg_parser.add_argument("--changed", type=int, default=10)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir, head_dir = Path(tmp) / "base", Path(tmp) / "head"
+        write_project(base_dir, args.models, seed=args.seed)
+        write_project(head_dir, args.models, seed=args.seed)
+        _edit_head(head_dir, args.changed, args.seed)
+        paths = (str(base_dir / "catalog.json"), str(base_dir / "manifest.json"))
+        head = ModelRegistry(str(head_dir / "catalog.json"), str(head_dir / "manifest.json"))
+        head.load()
+
+        start = time.perf_counter()
+        full = ModelRegistry(*paths)
+        full.load()
+        parse_all = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lazy = ModelRegistry(*paths, reuse_lineage_from=head)
+        lazy.load()
+        reuse = time.perf_counter() - start
+
+        assert lazy.get_models() == full.get_models(), "reused lineage differs"
+        print(f"{args.models:,} models, {args.changed} changed in head")
+        print(f"  parse all   {parse_all:6.2f}s")
+        print(f"  reuse head  {reuse:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
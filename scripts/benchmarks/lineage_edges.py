@@ -0,0 +1,132 @@
+"""Memory and dedup cost of lineage edges on a synthetic project (1M edges by default).
+
+Usage::
+
+    python -m scripts.benchmarks.lineage_edges [--edges 1000000] [--upstream 20000]
+
+Compares :class:`ColumnLineage` (frozen, interned sources, cached hash) against the
+previous mutable shape — a plain ``Set[str]`` of freshly built source strings, deduped
+by scanning each column's lineage list. Source strings are rebuilt per edge, as the
+parser does, so interning shows up in the memory column.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Callable, List, Literal, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from dbt_column_lineage.models.schema import ColumnLineage
+
+
+class _MutableLineage(BaseModel):
+    """The pre-frozen lineage model, kept here only as the benchmark baseline."""
+
+    source_columns: Set[str]
+    transformation_type: Literal["direct", "renamed", "derived"]
+    sql_expression: Optional[str] = None
+    description: Optional[str] = None
+
+
+# (model, column, source columns, transformation type)
+_Spec = Tuple[int, int, List[Tuple[int, int]], str]
+
+
+def _edge_specs(edges: int, upstream: int, seed: int) -> List[_Spec]:
+    rng = random.Random(seed)
+    specs = []
+    for i in range(edges):
+        # ~16 edges per output column, a third of them repeats (union branches, star
+        # re-application) — the duplicates dedup has to catch.
+        column = i // 16
+        if specs and rng.random() < 0.33:
+            specs.append(specs[-1][:1] + (column,) + specs[-1][2:])
+            continue
+        sources = [
+            (rng.randrange(upstream // 20), rng.randrange(20))
+            for _ in range(rng.choice((1, 1, 2, 3)))
+        ]
+        specs.append((column // 40, column, sources, rng.choice(("direct", "renamed", "derived"))))
+    return specs
+
+
+def _build(specs: List[_Spec], cls: Callable) -> list:
+    return [
+        cls(
+            source_columns={f"model_{m}.col_{c}" for m, c in sources},
+            transformation_type=kind,
+        )
+        for _, _, sources, kind in specs
+    ]
+
+
+def _measure(specs: List[_Spec], cls: Callable) -> Tuple[list, float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    built = _build(specs, cls)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, elapsed, current
+
+
+def _dedup_linear(specs: List[_Spec], edges: list) -> int:
+    kept = 0
+    buckets: dict = {}
+    for spec, edge in zip(specs, edges):
+        bucket = buckets.setdefault(spec[1], [])
+        if not any(existing == edge for existing in bucket):
+            bucket.append(edge)
+            kept += 1
+    return kept
+
+
+def _dedup_hashed(specs: List[_Spec], edges: list) -> int:
+    kept = 0
+    buckets: dict = {}
+    for spec, edge in zip(specs, edges):
+        bucket = buckets.setdefault(spec[1], set())
+        if edge not in bucket:
+            bucket.add(edge)
+            kept += 1
+    return kept
+
+
+def _timed(fn: Callable[[], int]) -> Tuple[int, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--edges", type=int, default=1_000_000)
+    arg_parser.add_argument("--upstream", type=int, default=20_000)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    args = arg_parser.parse_args()
+
+    specs = _edge_specs(args.edges, args.upstream, args.seed)
+    print(f"{args.edges:,} edges over {args.upstream:,} upstream columns")
+
+    mutable, build_old, mem_old = _measure(specs, _MutableLineage)
+    print(f"  mutable   build {build_old:6.2f}s  memory {mem_old / 2**20:8.1f} MiB")
+    kept_old, dedup_old = _timed(lambda edges=mutable: _dedup_linear(specs, edges))
+    del mutable
+
+    frozen, build_new, mem_new = _measure(specs, ColumnLineage)
+    print(f"  frozen    build {build_new:6.2f}s  memory {mem_new / 2**20:8.1f} MiB")
+    kept_new, dedup_new = _timed(lambda: _dedup_hashed(specs, frozen))
+    _, dedup_global = _timed(lambda: len(set(frozen)))
+
+    assert kept_old == kept_new, (kept_old, kept_new)
+    print(
+        f"  per-column dedup ({kept_new:,} kept): linear {dedup_old:.2f}s, hashed {dedup_new:.2f}s"
+    )
+    print(f"  project-wide set() of all edges: {dedup_global:.2f}s")
+    print(f"  memory {mem_old / mem_new:.2f}x smaller, dedup {dedup_old / dedup_new:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
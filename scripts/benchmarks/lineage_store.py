@@ -0,0 +1,119 @@
+"""Query latency and RSS: in-memory registry vs. the on-disk lineage store.
+
+Usage::
+
+    python -m scripts.benchmarks.lineage_store [--models 2000] [--queries 200]
+
+Writes a synthetic project (see ``synthetic.write_project``), then runs each mode in a
+fresh interpreter (a forked child would inherit the parent's peak RSS):
+
+- ``memory``: a plain load, every model held in the process;
+- ``build``: a first load with a store configured: parse everything, write the store;
+- ``store``: a later load that reuses the store, models read from disk on demand.
+
+Each child loads a :class:`LineageService`, then times upstream lineage lookups for
+random mart columns and the impact of the ``stg_0.col_0`` hub column. It reports load
+time, per-lookup latency, RSS once loaded and peak RSS.
+"""
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dbt_column_lineage.lineage.service import LineageService
+from scripts.benchmarks.synthetic import write_project
+
+_MODES = ("memory", "build", "store")
+
+
+def _rss_mib() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * resource.getpagesize() / 2**20
+
+
+def _child(directory: Path, store: Optional[Path], queries: int, seed: int) -> Dict[str, Any]:
+    start = time.perf_counter()
+    service = LineageService(
+        directory / "catalog.json", directory / "manifest.json", lineage_store=store
+    )
+    load = time.perf_counter() - start
+    loaded_rss = _rss_mib()
+
+    rng = random.Random(seed)
+    marts = [name for name in service.registry.get_models() if name.startswith("mart_")]
+    start = time.perf_counter()
+    for _ in range(queries):
+        model = rng.choice(marts)
+        column = rng.choice(list(service.registry.get_model(model).columns))
+        service._get_upstream_lineage(model, column)
+    upstream = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    service.get_column_impact("stg_0", "col_0")
+    impact = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {
+        "load": load,
+        "upstream": upstream,
+        "impact": impact,
+        "loaded_rss": loaded_rss,
+        "peak": peak,
+    }
+
+
+def _run_child(mode: str, directory: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    command = [
+        sys.executable,
+        "-m",
+        "scripts.benchmarks.lineage_store",
+        "--child",
+        mode,
+        "--dir",
+        str(directory),
+        "--queries",
+        str(args.queries),
+    ]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=2000)
+    arg_parser.add_argument("--queries", type=int, default=200)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    arg_parser.add_argument("--child", choices=_MODES, help=argparse.SUPPRESS)
+    arg_parser.add_argument("--dir", type=Path, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.child:
+        store = args.dir / "lineage.sqlite" if args.child != "memory" else None
+        print(json.dumps(_child(args.dir, store, args.queries, args.seed)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_project(directory, args.models, seed=args.seed)
+        print(f"{args.models:,} models")
+        for mode in _MODES:
+            r = _run_child(mode, directory, args)
+            print(
+                f"  {mode:<7} load {r['load']:6.2f}s  upstream {r['upstream'] * 1e3:6.2f} ms"
+                f"  hub impact {r['impact']:5.2f}s  RSS after load {r['loaded_rss']:6.1f} MiB"
+                f"  peak {r['peak']:6.1f} MiB"
+            )
+        size = (directory / "lineage.sqlite").stat().st_size / 2**20
+        print(f"  store file {size:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
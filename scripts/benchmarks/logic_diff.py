@@ -0,0 +1,114 @@
+"""Per-column logic diff of reformatted models: expression text vs. AST fingerprints.
+
+Usage::
+
+    python -m scripts.benchmarks.logic_diff [--models 2000] [--reformatted 200] [--runs 3]
+
+Writes a base and a head project (``synthetic.write_project``) whose compiled SQL
+differs, in ``--reformatted`` models, only in how expressions are written (identifier
+case and redundant parentheses). Both services are loaded once; then:
+
+- ``text``: :meth:`ChangesetBuilder.build` comparing each column's normalised expression
+  text (the builder before fingerprints, reproduced by ignoring them), plus the
+  downstream impact of the changes it reports;
+- ``fingerprint``: :meth:`ChangesetBuilder.build` comparing the canonicalized-AST hashes
+  the parser stores with the lineage, plus the impact of its changes.
+
+Diff and impact are timed separately, best of ``--runs``. ``fingerprint`` must report no
+change at all.
+"""
+
+import argparse
+import json
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from dbt_column_lineage.lineage.changeset import ChangesetBuilder, ColumnChange, _normalize_sql
+from dbt_column_lineage.lineage.service import LineageService
+from scripts.benchmarks.synthetic import write_project
+
+_STAGING_CAST = re.compile(r"cast\(c(\d+) ")
+_MART_SUM = re.compile(r"sum\((\w+)\.col_(\d+)\)")
+
+
+def _text_signatures(model) -> Dict[str, Tuple]:
+    signatures: Dict[str, Tuple] = {}
+    for column_name, column in model.columns.items():
+        parts = set()
+        for entry in column.lineage or []:
+            expression = _normalize_sql(entry.sql_expression) or ""
+            parts.add((entry.transformation_type, expression, tuple(sorted(entry.source_columns))))
+        if parts:
+            signatures[column_name] = tuple(sorted(parts))
+    return signatures
+
+
+class _TextDiffBuilder(ChangesetBuilder):
+    @staticmethod
+    def _logic_changed_columns(base_model, head_model) -> Set[str]:
+        base, head = _text_signatures(base_model), _text_signatures(head_model)
+        if not base and not head:
+            return set(head_model.columns)
+        return {
+            column
+            for column in head_model.columns
+            if (column in base or column in head) and base.get(column) != head.get(column)
+        }
+
+
+def _reformat_head(directory: Path, reformatted: int, seed: int) -> None:
+    """Rewrite the expressions of ``reformatted`` models without changing their logic."""
+    manifest_path = directory / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    rng = random.Random(seed)
+    for unique_id in rng.sample(sorted(manifest["nodes"]), k=reformatted):
+        node = manifest["nodes"][unique_id]
+        sql = _STAGING_CAST.sub(r"CAST(C\1 ", node["compiled_code"])
+        node["compiled_code"] = _MART_SUM.sub(r"SUM((\1.COL_\2))", sql)
+    manifest_path.write_text(json.dumps(manifest))
+
+
+def _best(run: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=2000)
+    arg_parser.add_argument("--reformatted", type=int, default=200)
+    arg_parser.add_argument("--runs", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir, head_dir = Path(tmp) / "base", Path(tmp) / "head"
+        write_project(base_dir, args.models, seed=args.seed)
+        write_project(head_dir, args.models, seed=args.seed)
+        _reformat_head(head_dir, args.reformatted, args.seed)
+        base = LineageService(base_dir / "catalog.json", base_dir / "manifest.json")
+        head = LineageService(head_dir / "catalog.json", head_dir / "manifest.json")
+        print(f"{args.models:,} models, {args.reformatted} reformatted")
+
+        for label, builder in (("text", _TextDiffBuilder), ("fingerprint", ChangesetBuilder)):
+            changes: List[ColumnChange] = builder(base.registry, head.registry).build()
+            diff = _best(lambda b=builder: b(base.registry, head.registry).build(), args.runs)
+            impact = _best(lambda c=changes: head.get_changeset_impact(c), args.runs)
+            print(
+                f"  {label:<12} diff {diff * 1e3:8.1f} ms  impact {impact * 1e3:8.1f} ms"
+                f"  ({len(changes)} column changes)"
+            )
+            if builder is ChangesetBuilder:
+                assert not changes, "a reformatted expression was reported as changed"
+
+
+if __name__ == "__main__":
+    main()
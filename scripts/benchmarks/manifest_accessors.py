@@ -0,0 +1,63 @@
+"""Microbenchmark of ManifestReader accessors on a manifest with many test nodes.
+
+Usage::
+
+    python -m scripts.benchmarks.manifest_accessors [--models 5000] [--tests 50000]
+
+Times each accessor the registry calls during a load (best of ``--rounds``), on an
+already-loaded reader, so JSON decoding is excluded.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from dbt_column_lineage.artifacts.manifest import ManifestReader
+from scripts.benchmarks.synthetic import manifest_with_tests
+
+
+def _best(fn: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=5000)
+    arg_parser.add_argument("--tests", type=int, default=50_000)
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "manifest.json"
+        path.write_text(json.dumps(manifest_with_tests(args.models, args.tests)))
+        reader = ManifestReader(str(path))
+        start = time.perf_counter()
+        reader.load()
+        print(f"{args.models} models, {args.tests} tests: load {time.perf_counter() - start:.2f}s")
+
+    names = [f"model_{i}" for i in range(0, args.models, max(args.models // 500, 1))]
+    accessors = {
+        "get_tests": reader.get_tests,
+        "get_model_upstream": reader.get_model_upstream,
+        "get_model_downstream": reader.get_model_downstream,
+        "get_exposure_dependencies": reader.get_exposure_dependencies,
+        f"get_model_language x{len(names)}": lambda: [reader.get_model_language(n) for n in names],
+    }
+    total = 0.0
+    for label, fn in accessors.items():
+        elapsed = _best(fn, args.rounds)
+        total += elapsed
+        print(f"  {label:<28} {elapsed * 1000:9.1f} ms")
+    print(f"  {'total':<28} {total * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
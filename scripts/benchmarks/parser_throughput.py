@@ -0,0 +1,80 @@
+"""Models-per-second of the SQL parse step with and without the dialect parser pool.
+
+Usage::
+
+    python -m scripts.benchmarks.parser_throughput [--models 500] [--dialect snowflake]
+
+"before" is ``sqlglot.parse_one`` per model (dialect resolved, tokenizer and parser
+rebuilt every call); "after" reuses the thread's pooled pair. When ``sqlglotrs`` is
+installed the compiled tokenizer is measured too. The last row is end-to-end
+``SQLColumnParser.parse_column_lineage`` throughput, for scale.
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+import sqlglot
+
+from dbt_column_lineage.parser import SQLColumnParser
+from dbt_column_lineage.parser.dialect_pool import DialectParserPool, compiled_tokenizer_available
+from scripts.benchmarks.synthetic import model_sqls
+
+
+def _throughput(parse: Callable[[str], object], sqls: List[str], rounds: int) -> float:
+    parse(sqls[0])  # warm-up: dialect class import, pooled instances
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for sql in sqls:
+            parse(sql)
+        best = max(best, len(sqls) / (time.perf_counter() - start))
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=500)
+    arg_parser.add_argument("--dialect", default="snowflake")
+    arg_parser.add_argument("--rounds", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    sqls = model_sqls(args.models)
+    dialect = args.dialect
+    pool = DialectParserPool()
+
+    rows = [
+        (
+            "parse_one per model",
+            _throughput(lambda s: sqlglot.parse_one(s, dialect=dialect), sqls, args.rounds),
+        ),
+        (
+            "pooled, python tokenizer",
+            _throughput(lambda s: pool.parse_one(s, dialect, False), sqls, args.rounds),
+        ),
+    ]
+    if compiled_tokenizer_available():
+        rows.append(
+            (
+                "pooled, compiled tokenizer",
+                _throughput(lambda s: pool.parse_one(s, dialect, True), sqls, args.rounds),
+            )
+        )
+    lineage_parser = SQLColumnParser(dialect=dialect)
+    rows.append(
+        (
+            "full parse_column_lineage",
+            _throughput(lineage_parser.parse_column_lineage, sqls, args.rounds),
+        )
+    )
+
+    baseline = rows[0][1]
+    print(f"{'mode':<30}{'models/s':>12}{'speedup':>10}")
+    for label, rate in rows:
+        print(f"{label:<30}{rate:>12.1f}{rate / baseline:>9.2f}x")
+    if not compiled_tokenizer_available():
+        print("(compiled tokenizer not installed: pip install 'sqlglot[rs]')")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Two-pass vs inline ``SELECT *`` expansion on a star-heavy synthetic project.
+
+Usage::
+
+    python -m scripts.benchmarks.star_expansion [--models 2000] [--catalog-missing 0.3]
+
+Every model is a ``select *`` (plain, through a CTE, or with an ``exclude``) over a
+raw relation or an earlier model, so lineage depends entirely on star expansion. A
+fraction of models is absent from the catalog, as under a deferred CI build.
+
+* two-pass: parse without a schema, then attach ``star_sources`` columns afterwards —
+  only onto columns the catalog already lists (the registry's previous behaviour).
+* inline: parse in DAG order with a schema provider, so stars expand while parsing.
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from dbt_column_lineage.models.schema import ColumnLineage
+from dbt_column_lineage.parser import SQLColumnParser
+
+_WIDTH = 20
+
+
+def _project(
+    count: int, missing: float, seed: int
+) -> Tuple[List[Tuple[str, str]], Dict[str, List[str]]]:
+    """``[(model, sql)]`` in DAG order plus the catalog ``{relation: columns}``."""
+    rng = random.Random(seed)
+    catalog: Dict[str, List[str]] = {}
+    models: List[Tuple[str, str]] = []
+    for i in range(max(count // 10, 1)):
+        catalog[f"raw_{i}"] = [f"c{j}" for j in range(_WIDTH)]
+    for i in range(count):
+        upstream = rng.choice([*list(catalog)[: count // 10], *[m for m, _ in models[-50:]]])
+        shape = i % 3
+        if shape == 0:
+            sql = f"select * from db.main.{upstream}"
+        elif shape == 1:
+            sql = f"with src as (select * from db.main.{upstream}) select * from src"
+        else:
+            sql = f"select * exclude (c0) from db.main.{upstream}"
+        name = f"model_{i}"
+        models.append((name, sql))
+        if rng.random() >= missing:
+            # Catalog-backed: the warehouse knows the model's real columns.
+            columns = [c for c in catalog.get(upstream, [f"c{j}" for j in range(_WIDTH)])]
+            catalog[name] = columns[1:] if shape == 2 else columns
+    return models, catalog
+
+
+def _two_pass(models, catalog) -> Tuple[float, int]:
+    parser = SQLColumnParser("duckdb")
+    start = time.perf_counter()
+    parsed = {name: parser.parse_column_lineage(sql) for name, sql in models}
+    resolved = 0
+    for name, result in parsed.items():
+        columns: Dict[str, List[ColumnLineage]] = {}
+        for col_name in catalog.get(name, []):  # catalog-missing models stay empty
+            for source in result.star_sources:
+                if col_name in catalog.get(source, []):
+                    columns.setdefault(col_name, []).append(
+                        ColumnLineage(
+                            source_columns={f"{source}.{col_name}"}, transformation_type="direct"
+                        )
+                    )
+        resolved += len(columns)
+    return time.perf_counter() - start, resolved
+
+
+def _inline(models, catalog) -> Tuple[float, int]:
+    parser = SQLColumnParser("duckdb")
+    known = dict(catalog)
+    start = time.perf_counter()
+    resolved = 0
+    for name, sql in models:
+        result = parser.parse_column_lineage(sql, schema=known.get)
+        known.setdefault(name, list(result.column_lineage))
+        resolved += len(
+            [c for c in result.column_lineage if name not in catalog or c in catalog[name]]
+        )
+    return time.perf_counter() - start, resolved
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--models", type=int, default=2000)
+    arg_parser.add_argument("--catalog-missing", type=float, default=0.3)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    args = arg_parser.parse_args()
+
+    models, catalog = _project(args.models, args.catalog_missing, args.seed)
+    missing = sum(1 for name, _ in models if name not in catalog)
+    print(f"{len(models)} star models, {missing} absent from the catalog")
+    for label, run in (("two-pass", _two_pass), ("inline", _inline)):
+        elapsed, resolved = run(models, catalog)
+        print(f"  {label:<9} {elapsed:6.2f}s  {resolved:>7} columns with lineage")
+
+
+if __name__ == "__main__":
+    main()
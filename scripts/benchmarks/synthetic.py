@@ -0,0 +1,173 @@
+"""Synthetic dbt-shaped inputs shared by the benchmark scripts.
+
+Nothing here touches a warehouse or dbt itself: the generators emit compiled SQL
+strings and artifact dicts shaped like the real ones, sized by the caller.
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+def staging_sql(index: int, width: int = 12) -> str:
+    """A 1:1 staging model: renames, a cast and a CTE over one source table."""
+    cols = ",\n        ".join(
+        f"c{j} as col_{j}" if j % 3 else f"cast(c{j} as varchar) as col_{j}" for j in range(width)
+    )
+    return (
+        f"with source as (\n    select * from raw.main.src_{index}\n)\n"
+        f"select\n        {cols}\nfrom source\nwhere c0 is not null"
+    )
+
+
+def mart_sql(index: int, upstreams: List[int], width: int = 12) -> str:
+    """A mart joining several staging models, with aggregates and a filter."""
+    base = upstreams[0]
+    joins = "\n".join(
+        f"left join main.stg_{u} as s{u} on s{u}.col_0 = s{base}.col_0" for u in upstreams[1:]
+    )
+    cols = ",\n    ".join(
+        f"sum(s{upstreams[j % len(upstreams)]}.col_{j}) as metric_{j}" for j in range(width)
+    )
+    return (
+        f"select\n    s{base}.col_0 as key,\n    {cols}\n"
+        f"from main.stg_{base} as s{base}\n{joins}\n"
+        f"where s{base}.col_1 <> 'x'\ngroup by 1"
+    )
+
+
+def model_sqls(count: int, seed: int = 7) -> List[str]:
+    """``count`` compiled model SQL strings, roughly half staging and half marts."""
+    rng = random.Random(seed)
+    staging = max(count // 2, 1)
+    sqls = [staging_sql(i) for i in range(staging)]
+    for i in range(count - staging):
+        upstreams = rng.sample(range(staging), k=min(3, staging))
+        sqls.append(mart_sql(i, upstreams))
+    return sqls
+
+
+def union_all_sql(branches: int, tables: int = 50) -> str:
+    """A generated ``UNION ALL`` model, as produced by dbt_utils.union_relations & co."""
+    return "\nunion all\n".join(
+        f"select id, amount_{i % 7} as amount, '{i}' as branch_id from raw.src_{i % tables}"
+        for i in range(branches)
+    )
+
+
+def _artifact_node(name: str, depends_on: List[str], compiled: str) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "unique_id": f"model.bench.{name}",
+        "resource_type": "model",
+        "language": "sql",
+        "database": "bench",
+        "schema": "main",
+        "config": {"materialized": "table"},
+        "original_file_path": f"models/{name}.sql",
+        "depends_on": {"nodes": [f"model.bench.{d}" for d in depends_on]},
+        "compiled_code": compiled,
+    }
+
+
+def _catalog_entry(name: str, columns: List[str]) -> Dict[str, Any]:
+    return {
+        "unique_id": f"model.bench.{name}",
+        "metadata": {"name": name, "schema": "main", "database": "bench", "type": "BASE TABLE"},
+        "columns": {c: {"name": c, "type": "TEXT", "index": i} for i, c in enumerate(columns)},
+    }
+
+
+def write_project(directory: Path, count: int, seed: int = 7, width: int = 12) -> Tuple[Path, Path]:
+    """Write a ``manifest.json``/``catalog.json`` pair for ``count`` models to ``directory``.
+
+    Half the models are staging models, the rest marts joining three of them. Every mart
+    joins ``stg_0``, so ``stg_0.col_0`` is a hub column whose impact reaches every mart.
+    Returns ``(catalog_path, manifest_path)``.
+    """
+    rng = random.Random(seed)
+    staging = max(count // 2, 1)
+    manifest_nodes: Dict[str, Any] = {}
+    catalog_nodes: Dict[str, Any] = {}
+
+    for i in range(staging):
+        name = f"stg_{i}"
+        node = _artifact_node(name, [], staging_sql(i, width))
+        manifest_nodes[node["unique_id"]] = node
+        catalog_nodes[node["unique_id"]] = _catalog_entry(name, [f"col_{j}" for j in range(width)])
+
+    for i in range(count - staging):
+        name = f"mart_{i}"
+        others = rng.sample(range(1, staging), k=min(2, staging - 1)) if staging > 1 else []
+        upstreams = [0, *others]
+        node = _artifact_node(name, [f"stg_{u}" for u in upstreams], mart_sql(i, upstreams, width))
+        manifest_nodes[node["unique_id"]] = node
+        catalog_nodes[node["unique_id"]] = _catalog_entry(
+            name, ["key", *[f"metric_{j}" for j in range(width)]]
+        )
+
+    metadata = {"adapter_type": "duckdb"}
+    directory.mkdir(parents=True, exist_ok=True)
+    catalog_path = directory / "catalog.json"
+    manifest_path = directory / "manifest.json"
+    catalog_path.write_text(json.dumps({"metadata": metadata, "nodes": catalog_nodes}))
+    manifest_path.write_text(json.dumps({"metadata": metadata, "nodes": manifest_nodes}))
+    return catalog_path, manifest_path
+
+
+def manifest_with_tests(models: int, tests: int, seed: int = 7) -> Dict[str, Any]:
+    """A manifest dict with ``models`` models (each depending on two others and a source),
+    ``tests`` generic tests spread across them and one exposure per 50 models."""
+    rng = random.Random(seed)
+    nodes: Dict[str, Any] = {}
+    sources: Dict[str, Any] = {}
+    exposures: Dict[str, Any] = {}
+    for i in range(models):
+        source_id = f"source.bench.raw.src_{i}"
+        sources[source_id] = {"unique_id": source_id, "name": f"src_{i}", "identifier": f"SRC_{i}"}
+        deps = [f"model.bench.model_{j}" for j in rng.sample(range(i), k=min(2, i))]
+        uid = f"model.bench.model_{i}"
+        nodes[uid] = {
+            "unique_id": uid,
+            "name": f"model_{i}",
+            "resource_type": "model",
+            "package_name": "bench",
+            "original_file_path": f"models/model_{i}.sql",
+            "depends_on": {"nodes": [*deps, source_id]},
+        }
+    kinds = ("not_null", "unique", "accepted_values", "relationships")
+    for i in range(tests):
+        model = rng.randrange(models)
+        kind = kinds[i % len(kinds)]
+        kwargs: Dict[str, Any] = {"column_name": f"col_{i % 12}"}
+        depends_on = [f"model.bench.model_{model}"]
+        if kind == "relationships":
+            parent = rng.randrange(models)
+            kwargs.update(to=f"ref('model_{parent}')", field="id")
+            depends_on.append(f"model.bench.model_{parent}")
+        uid = f"test.bench.{kind}_model_{model}_col_{i % 12}.{i:010x}"
+        nodes[uid] = {
+            "unique_id": uid,
+            "resource_type": "test",
+            "column_name": kwargs["column_name"],
+            "attached_node": f"model.bench.model_{model}" if i % 5 else None,
+            "test_metadata": {"name": kind, "kwargs": kwargs},
+            "depends_on": {"nodes": depends_on},
+            "original_file_path": f"models/schema_{model % 40}.yml",
+        }
+    for i in range(0, models, 50):
+        uid = f"exposure.bench.dashboard_{i}"
+        exposures[uid] = {
+            "unique_id": uid,
+            "name": f"dashboard_{i}",
+            "depends_on": {
+                "nodes": [f"model.bench.model_{j}" for j in range(i, min(i + 50, models))]
+            },
+        }
+    return {
+        "metadata": {"adapter_type": "duckdb"},
+        "nodes": nodes,
+        "sources": sources,
+        "exposures": exposures,
+    }
@@ -0,0 +1,41 @@
+"""Parse time and peak memory of a generated UNION ALL model as its branch count grows.
+
+Usage::
+
+    python -m scripts.benchmarks.union_scaling [--branches 250 1000 4000]
+
+Time per branch should stay roughly constant (linear total) and peak memory should
+grow with the parsed tree, not with a quadratic lineage merge.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from dbt_column_lineage.parser import SQLColumnParser
+from scripts.benchmarks.synthetic import union_all_sql
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--branches", type=int, nargs="+", default=[250, 1000, 4000])
+    args = arg_parser.parse_args()
+
+    parser = SQLColumnParser()
+    print(f"{'branches':>10}{'seconds':>10}{'ms/branch':>12}{'peak MiB':>10}")
+    for branches in args.branches:
+        sql = union_all_sql(branches)
+        tracemalloc.start()
+        start = time.perf_counter()
+        parser.parse_column_lineage(sql)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{branches:>10}{elapsed:>10.2f}{elapsed / branches * 1000:>12.3f}"
+            f"{peak / 2**20:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
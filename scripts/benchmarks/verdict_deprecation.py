@@ -0,0 +1,175 @@
+"""Provable-break classification for a big model deprecation.
+
+Usage::
+
+    python -m scripts.benchmarks.verdict_deprecation [--columns 12000] [--removed 10000]
+
+Writes a base and a head project around one wide model, ``legacy``, with a ``not_null``
+test on every column and a ``relationships`` test from ``child`` onto every tenth. Head
+drops the first ``--removed`` columns but keeps every test (a stale yml, so all of them
+break). Both registries are loaded once; then, best of ``--runs``, the changeset of
+``--removed`` REMOVED columns is classified by:
+
+- ``before``: the previous classifier, reproduced here: the head models fetched and the
+  model's column set lowercased again for every change;
+- ``after``: :func:`classify_provable_breaks`, one pass grouped by model.
+
+Both must return the same findings.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from dbt_column_lineage.artifacts.registry import LineageRegistry, ModelRegistry
+from dbt_column_lineage.lineage.changeset import ChangeKind, ColumnChange
+from dbt_column_lineage.lineage.verdict import classify_provable_breaks
+from dbt_column_lineage.models.schema import BreakFinding, TestNode
+
+
+def _write(directory: Path, columns: List[str], all_columns: List[str]) -> ModelRegistry:
+    nodes: Dict[str, Any] = {}
+    for name in ("legacy", "child"):
+        nodes[f"model.bench.{name}"] = {
+            "name": name,
+            "unique_id": f"model.bench.{name}",
+            "resource_type": "model",
+            "language": "sql",
+            "database": "bench",
+            "schema": "main",
+            "original_file_path": f"models/{name}.sql",
+            "depends_on": {"nodes": ["model.bench.legacy"] if name == "child" else []},
+        }
+    for i, column in enumerate(all_columns):
+        uid = f"test.bench.not_null_legacy_{column}.{i:010x}"
+        nodes[uid] = {
+            "unique_id": uid,
+            "resource_type": "test",
+            "column_name": column,
+            "attached_node": "model.bench.legacy",
+            "test_metadata": {"name": "not_null", "kwargs": {"column_name": column}},
+            "depends_on": {"nodes": ["model.bench.legacy"]},
+            "original_file_path": "models/legacy.yml",
+        }
+        if i % 10 == 0:
+            uid = f"test.bench.relationships_child_ref_{i}.{i:010x}"
+            nodes[uid] = {
+                "unique_id": uid,
+                "resource_type": "test",
+                "column_name": f"ref_{i}",
+                "attached_node": "model.bench.child",
+                "test_metadata": {
+                    "name": "relationships",
+                    "kwargs": {"column_name": f"ref_{i}", "to": "ref('legacy')", "field": column},
+                },
+                "depends_on": {"nodes": ["model.bench.child", "model.bench.legacy"]},
+                "original_file_path": "models/child.yml",
+            }
+    catalog = {
+        f"model.bench.{name}": {
+            "unique_id": f"model.bench.{name}",
+            "metadata": {"name": name, "schema": "main", "database": "bench"},
+            "columns": {c: {"name": c, "type": "TEXT"} for c in cols},
+        }
+        for name, cols in (
+            ("legacy", columns),
+            ("child", [f"ref_{i}" for i in range(0, len(all_columns), 10)]),
+        )
+    }
+    directory.mkdir(parents=True)
+    (directory / "manifest.json").write_text(json.dumps({"nodes": nodes}))
+    (directory / "catalog.json").write_text(json.dumps({"nodes": catalog}))
+    registry = ModelRegistry(str(directory / "catalog.json"), str(directory / "manifest.json"))
+    registry.load()
+    return registry
+
+
+def _classify_before(
+    changes: List[ColumnChange],
+    head_registry: LineageRegistry,
+    base_registry: Optional[LineageRegistry] = None,
+) -> List[BreakFinding]:
+    source = base_registry or head_registry
+    head_test_ids = head_registry.get_test_unique_ids()
+    findings: List[BreakFinding] = []
+    seen: Set[str] = set()
+
+    def _emit(model: str, column: str, kind: str, test: TestNode, via_reference: bool) -> None:
+        if test.unique_id not in head_test_ids or test.unique_id in seen:
+            return
+        seen.add(test.unique_id)
+        findings.append(
+            BreakFinding(
+                break_kind="break_test",
+                change_model=model,
+                change_column=column,
+                change_kind=kind,
+                test_name=test.test_name,
+                test_unique_id=test.unique_id,
+                resource_path=test.resource_path,
+                via_reference=via_reference,
+            )
+        )
+
+    def _column_missing_in_head(model: str, column: str) -> bool:
+        head_model = head_registry.get_models().get(model.lower())
+        if head_model is None:
+            return True
+        return column.lower() not in {c.lower() for c in head_model.columns}
+
+    wholly_removed = {
+        c.model
+        for c in changes
+        if c.kind == ChangeKind.REMOVED and head_registry.get_models().get(c.model.lower()) is None
+    }
+    for change in changes:
+        if change.kind != ChangeKind.REMOVED or change.model in wholly_removed:
+            continue
+        if not _column_missing_in_head(change.model, change.column):
+            continue
+        for test in source.get_column_tests(change.model, change.column):
+            _emit(change.model, change.column, change.kind.value, test, via_reference=False)
+        for test in source.get_tests_referencing(change.model, change.column):
+            _emit(change.model, change.column, change.kind.value, test, via_reference=True)
+    return findings
+
+
+def _best(run: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--columns", type=int, default=12000)
+    arg_parser.add_argument("--removed", type=int, default=10000)
+    arg_parser.add_argument("--runs", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    all_columns = [f"col_{i}" for i in range(args.columns)]
+    with tempfile.TemporaryDirectory() as tmp:
+        base = _write(Path(tmp) / "base", all_columns, all_columns)
+        head = _write(Path(tmp) / "head", all_columns[args.removed :], all_columns)
+        changes = [
+            ColumnChange("legacy", column, ChangeKind.REMOVED)
+            for column in all_columns[: args.removed]
+        ]
+
+        after = classify_provable_breaks(changes, head, base)
+        assert after == _classify_before(changes, head, base), "findings differ"
+        before_s = _best(lambda: _classify_before(changes, head, base), args.runs)
+        after_s = _best(lambda: classify_provable_breaks(changes, head, base), args.runs)
+        print(f"{args.removed:,} of {args.columns:,} columns removed, {len(after):,} breaks")
+        print(f"  before  {before_s * 1e3:9.1f} ms")
+        print(f"  after   {after_s * 1e3:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""The impact heatmap against per-column traversal, on the real dbt test project."""
+
+from pathlib import Path
+
+import pytest
+
+from dbt_column_lineage.artifacts.provenance import artifacts_digest
+from dbt_column_lineage.lineage.heatmap import FIELDS, Heatmap
+from dbt_column_lineage.lineage.service import LineageService
+
+
+@pytest.fixture
+def lineage_service(dbt_artifacts):
+    return LineageService(Path(dbt_artifacts["catalog_path"]), Path(dbt_artifacts["manifest_path"]))
+
+
+def test_heatmap_counts_match_column_impact_for_every_column(lineage_service):
+    heat = Heatmap.build(lineage_service.registry)
+
+    expected = {}
+    for model_name, model in lineage_service.registry.get_models().items():
+        for column in model.columns:
+            summary = lineage_service.get_column_impact(model_name, column)["summary"]
+            expected[f"{model_name}.{column}"] = [summary[field] for field in FIELDS]
+
+    assert heat.columns == expected
+    # The sweep covers multi-hop, row-set and exposure reach, not just leaf columns.
+    assert any(counts[4] for counts in expected.values())
+    assert any(counts[2] for counts in expected.values())
+
+
+def test_heatmap_round_trips_through_a_compressed_artifact(
+    lineage_service, dbt_artifacts, tmp_path
+):
+    digest = artifacts_digest(dbt_artifacts["manifest_path"], dbt_artifacts["catalog_path"])
+    heat = Heatmap.build(lineage_service.registry, digest)
+    path = tmp_path / "heatmap.json.gz"
+    heat.save(path)
+
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    loaded = Heatmap.load(path)
+    assert loaded.columns == heat.columns
+    assert loaded.matches(digest) and not loaded.matches("other")
+    top = loaded.hottest(1)[0]
+    model, column = top["column"].rsplit(".", 1)
+    assert loaded.lookup(model.upper(), column) == {field: top[field] for field in FIELDS}
+    assert loaded.lookup("stg_accounts", "no_such_column") is None
@@ -7,6 +7,9 @@ drives the CLI end-to-end through the ChangesetBuilder + aggregation + output.
 
 import copy
 import json
+import shutil
+import subprocess
+from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
@@ -201,10 +204,10 @@ def test_scope_git_requires_base_manifest(dbt_artifacts):
 def test_scope_git_filters_to_changed_models(dbt_artifacts, base_artifacts, monkeypatch):
     # The two-manifest diff detects a change on stg_accounts, but we scope to a
     # git diff that touched no matching model -> the changeset is emptied.
-    from dbt_column_lineage.lineage import changeset
+    from dbt_column_lineage.lineage.git_diff import FileChange, GitDiff
 
     monkeypatch.setattr(
-        changeset, "_git_changed_sql_files", lambda ref, repo_dir=None: ["macros/only.sql"]
+        GitDiff, "changes", lambda self: [FileChange("macros/only.sql", "M", None, None)]
     )
     result = _run_impact(
         [
@@ -242,3 +245,236 @@ def test_ci_no_change_passes_gate(dbt_artifacts, no_gh_env):
     )
     # No changes -> nothing to gate on, even a blocking policy passes.
     assert result.exit_code == 0, result.output
+
+
+def test_impact_state_reuses_unchanged_impacts(dbt_artifacts, base_artifacts, tmp_path):
+    state = tmp_path / "state" / "impact.json"
+    args = [
+        "--manifest",
+        str(dbt_artifacts["manifest_path"]),
+        "--catalog",
+        str(dbt_artifacts["catalog_path"]),
+        "--base-manifest",
+        base_artifacts["manifest"],
+        "--base-catalog",
+        base_artifacts["catalog"],
+        "--format",
+        "json",
+        "--impact-state",
+        str(state),
+    ]
+    first = _run_impact(args)
+    assert first.exit_code == 0, first.output
+    second = _run_impact(args)
+    assert second.exit_code == 0, second.output
+
+    first_report, second_report = json.loads(first.output), json.loads(second.output)
+    computed = first_report.pop("impact_state")["computed"]
+    assert computed == first_report["changeset"]["total_changes"]
+    assert second_report.pop("impact_state")["reused"] == computed
+    assert second_report == first_report
+
+    # A base whose stg_accounts differs again: the removed columns (traced in base) are
+    # traced afresh, the head-side changes are still reused.
+    catalog = _load(base_artifacts["catalog"])
+    node_id = _find_catalog_node(catalog, "stg_accounts")
+    catalog["nodes"][node_id]["columns"]["legacy_col"]["type"] = "VARCHAR"
+    with open(base_artifacts["catalog"], "w") as f:
+        json.dump(catalog, f)
+    third = _run_impact(args)
+    removed = sum(1 for c in first_report["changeset"]["changes"] if c["kind"] == "removed")
+    assert json.loads(third.output)["impact_state"]["computed"] == removed
+
+
+def test_heatmap_annotates_changes_and_spares_unreached_traversals(
+    dbt_artifacts, base_artifacts, tmp_path
+):
+    from dbt_column_lineage.cli.main import heatmap
+
+    heat_path = tmp_path / "heatmap.json.gz"
+    head = ["--manifest", str(dbt_artifacts["manifest_path"])]
+    head += ["--catalog", str(dbt_artifacts["catalog_path"])]
+    built = CliRunner().invoke(heatmap, head + ["--output", str(heat_path)])
+    assert built.exit_code == 0, built.output
+
+    # Also retype, in base, a column nothing downstream reads.
+    from dbt_column_lineage.lineage.heatmap import Heatmap
+
+    unread = Heatmap.load(heat_path).lookup("crypto_portfolio_daily", "computed_at")
+    assert unread is not None and not any(unread.values())
+    catalog = _load(base_artifacts["catalog"])
+    node_id = _find_catalog_node(catalog, "crypto_portfolio_daily")
+    catalog["nodes"][node_id]["columns"]["computed_at"]["type"] = "BLOB"
+    with open(base_artifacts["catalog"], "w") as f:
+        json.dump(catalog, f)
+
+    args = head + ["--base-manifest", base_artifacts["manifest"]]
+    args += ["--base-catalog", base_artifacts["catalog"], "--format", "json"]
+    plain = json.loads(_run_impact(args).output)
+    result = _run_impact(args + ["--heatmap", str(heat_path)])
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+
+    heat_block = report.pop("heatmap")
+    assert heat_block["matches_head"] is True
+    unreached = [
+        c
+        for c in report["by_change"]
+        if c["kind"] != "removed" and not any(c["blast_radius"].values())
+    ]
+    assert unreached and heat_block["skipped_traversals"] == len(unreached)
+    for change in report["by_change"]:
+        radius = change.pop("blast_radius", None)
+        if change["kind"] != "removed":
+            assert radius == {k: change["summary"][k] for k in radius}
+    assert report == plain
+
+
+# Per model of the test project, an edit of one column's derivation: the git-diff base.
+_BASE_EDITS = {
+    "staging/stg_transactions.sql": ("cast(amount as float)", "cast(amount as double)"),
+    "staging/stg_countries.sql": ("code as country_code", "upper(code) as country_code"),
+    "staging/stg_crypto_trades.sql": ("cast(amount as float)", "cast(amount as double)"),
+}
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _git_base_project(tmp_path):
+    """A git repo of the test project's models whose ``main`` holds ``_BASE_EDITS``."""
+    models = Path(__file__).parent.parent / "resources" / "dbt_test_project" / "models"
+    repo = tmp_path / "repo"
+    shutil.copytree(models, repo / "models")
+    _git(repo, "init", "-q", "-b", "main")
+    for path, (head, base) in _BASE_EDITS.items():
+        sql = repo / "models" / path
+        sql.write_text(sql.read_text().replace(head, base))
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "checkout", "-q", "-b", "feature")
+    shutil.rmtree(repo / "models")
+    shutil.copytree(models, repo / "models")
+    _git(repo, "commit", "-q", "-am", "head")
+    return repo
+
+
+@pytest.mark.parametrize("diff", ["manifests", "git"])
+@pytest.mark.parametrize("count", [1, 2, 3])
+def test_merged_shards_reproduce_the_unsharded_report(
+    dbt_artifacts, base_artifacts, tmp_path, monkeypatch, count, diff
+):
+    from dbt_column_lineage.cli.main import merge
+
+    # Changes on several models, so each shard gets some.
+    args = ["--manifest", str(dbt_artifacts["manifest_path"])]
+    args += ["--catalog", str(dbt_artifacts["catalog_path"])]
+    if diff == "git":
+        monkeypatch.chdir(_git_base_project(tmp_path))
+        args += ["--git-base", "main", "--format", "json"]
+    else:
+        catalog = _load(base_artifacts["catalog"])
+        for model, column in (
+            ("stg_transactions", "amount"),
+            ("stg_countries", "country_code"),
+            ("stg_crypto_trades", "trade_amount"),
+        ):
+            node = catalog["nodes"][_find_catalog_node(catalog, model)]
+            node["columns"][column]["type"] = "BLOB"
+        with open(base_artifacts["catalog"], "w") as f:
+            json.dump(catalog, f)
+        args += ["--base-manifest", base_artifacts["manifest"]]
+        args += ["--base-catalog", base_artifacts["catalog"], "--format", "json"]
+    plain = _run_impact(args)
+    assert plain.exit_code == 0, plain.output
+
+    paths, traced = [], 0
+    for index in range(1, count + 1):
+        result = _run_impact(args + ["--shard", f"{index}/{count}"])
+        assert result.exit_code == 0, result.output
+        traced += json.loads(result.output)["shard"]["changes"]
+        paths.append(tmp_path / f"shard-{index}.json")
+        paths[-1].write_text(result.output)
+    assert traced == json.loads(plain.output)["changeset"]["total_changes"]
+
+    merged = CliRunner().invoke(merge, [str(p) for p in reversed(paths)] + ["--format", "json"])
+    assert merged.exit_code == 0, merged.output
+    if diff == "git":
+        # Every shard ran its own git diff: the merge adds up their work and timings.
+        merged_report, plain_report = json.loads(merged.output), json.loads(plain.output)
+        merged_git = merged_report["changeset"].pop("git")
+        plain_git = plain_report["changeset"].pop("git")
+        assert merged_git["changed_files"] == plain_git["changed_files"] == len(_BASE_EDITS)
+        assert merged_git["git_calls"] == count * plain_git["git_calls"]
+        assert plain_report["changeset"]["total_changes"] >= len(_BASE_EDITS)
+        assert merged_report == plain_report
+    else:
+        assert json.loads(merged.output) == json.loads(plain.output)
+        assert merged.output == plain.output
+
+    markdown = CliRunner().invoke(merge, [str(p) for p in paths])
+    unsharded = _run_impact(args[:-2])
+    assert markdown.output == unsharded.output
+
+    if count > 1:
+        incomplete = CliRunner().invoke(merge, [str(p) for p in paths[1:]])
+        assert incomplete.exit_code == 1
+        assert "Expected shards" in incomplete.output
+
+
+def test_shard_rejects_ci_and_bad_specs(dbt_artifacts, base_artifacts):
+    args = ["--manifest", str(dbt_artifacts["manifest_path"])]
+    args += ["--catalog", str(dbt_artifacts["catalog_path"])]
+    args += ["--base-manifest", base_artifacts["manifest"]]
+    args += ["--base-catalog", base_artifacts["catalog"]]
+
+    with_ci = _run_impact(args + ["--shard", "1/2", "--ci"])
+    assert with_ci.exit_code == 1 and "merge" in with_ci.output
+    out_of_range = _run_impact(args + ["--shard", "3/2"])
+    assert out_of_range.exit_code == 1 and "Invalid shard" in out_of_range.output
+
+
+def test_reformatted_expressions_are_not_logic_changes(dbt_artifacts, base_artifacts):
+    # In base, int_transactions_enriched is written differently (keyword and identifier
+    # case, comments, redundant parentheses) and amount_category really differs.
+    manifest = _load(base_artifacts["manifest"])
+    node = next(
+        n for n in manifest["nodes"].values() if n.get("name") == "int_transactions_enriched"
+    )
+    sql = node["compiled_code"]
+    for old, new in (
+        ("date_trunc('month', transaction_date)", "DATE_TRUNC('month', (Transaction_Date))"),
+        ("when amount >= 1000", "WHEN /* large */ (AMOUNT >= 1000)"),
+        ("else 'LOW'", "else 'SMALL'"),
+    ):
+        assert old in sql
+        sql = sql.replace(old, new)
+    node["compiled_code"] = sql
+    with open(base_artifacts["manifest"], "w") as f:
+        json.dump(manifest, f)
+
+    result = _run_impact(
+        [
+            "--manifest",
+            str(dbt_artifacts["manifest_path"]),
+            "--catalog",
+            str(dbt_artifacts["catalog_path"]),
+            "--base-manifest",
+            base_artifacts["manifest"],
+            "--base-catalog",
+            base_artifacts["catalog"],
+            "--format",
+            "json",
+        ]
+    )
+    assert result.exit_code == 0, result.output
+    changes = json.loads(result.output)["changeset"]["changes"]
+    assert [
+        (c["column"], c["kind"]) for c in changes if c["model"] == "int_transactions_enriched"
+    ] == [("amount_category", "logic_changed")]
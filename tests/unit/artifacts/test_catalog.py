@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 
 import pytest
+from dbt_column_lineage.artifacts import catalog as catalog_module
 from dbt_column_lineage.artifacts.catalog import CatalogReader
 
 
@@ -351,3 +352,42 @@ def test_catalog_normalizes_source_identifiers_to_lowercase(
     # Column names should be normalized
     assert "order_id" in source.columns
     assert "amount" in source.columns
+
+
+def test_catalog_streaming_keeps_only_listed_relations_without_stats(tmp_path, monkeypatch):
+    """Streamed load: stats and comments dropped, unlisted relations skipped."""
+    catalog_data = {
+        "metadata": {"dbt_version": "1.7.0"},
+        "nodes": {
+            f"model.shop.m{i}": {
+                "metadata": {"name": f"m{i}", "schema": "main", "database": "db", "comment": "x"},
+                "stats": {"row_count": {"value": 12345, "include": True}},
+                "columns": {
+                    "id": {"name": "id", "type": "INTEGER", "index": 1, "comment": "pk"},
+                    "ratio": {"name": "ratio", "type": "DOUBLE", "description": "a, b: {c}"},
+                },
+            }
+            for i in range(20)
+        },
+        "sources": {},
+        "errors": None,
+    }
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps(catalog_data, indent=2))
+    # Tiny reads so values straddle buffer boundaries.
+    monkeypatch.setattr(catalog_module, "_READ_SIZE", 7)
+
+    reader = CatalogReader(str(catalog_path))
+    reader.load(keep={"model.shop.m3", "model.shop.m11", "source.shop.unused"})
+
+    assert reader.catalog["metadata"] == {"dbt_version": "1.7.0"}
+    assert reader.catalog["errors"] is None
+    assert set(reader.catalog["nodes"]) == {"model.shop.m3", "model.shop.m11"}
+    node = reader.catalog["nodes"]["model.shop.m3"]
+    assert "stats" not in node
+    assert node["columns"]["id"] == {"type": "INTEGER", "description": None}
+
+    models = reader.get_models_nodes()
+    assert set(models) == {"m3", "m11"}
+    assert models["m11"].columns["ratio"].data_type == "DOUBLE"
+    assert models["m11"].columns["ratio"].description == "a, b: {c}"
@@ -89,3 +89,53 @@ def test_no_compiled_file_returns_none(tmp_path):
     reader = ManifestReader(str(manifest))
     reader.load()
     assert reader.get_compiled_sql("orders") is None
+
+
+def test_readers_of_one_target_share_the_compiled_index(tmp_path):
+    node = _model_node("orders", "models/marts/orders.sql")
+    manifest = _write_manifest(tmp_path, node)
+    _write_compiled(tmp_path, "pkg/models/marts/orders.sql", "select 1 as id")
+
+    base, head = ManifestReader(str(manifest)), ManifestReader(str(manifest))
+    base.load()
+    head.load()
+    assert base.get_compiled_sql("orders") == head.get_compiled_sql("orders") == "select 1 as id"
+    assert base._get_compiled_index() is head._get_compiled_index()
+
+
+def test_files_missing_from_the_shared_listing_are_found_on_disk(tmp_path):
+    nested = _model_node("nested", "models/marts/nested.sql")
+    linked = _model_node("linked", "models/linked/linked.sql")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"nodes": {n["unique_id"]: n for n in (nested, linked)}}))
+    _write_compiled(tmp_path, "pkg/models/marts/orders.sql", "select 1 as id")
+    first = ManifestReader(str(manifest))
+    first.load()
+    first.get_compiled_sql("nested")
+
+    # Added to a subdirectory after the listing (the top directory's mtime is unchanged),
+    # and behind a symlinked directory the listing does not descend into.
+    _write_compiled(tmp_path, "pkg/models/marts/nested.sql", "select 'nested' as x")
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "linked.sql").write_text("select 'linked' as x")
+    (tmp_path / "compiled" / "pkg" / "models" / "linked").symlink_to(tmp_path / "shared")
+
+    second = ManifestReader(str(manifest))
+    second.load()
+    assert second._get_compiled_index() is first._get_compiled_index()
+    assert second.get_compiled_sql("nested") == "select 'nested' as x"
+    assert second.get_compiled_sql("linked") == "select 'linked' as x"
+
+
+def test_prefetched_sql_is_served_then_reread(tmp_path):
+    node = _model_node("orders", "models/marts/orders.sql")
+    manifest = _write_manifest(tmp_path, node)
+    compiled = _write_compiled(tmp_path, "pkg/models/marts/orders.sql", "select 1 as id")
+
+    reader = ManifestReader(str(manifest))
+    reader.load()
+    reader.prefetch_compiled_sql(["orders", "missing"])
+    compiled.write_text("select 2 as id")
+
+    assert reader.get_compiled_sql("orders") == "select 1 as id"  # read ahead
+    assert reader.get_compiled_sql("orders") == "select 2 as id"  # handed out once
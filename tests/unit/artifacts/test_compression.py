@@ -0,0 +1,56 @@
+import gzip
+import json
+import sys
+
+import pytest
+from dbt_column_lineage.artifacts.catalog import CatalogReader
+from dbt_column_lineage.artifacts.compression import find_artifact, open_artifact
+from dbt_column_lineage.artifacts.manifest import ManifestReader
+
+MANIFEST = {
+    "metadata": {"adapter_type": "duckdb"},
+    "nodes": {"model.shop.orders": {"name": "orders", "resource_type": "model"}},
+}
+CATALOG = {
+    "nodes": {
+        "model.shop.orders": {
+            "metadata": {"name": "orders", "schema": "main", "database": "db"},
+            "columns": {"id": {"name": "id", "type": "INTEGER"}},
+        }
+    }
+}
+
+
+def test_readers_decode_gzip_artifacts(tmp_path):
+    """gzip artifacts load as-is, detected by content rather than file name."""
+    manifest_path = tmp_path / "manifest.json.gz"
+    catalog_path = tmp_path / "catalog.json"  # compressed despite the plain name
+    with gzip.open(manifest_path, "wt", encoding="utf-8") as f:
+        json.dump(MANIFEST, f)
+    with gzip.open(catalog_path, "wt", encoding="utf-8") as f:
+        json.dump(CATALOG, f)
+
+    manifest = ManifestReader(str(manifest_path))
+    manifest.load()
+    assert manifest.get_adapter() == "duckdb"
+
+    catalog = CatalogReader(str(catalog_path))
+    catalog.load()
+    assert catalog.get_models_nodes()["orders"].columns["id"].data_type == "INTEGER"
+
+
+def test_zstd_without_zstandard_is_reported(tmp_path, monkeypatch):
+    path = tmp_path / "catalog.json.zst"
+    path.write_bytes(b"\x28\xb5\x2f\xfd" + b"\x00" * 8)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(ValueError, match="zstandard"):
+        open_artifact(path)
+
+
+def test_find_artifact_prefers_uncompressed(tmp_path):
+    assert find_artifact(tmp_path, "catalog.json") is None
+    (tmp_path / "catalog.json.gz").write_bytes(gzip.compress(b"{}"))
+    assert find_artifact(tmp_path, "catalog.json") == tmp_path / "catalog.json.gz"
+    (tmp_path / "catalog.json").write_text("{}")
+    assert find_artifact(tmp_path, "catalog.json") == tmp_path / "catalog.json"
@@ -129,3 +129,41 @@ def test_get_tests_skips_singular_tests_without_metadata(tmp_path):
     reader.load()
 
     assert reader.get_tests() == []
+
+
+def test_test_table_dedupes_by_unique_id_and_indexes_rows(tmp_path):
+    from dbt_column_lineage.artifacts.dbt_tests import TestIndex
+
+    nodes = dict(
+        [
+            _generic_test_node("not_null", "orders", "customer_id"),
+            _generic_test_node(
+                "relationships",
+                "orders",
+                "customer_id",
+                extra_kwargs={"to": "ref('customers')", "field": "id"},
+                extra_deps=["model.pkg.orders", "model.pkg.customers"],
+            ),
+        ]
+    )
+    # The same unique_id under a second key (a hand-merged manifest) is kept once.
+    uid, dup = _generic_test_node("not_null", "orders", "customer_id")
+    nodes["test.pkg.duplicate_key"] = dup
+
+    reader = ManifestReader(_write_manifest(tmp_path, nodes))
+    reader.load()
+    table = reader.get_test_table()
+    index = TestIndex(table)
+
+    assert len(table) == 2
+    assert table.unique_ids.count(uid) == 1
+    assert [t.test_name for t in index.column_tests("ORDERS", "Customer_ID")] == [
+        "not_null",
+        "relationships",
+    ]
+    assert [t.test_name for t in index.tests_referencing("customers", "id")] == ["relationships"]
+    assert len(index.model_tests("orders")) == 2
+    assert [t.test_name for t in index.model_tests("customers")] == ["relationships"]
+    assert index.unattributable_tests() == []
+    # Nodes are materialized once per row and then shared.
+    assert index.model_tests("customers")[0] is index.column_tests("orders", "customer_id")[1]
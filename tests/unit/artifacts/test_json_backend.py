@@ -0,0 +1,43 @@
+import json
+
+import pytest
+from dbt_column_lineage.artifacts import json_backend
+
+DOCUMENT = {
+    "model": "orders",
+    "columns": [{"name": "id", "type": None, "score": 1.5}, {"name": "amount", "tags": []}],
+    "impact": {"affected_models": 3, "ok": True, "empty": {}},
+}
+
+
+@pytest.mark.parametrize("name", json_backend.available_backends())
+def test_backends_read_and_write_the_same_documents(name):
+    backend = json_backend.get_backend(name)
+    text = json.dumps(DOCUMENT)
+
+    assert backend.loads(text) == DOCUMENT
+    assert backend.loads(text.encode()) == DOCUMENT
+    # Byte-for-byte what json.dumps(indent=2) writes, for ASCII content.
+    assert backend.dumps_pretty(DOCUMENT) == json.dumps(DOCUMENT, indent=2)
+    assert backend.dumps(DOCUMENT) == json.dumps(DOCUMENT, separators=(",", ":")).encode()
+
+
+@pytest.mark.parametrize("name", json_backend.available_backends())
+def test_backends_fall_back_to_the_standard_library(name):
+    backend = json_backend.get_backend(name)
+
+    assert backend.loads('{"x": NaN, "big": 123456789012345678901234567890}')["big"] == (
+        123456789012345678901234567890
+    )
+    assert json.loads(backend.dumps_pretty({"big": 2**80})) == {"big": 2**80}
+    assert json.loads(backend.dumps({"big": 2**80})) == {"big": 2**80}
+    with pytest.raises(TypeError):
+        backend.dumps_pretty({"not_json": object()})
+
+
+def test_unknown_or_missing_backend_is_rejected(monkeypatch):
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        json_backend.get_backend("simdjson")
+    monkeypatch.setitem(json_backend._FACTORIES, "orjson", lambda: None)
+    with pytest.raises(ValueError, match="not installed"):
+        json_backend.get_backend.__wrapped__("orjson")  # bypass the cache
@@ -357,3 +357,52 @@ def test_manifest_normalizes_exposure_dependencies(tmp_path: Path) -> None:
     assert "dashboard" in exposure_deps
     assert "customers" in exposure_deps["dashboard"]
     assert "CUSTOMERS" not in exposure_deps["dashboard"]
+
+
+def test_unique_ids_are_split_once_and_follow_manifest_replacement() -> None:
+    """Accessors share one unique_id table, rebuilt when the manifest dict is replaced."""
+    reader = ManifestReader("some/path")
+    reader.manifest = {
+        "nodes": {
+            "model.shop.Orders": {"name": "Orders", "resource_type": "model", "depends_on": {}},
+            "model.shop.v2_customers.v2": {"name": "customers", "resource_type": "model"},
+        },
+        "sources": {"source.shop.raw.orders": {"identifier": "RAW_ORDERS"}},
+    }
+
+    parsed = reader.parse_unique_id("model.shop.Orders")
+    assert parsed == ("model", "shop", "orders")
+    assert reader.parse_unique_id("model.shop.Orders") is parsed
+    assert reader.parse_unique_id("seed.shop.countries").resource_type == "seed"
+    assert reader._dependency_name("source.shop.raw.orders") == "raw_orders"
+    assert reader._dependency_name("seed.shop.countries") is None
+    assert reader.get_model_language("orders") is None
+    node = reader._find_node("ORDERS")
+    assert node is not None and node["name"] == "Orders"
+
+    reader.manifest = {"nodes": {"model.shop.items": {"name": "items", "language": "sql"}}}
+    assert reader._find_node("orders") is None
+    assert reader.get_model_language("items") == "sql"
+
+
+def test_render_raw_sql_reproduces_dbt_compile_for_simple_models() -> None:
+    from dbt_column_lineage.parser.sql_parser_utils import strip_sql_comments
+
+    project = Path(__file__).parents[2] / "resources" / "dbt_test_project"
+    reader = ManifestReader(str(project / "target" / "manifest.json"))
+    reader.load()
+    models = [n for n in reader.manifest["nodes"].values() if n["resource_type"] == "model"]
+
+    assert models
+    for node in models:
+        rendered = reader.render_raw_sql(node["name"], node["raw_code"])
+        assert rendered is not None, node["name"]
+        assert strip_sql_comments(rendered) == strip_sql_comments(node["compiled_code"])
+
+    stg = models[0]["name"]
+    assert reader.render_raw_sql(stg, "select * from {{ ref('nope') }}") is None
+    assert reader.render_raw_sql(stg, "select {{ var('x') }}") is None
+    assert reader.render_raw_sql(stg, "{% if x %}select 1{% endif %}") is None
+    assert reader.render_raw_sql(stg, "{# c #}select 1 from {{ this }}") == (
+        f"select 1 from {models[0]['relation_name']}"
+    )
@@ -41,6 +41,12 @@ class _Lin:
     source_columns: Set[str]
     transformation_type: str
     sql_expression: str
+    expression_fingerprint: Optional[str] = None
+
+    @property
+    def signature(self):
+        expression = self.expression_fingerprint or self.sql_expression
+        return (self.transformation_type, expression, tuple(sorted(self.source_columns)))
 
 
 @dataclass
@@ -180,6 +186,29 @@ def test_builder_ignores_cosmetic_sql_changes():
     assert ChangesetBuilder(base, head).build() == []
 
 
+def test_builder_skips_models_with_identical_sql_and_columns(monkeypatch):
+    models = {f"m{i}": _Model({"a": _Col("int"), "b": _Col("TEXT")}) for i in range(50)}
+    compiled = {name: f"select 1 as a, 'x' as b -- {name}" for name in models}
+    base = _FakeRegistry(models, compiled=compiled)
+    head_models = dict(models, m7=_Model({"a": _Col("int"), "b": _Col("varchar")}))
+    head = _FakeRegistry(head_models, compiled=dict(compiled, m3="select 2 as a, 'x' as b"))
+
+    normalized = []
+    monkeypatch.setattr(
+        "dbt_column_lineage.lineage.changeset._normalize_sql",
+        lambda sql: normalized.append(sql) or sql,
+    )
+    changes = ChangesetBuilder(base, head).build()
+
+    assert {(c.model, c.column, c.kind) for c in changes} == {
+        ("m3", "a", ChangeKind.LOGIC_CHANGED),
+        ("m3", "b", ChangeKind.LOGIC_CHANGED),
+        ("m7", "b", ChangeKind.TYPE_CHANGED),
+    }
+    # Only the two differing models reached the SQL diff.
+    assert len(normalized) == 4
+
+
 def test_builder_logic_change_is_per_column_when_lineage_is_available():
     # base: a, b, c are all plain pass-throughs of an upstream column.
     base = _FakeRegistry(
@@ -216,6 +245,35 @@ def test_builder_logic_change_is_per_column_when_lineage_is_available():
     assert logic == {"a"}, logic
 
 
+def test_builder_compares_text_when_only_one_side_has_fingerprints():
+    # base lineage predates fingerprints; head has them for every entry.
+    base = _FakeRegistry(
+        {
+            "m": _Model(
+                {
+                    "a": _LinCol("text", [_Lin({"up.a"}, "derived", "upper(up.a)")]),
+                    "b": _LinCol("text", [_Lin({"up.b"}, "derived", "up.b + 1")]),
+                }
+            )
+        },
+        compiled={"m": "select upper(up.a) as a, up.b + 1 as b from up"},
+    )
+    head = _FakeRegistry(
+        {
+            "m": _Model(
+                {
+                    "a": _LinCol("text", [_Lin({"up.a"}, "derived", "upper(up.a)", "f1")]),
+                    "b": _LinCol("text", [_Lin({"up.b"}, "derived", "up.b + 2", "f2")]),
+                }
+            )
+        },
+        compiled={"m": "select upper(up.a) as a, up.b + 2 as b from up"},
+    )
+    changes = ChangesetBuilder(base, head).build()
+    # `a` is unchanged: its hash on one side is not set against its text on the other.
+    assert {c.column for c in changes if c.kind == ChangeKind.LOGIC_CHANGED} == {"b"}
+
+
 def test_builder_logic_change_flags_all_columns_when_lineage_missing():
     # No per-column lineage on the stub columns -> can't diff precisely, so fall back to
     # the conservative model-level behaviour (flag every output column).
@@ -380,6 +438,23 @@ def test_markdown_appends_attribution_footer():
     assert md.count("github.com/Fszta/dbt-column-lineage") == 1
 
 
+def test_markdown_shows_heatmap_blast_radius_per_changed_column():
+    aggregated = _impact([], [], [])
+    radius = {"affected_models": 3, "affected_columns": 12, "affected_exposures": 1}
+    aggregated["by_change"] = [
+        {"model": "s", "column": "c", "kind": "logic_changed", "blast_radius": radius},
+        {"model": "s", "column": "d", "kind": "logic_changed"},
+    ]
+    changes = [
+        ColumnChange("s", "c", ChangeKind.LOGIC_CHANGED),
+        ColumnChange("s", "d", ChangeKind.LOGIC_CHANGED),
+    ]
+    md = render_changeset_markdown(build_changeset_report("two-manifest", changes, aggregated))
+
+    assert "- `s.c` — feeds 3 models · 12 columns · 1 exposure" in md
+    assert "- `s.d`\n" in md
+
+
 def test_markdown_lists_exposures_first_and_blast_table():
     columns = [
         {
@@ -693,15 +768,21 @@ def _registry_with_paths():
     )
 
 
-def test_git_changed_models_maps_files_to_models(monkeypatch):
+class _FakeDiff:
+    def __init__(self, paths):
+        from dbt_column_lineage.lineage.git_diff import FileChange
+
+        self._changes = [FileChange(path, "M", "a" * 40, "b" * 40) for path in paths]
+
+    def changes(self):
+        return self._changes
+
+
+def test_git_changed_models_maps_files_to_models():
     from dbt_column_lineage.lineage import changeset
 
-    monkeypatch.setattr(
-        changeset,
-        "_git_changed_sql_files",
-        lambda ref, repo_dir=None: ["models/orders.sql", "macros/helper.sql"],
-    )
-    changed = changeset.git_changed_models(_registry_with_paths(), "origin/main")
+    diff = _FakeDiff(["models/orders.sql", "macros/helper.sql"])
+    changed = changeset.git_changed_models(_registry_with_paths(), "origin/main", diff=diff)
     # orders maps to a model; the macro file has no model and is ignored.
     assert changed == {"orders"}
 
@@ -720,5 +801,94 @@ def test_scope_changes_empty_when_no_overlap():
     assert scope_changes_to_models(changes, {"orders"}) == []
 
 
+def _git(repo, *args):
+    import subprocess
+
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _git_project(tmp_path, base_sources, head_sources, head_compiled):
+    """A git repo whose ``main`` holds ``base_sources`` and whose HEAD holds
+    ``head_sources``, plus a head manifest with ``head_compiled`` as compiled SQL."""
+    import json
+
+    from dbt_column_lineage.artifacts.registry import ModelRegistry
+
+    repo = tmp_path / "repo"
+    (repo / "models").mkdir(parents=True)
+    _git(repo, "init", "-q", "-b", "main")
+    for sources in (base_sources, head_sources):
+        for name, sql in sources.items():
+            (repo / "models" / f"{name}.sql").write_text(sql)
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "snapshot")
+        if sources is base_sources:
+            _git(repo, "checkout", "-q", "-b", "feature")
+
+    nodes = {}
+    for name, raw in head_sources.items():
+        nodes[f"model.p.{name}"] = {
+            "name": name,
+            "unique_id": f"model.p.{name}",
+            "resource_type": "model",
+            "language": "sql",
+            "schema": "s",
+            "database": "d",
+            "relation_name": f'"d"."s"."{name}"',
+            "original_file_path": f"models/{name}.sql",
+            "depends_on": {"nodes": ["model.p.stg"] if name == "mart" else ["model.p.raw"]},
+            "raw_code": raw,
+            "compiled_code": head_compiled[name],
+        }
+    (tmp_path / "manifest.json").write_text(json.dumps({"nodes": nodes}))
+    (tmp_path / "catalog.json").write_text(json.dumps({"nodes": {}}))
+    head = ModelRegistry(str(tmp_path / "catalog.json"), str(tmp_path / "manifest.json"))
+    head.load()
+    return repo, head
+
+
+def test_git_changeset_reports_only_columns_whose_derivation_changed(tmp_path):
+    from dbt_column_lineage.lineage.changeset import build_git_changeset
+    from dbt_column_lineage.lineage.git_diff import GitDiff
+
+    raw = "select 1 as id, 2 as amount, 3 as fee"
+    base = {
+        "raw": raw,
+        "stg": "select id, amount, fee from {{ ref('raw') }}",
+        "mart": "{% if true %}select id, amount from {{ ref('stg') }}{% endif %}",
+    }
+    head = {
+        "raw": raw,
+        # One column's expression changed, plus a comment and config: only `amount` moved.
+        "stg": "{{ config(materialized='view') }}\n-- net of nothing\n"
+        "select id, amount * 100 as amount, fee from {{ ref('raw') }}",
+        # Jinja beyond ref/source/config cannot be rendered: every column is reported.
+        "mart": "{% if true %}select id, amount + 0 as amount from {{ ref('stg') }}{% endif %}",
+    }
+    compiled = {
+        "raw": raw,
+        "stg": '\n-- net of nothing\nselect id, amount * 100 as amount, fee from "d"."s"."raw"',
+        "mart": 'select id, amount + 0 as amount from "d"."s"."stg"',
+    }
+    repo, registry = _git_project(tmp_path, base, head, compiled)
+
+    diff = GitDiff("main", str(repo))
+    changes = build_git_changeset(registry, "main", diff=diff)
+
+    assert [(c.model, c.column, c.kind) for c in changes] == [
+        ("mart", "amount", ChangeKind.LOGIC_CHANGED),
+        ("mart", "id", ChangeKind.LOGIC_CHANGED),
+        ("stg", "amount", ChangeKind.LOGIC_CHANGED),
+    ]
+    assert changes[-1].detail == "models/stg.sql"
+    # One diff listing every file, one cat-file reading both versions of each.
+    assert diff.metadata()["git_calls"] == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
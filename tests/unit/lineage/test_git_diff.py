@@ -0,0 +1,71 @@
+import subprocess
+
+import pytest
+
+from dbt_column_lineage.lineage.git_diff import GitDiff
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """``main`` has four models; ``feature`` edits, adds, renames and deletes one each."""
+    (tmp_path / "models").mkdir()
+    for name in ("edited", "moved", "deleted", "untouched"):
+        (tmp_path / "models" / f"{name}.sql").write_text(f"select 1 as {name}_id\n")
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    (tmp_path / "models" / "edited.sql").write_text("select 2 as edited_id\n")
+    (tmp_path / "models" / "added.sql").write_text("select 1 as added_id\n")
+    (tmp_path / "models" / "moved.sql").rename(tmp_path / "models" / "renamed.sql")
+    (tmp_path / "models" / "deleted.sql").unlink()
+    (tmp_path / "README.md").write_text("not sql\n")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "feature")
+    return tmp_path
+
+
+def test_one_diff_and_one_cat_file_serve_every_lookup(repo):
+    diff = GitDiff("main", str(repo))
+
+    changes = {change.path: change for change in diff.changes()}
+    assert sorted(changes) == [
+        "models/added.sql",
+        "models/deleted.sql",
+        "models/edited.sql",
+        "models/renamed.sql",
+    ]
+    assert changes["models/added.sql"].old_blob is None
+    assert changes["models/deleted.sql"].new_blob is None
+    assert changes["models/renamed.sql"].status == "R"
+
+    diff.prefetch(
+        blob for change in changes.values() for blob in (change.old_blob, change.new_blob)
+    )
+    edited = changes["models/edited.sql"]
+    assert diff.blob(edited.old_blob) == "select 1 as edited_id\n"
+    assert diff.blob(edited.new_blob) == "select 2 as edited_id\n"
+    # A renamed file keeps the content it had under its old path.
+    assert diff.blob(changes["models/renamed.sql"].old_blob) == "select 1 as moved_id\n"
+    assert diff.blob(None) is None
+    assert diff.blob("f" * 40) is None  # unknown object: one more call, nothing read
+
+    metadata = diff.metadata()
+    assert metadata["git_calls"] == 3
+    assert metadata["changed_files"] == 4
+    assert metadata["blobs_read"] == 5
+    assert set(metadata["seconds"]) == {"diff", "cat_file"}
+
+
+def test_unknown_base_is_reported(repo):
+    with pytest.raises(RuntimeError, match="Failed to compute git diff against 'nope'"):
+        GitDiff("nope", str(repo)).changes()
@@ -0,0 +1,182 @@
+"""GitHubClient and the sticky-comment flow against a local stub of the GitHub REST API."""
+
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from dbt_column_lineage.lineage.ci import COMMENT_MARKER, GitHubContext, post_sticky_comment
+from dbt_column_lineage.lineage.github_api import GitHubClient, _last_page
+
+_ITEM = re.compile(r"^/repos/o/r/issues/comments/(\d+)$")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload=None, headers=None):
+        data = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _record(self):
+        stub = self.server
+        with stub.lock:
+            stub.connections.add(self.client_address)
+            if stub.failures:
+                stub.failures -= 1
+                self._reply(502, {"message": "Bad Gateway"})
+                return False
+        return True
+
+    def do_GET(self):
+        if not self._record():
+            return
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        page, per_page = int(query["page"][0]), int(query["per_page"][0])
+        stub = self.server
+        with stub.lock:
+            items = stub.comments[(page - 1) * per_page : page * per_page]
+            last = max(1, -(-len(stub.comments) // per_page))
+        etag = '"' + hashlib.sha1(json.dumps(items).encode()).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            stub.statuses.append(304)
+            self._reply(304, headers={"ETag": etag})
+            return
+        stub.statuses.append(200)
+        headers = {"ETag": etag}
+        if last > 1:
+            base = f"http://{self.headers['Host']}{url.path}?per_page={per_page}"
+            headers["Link"] = f'<{base}&page={last}>; rel="last"'
+        self._reply(200, items, headers)
+
+    def _body(self):
+        return json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+    def do_POST(self):
+        if not self._record():
+            return
+        stub = self.server
+        with stub.lock:
+            comment = {"id": len(stub.comments) + 1, "body": self._body()["body"]}
+            stub.comments.append(comment)
+            stub.posted += 1
+        self._reply(201, comment)
+
+    def do_PATCH(self):
+        if not self._record():
+            return
+        comment_id = int(_ITEM.match(urlparse(self.path).path).group(1))
+        stub = self.server
+        with stub.lock:
+            comment = next(c for c in stub.comments if c["id"] == comment_id)
+            comment["body"] = self._body()["body"]
+            stub.patched.append(comment_id)
+        self._reply(200, comment)
+
+
+@pytest.fixture
+def github():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.lock = threading.Lock()
+    server.comments = []
+    server.connections = set()
+    server.statuses = []
+    server.failures = 0
+    server.posted = 0
+    server.patched = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _comments(count, start=1):
+    return [{"id": i, "body": f"comment {i}"} for i in range(start, start + count)]
+
+
+def _context(github):
+    return GitHubContext(repo="o/r", pr_number=8, token="tok", api_url=github.url)
+
+
+def test_last_page_is_read_from_the_link_header():
+    link = (
+        '<https://api.github.com/x?per_page=100&page=2>; rel="next", '
+        '<https://api.github.com/x?per_page=100&page=7>; rel="last"'
+    )
+    assert _last_page(link) == 7
+    assert _last_page("") is None
+
+
+def test_sticky_comment_is_found_across_pages_on_reused_connections(github):
+    github.comments = _comments(420)
+    github.comments[333]["body"] = f"{COMMENT_MARKER}\nold report"
+
+    assert post_sticky_comment(_context(github), "new report") == "updated"
+
+    assert github.patched == [334]
+    assert github.comments[333]["body"] == f"{COMMENT_MARKER}\nnew report"
+    assert github.statuses == [200] * 5
+    # Six requests over at most one connection per page worker, not one each.
+    assert len(github.connections) <= 4
+
+
+def test_comment_is_created_when_no_page_has_the_marker(github):
+    github.comments = _comments(250)
+
+    assert post_sticky_comment(_context(github), "report") == "created"
+    assert github.posted == 1 and github.comments[-1]["body"].startswith(COMMENT_MARKER)
+
+
+def test_transient_errors_are_retried(github):
+    github.comments = _comments(150)
+    github.failures = 2
+    client = GitHubClient("tok", github.url, backoff=0)
+
+    pages = list(client.pages(f"{github.url}/repos/o/r/issues/8/comments"))
+
+    assert [len(page) for page in pages] == [100, 50]
+    assert github.failures == 0
+
+
+def _list_all(github, cache):
+    client = GitHubClient("tok", github.url, cache_path=cache)
+    pages = list(client.pages(f"{github.url}/repos/o/r/issues/8/comments"))
+    client.save_cache()
+    return client, pages
+
+
+def test_unchanged_pages_are_revalidated_between_runs(github, tmp_path):
+    github.comments = _comments(350)
+    github.comments[10]["body"] = COMMENT_MARKER
+    cache = tmp_path / "github-cache.json"
+
+    post_sticky_comment(_context(github), "first", cache_path=cache)
+    _list_all(github, cache)
+    github.statuses.clear()
+    post_sticky_comment(_context(github), "second", cache_path=cache)
+    # Nothing changed since the listing: the comment is found in the cached page.
+    assert github.statuses == [304]
+    assert github.comments[10]["body"].endswith("second")
+
+    # Enough comments are added to fill page 4 and start page 5. Page 1 is answered from
+    # the cache, with its old Link header naming page 4 as the last, yet page 5 is listed.
+    _list_all(github, cache)
+    github.comments.extend(_comments(60, start=351))
+    client, pages = _list_all(github, cache)
+    assert [len(page) for page in pages] == [100, 100, 100, 100, 10]
+    assert client.stats == {"requests": 5, "not_modified": 3}
@@ -0,0 +1,85 @@
+"""Partitioning a changeset into shards and validating shard reports for the merge."""
+
+import pytest
+
+from dbt_column_lineage.lineage.changeset import ChangeKind, ColumnChange
+from dbt_column_lineage.lineage.sharding import (
+    merge_shard_reports,
+    parse_shard,
+    shard_positions,
+)
+
+
+def _change(model, column="c"):
+    return ColumnChange(model=model, column=column, kind=ChangeKind.LOGIC_CHANGED)
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for spec in ("0/4", "5/4", "2", "a/b", "1/2/3"):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            parse_shard(spec)
+
+
+def test_shards_partition_the_changes_by_model_and_balance_cone_sizes():
+    changes = [_change("a", "x"), _change("b"), _change("a", "y"), _change("c"), _change("d")]
+    cones = {"a": 9, "b": 20, "c": 3, "d": 4}
+    shards = [shard_positions(changes, cones.__getitem__, i, 2) for i in (1, 2)]
+
+    assert sorted(shards[0] + shards[1]) == list(range(len(changes)))
+    # Heaviest first onto the lightest shard: b (21) | a (2 * 10) | d (5) | c (4).
+    assert shards == [[1, 3], [0, 2, 4]]
+
+
+def test_more_shards_than_models_leaves_some_empty():
+    changes = [_change("a"), _change("b")]
+    shards = [shard_positions(changes, lambda model: 0, i, 3) for i in (1, 2, 3)]
+    assert shards == [[0], [1], []]
+
+
+def _report(index, count, positions, total):
+    return {
+        "changeset": {"total_changes": total},
+        "provable_breaks": [],
+        "shard": {"index": index, "count": count, "changes": len(positions)},
+        "change_impacts": [{"position": p, "by_change": {}, "impact": None} for p in positions],
+        "confidence_inputs": None,
+    }
+
+
+def test_merge_rejects_missing_duplicate_and_foreign_shards():
+    with pytest.raises(ValueError, match="impact --shard"):
+        merge_shard_reports([{"summary": {}}])
+    with pytest.raises(ValueError, match="exactly once"):
+        merge_shard_reports([_report(1, 2, [0], 2), _report(1, 2, [1], 2)])
+    other = _report(2, 2, [1], 2)
+    other["changeset"] = {"total_changes": 3}
+    with pytest.raises(ValueError, match="not from the same run"):
+        merge_shard_reports([_report(1, 2, [0], 2), other])
+    with pytest.raises(ValueError, match="every change"):
+        merge_shard_reports([_report(1, 2, [0], 3), _report(2, 2, [1], 3)])
+
+
+def test_merge_adds_up_the_git_work_of_each_shard():
+    reports = [_report(1, 2, [0], 2), _report(2, 2, [1], 2)]
+    for report, seconds in zip(reports, (0.25, 0.5)):
+        report["changeset"]["git"] = {
+            "base": "main",
+            "changed_files": 3,
+            "blobs_read": 6,
+            "git_calls": 2,
+            "seconds": {"diff": seconds, "cat_file": seconds},
+        }
+    merged = merge_shard_reports(reports)
+    assert merged["changeset"]["git"] == {
+        "base": "main",
+        "changed_files": 3,
+        "blobs_read": 12,
+        "git_calls": 4,
+        "seconds": {"diff": 0.75, "cat_file": 0.75},
+    }
+    assert reports[0]["changeset"]["git"]["git_calls"] == 2
+
+    reports[1]["changeset"]["git"]["base"] = "develop"
+    with pytest.raises(ValueError, match="not from the same run"):
+        merge_shard_reports(reports)
@@ -216,6 +216,23 @@ def _finding() -> BreakFinding:
     )
 
 
+def test_model_deprecation_checks_head_once_per_model():
+    """Thousands of removed columns of one model: one head lookup, case-insensitive."""
+    tests = [
+        _test(f"test.pkg.not_null_orders_c{i}", "not_null", ("orders", f"c{i}")) for i in range(500)
+    ]
+    base = _FakeRegistry(column_tests={("orders", f"c{i}"): [t] for i, t in enumerate(tests)})
+    head = _head_missing("orders", ["ID", "C499"], test_ids={t.unique_id for t in tests})
+    calls = []
+    models = head.models
+    head.get_models = lambda: calls.append(1) or models  # type: ignore[method-assign]
+
+    breaks = classify_provable_breaks([_removed("Orders", f"c{i}") for i in range(500)], head, base)
+
+    assert [b.change_column for b in breaks] == [f"c{i}" for i in range(499)]
+    assert len(calls) == 1
+
+
 def test_verdict_block_when_any_provable_break():
     assert decide_verdict([_finding()], {"affected_exposures": 0}) == "block"
 
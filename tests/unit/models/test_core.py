@@ -0,0 +1,35 @@
+from dbt_column_lineage.models.core import ColumnNode, ModelNode
+from dbt_column_lineage.models.schema import Column, ColumnLineage, Model
+
+
+def test_core_nodes_have_no_instance_dict():
+    column = ColumnNode(name="id", model_name="orders")
+    model = ModelNode(name="orders", schema_name="main", database="db", resource_type="model")
+    assert not hasattr(column, "__dict__")
+    assert not hasattr(model, "__dict__")
+    assert column.full_name == "orders.id"
+
+
+def test_model_node_to_api_converts_columns_and_copies_collections():
+    edge = ColumnLineage(source_columns={"stg_orders.id"}, transformation_type="direct")
+    model = ModelNode(
+        name="orders",
+        schema_name="main",
+        database="db",
+        resource_type="model",
+        columns={"id": ColumnNode(name="id", model_name="orders", lineage=[edge])},
+        upstream={"stg_orders"},
+        tags=["finance"],
+    )
+
+    api = model.to_api()
+
+    assert isinstance(api, Model)
+    assert api.schema_name == "main"
+    assert isinstance(api.columns["id"], Column)
+    assert api.columns["id"].lineage == [edge]
+    assert api.upstream == {"stg_orders"}
+    api.upstream.add("other")
+    api.tags.append("pii")
+    assert model.upstream == {"stg_orders"}
+    assert model.tags == ["finance"]
@@ -0,0 +1,66 @@
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from dbt_column_lineage.models.schema import ColumnLineage
+
+
+def _edge(*sources: str, **kwargs) -> ColumnLineage:
+    kwargs.setdefault("transformation_type", "direct")
+    return ColumnLineage(source_columns=set(sources), **kwargs)
+
+
+def test_column_lineage_equal_edges_hash_equal_and_dedupe():
+    a = _edge("orders.id", "orders.amount", sql_expression="id + amount")
+    b = ColumnLineage(
+        source_columns=["orders.amount", "orders.id"],
+        transformation_type="direct",
+        sql_expression="id + amount",
+    )
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b, _edge("orders.id")}) == 2
+    # Sets passed in stay comparable with plain sets.
+    assert a.source_columns == {"orders.id", "orders.amount"}
+
+
+def test_column_lineage_is_frozen():
+    edge = _edge("orders.id")
+
+    with pytest.raises(ValidationError):
+        edge.sql_expression = "id"  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        edge.source_columns.add("orders.amount")  # type: ignore[attr-defined]
+
+
+def test_column_lineage_interns_source_strings():
+    a = _edge("".join(["orders", ".id"]))
+    b = _edge("".join(["orders.", "id"]))
+
+    assert next(iter(a.source_columns)) is next(iter(b.source_columns))
+
+
+def test_column_lineage_signature_ignores_description_and_sorts_sources():
+    edge = _edge("b.y", "a.x", transformation_type="derived", description="docs")
+
+    assert edge.signature == ("derived", "", ("a.x", "b.y"))
+    assert edge.signature == _edge("a.x", "b.y", transformation_type="derived").signature
+
+
+def test_column_lineage_hash_survives_copy_and_pickle():
+    edge = _edge("orders.id", sql_expression="id")
+    expected = hash(edge)
+
+    for clone in (copy.copy(edge), copy.deepcopy(edge), pickle.loads(pickle.dumps(edge))):
+        assert clone == edge
+        assert hash(clone) == expected
+        assert clone.signature == edge.signature
+
+
+def test_column_lineage_json_dump_lists_sources():
+    dumped = _edge("orders.id").model_dump(mode="json")
+
+    assert dumped["source_columns"] == ["orders.id"]
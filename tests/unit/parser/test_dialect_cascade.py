@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from dbt_column_lineage.artifacts.adapter_mapping import dialect_fallback_chain
+from dbt_column_lineage.parser import DialectCascadeParser
+
+# `#` is bitwise XOR in Postgres but a comment-ish token Redshift's parser rejects, so a
+# redshift project needs the postgres family rung to read it.
+XOR_SQL = "select a # b as x from t"
+
+
+def test_fallback_chain_declared_family_generic():
+    assert dialect_fallback_chain("redshift") == ["redshift", "postgres", None]
+    assert dialect_fallback_chain("snowflake") == ["snowflake", None]
+    assert dialect_fallback_chain(None) == [None]
+
+
+def test_fallback_chain_skips_dialects_sqlglot_does_not_know():
+    assert dialect_fallback_chain("vertica") == ["postgres", None]
+    assert dialect_fallback_chain("made_up_adapter") == [None]
+
+
+def test_declared_dialect_parse_is_not_a_rescue():
+    parser = DialectCascadeParser("redshift", dialect_fallback_chain("redshift"))
+    parser.parse_column_lineage("select a from t", model_name="m")
+    assert parser.stats.rescued == 0
+    assert parser.stats.cascade_seconds == 0.0
+
+
+def test_family_dialect_rescues_model():
+    parser = DialectCascadeParser("redshift", dialect_fallback_chain("redshift"))
+    result = parser.parse_column_lineage(XOR_SQL, model_name="m")
+    assert result.column_lineage["x"][0].source_columns == {"t.a", "t.b"}
+    assert parser.stats.rescued_by_dialect == {"postgres": 1}
+    assert parser.stats.cascade_seconds > 0
+
+
+def test_unknown_declared_dialect_rescued_by_generic():
+    parser = DialectCascadeParser("made_up_adapter", dialect_fallback_chain("made_up_adapter"))
+    parser.parse_column_lineage("select id from customers", model_name="m")
+    assert parser.stats.rescued_by_dialect == {"generic": 1}
+
+
+def test_every_rung_failing_raises_last_error():
+    parser = DialectCascadeParser("postgres", dialect_fallback_chain("postgres"))
+    with pytest.raises(Exception):
+        parser.parse_column_lineage("select from from", model_name="m")
+
+
+def test_outcome_cache_sends_next_run_straight_to_working_dialect(tmp_path):
+    cache = tmp_path / "dialects.json"
+    first = DialectCascadeParser("redshift", dialect_fallback_chain("redshift"), cache_path=cache)
+    first.parse_column_lineage(XOR_SQL, model_name="m")
+    first.save_cache()
+    assert json.loads(cache.read_text())["models"] == {"m": "postgres"}
+
+    second = DialectCascadeParser("redshift", dialect_fallback_chain("redshift"), cache_path=cache)
+    second.parse_column_lineage(XOR_SQL, model_name="m")
+    assert second.stats.cache_hits == 1
+    assert second.stats.rescued == 0
+    assert second.stats.cascade_seconds == 0.0
+
+
+def test_outcome_cache_entry_cleared_when_declared_dialect_works_again(tmp_path):
+    cache = tmp_path / "dialects.json"
+    first = DialectCascadeParser("redshift", dialect_fallback_chain("redshift"), cache_path=cache)
+    first.parse_column_lineage(XOR_SQL, model_name="m")
+    first.save_cache()
+
+    # The remembered dialect fails on the new SQL, so the cascade runs again.
+    second = DialectCascadeParser("redshift", dialect_fallback_chain("redshift"), cache_path=cache)
+    second.parse_column_lineage("select top 5 a from t", model_name="m")
+    second.save_cache()
+    assert json.loads(cache.read_text())["models"] == {}
+
+
+def test_outcome_cache_ignored_for_a_different_declared_dialect(tmp_path):
+    cache = tmp_path / "dialects.json"
+    first = DialectCascadeParser("redshift", dialect_fallback_chain("redshift"), cache_path=cache)
+    first.parse_column_lineage(XOR_SQL, model_name="m")
+    first.save_cache()
+
+    other = DialectCascadeParser("postgres", dialect_fallback_chain("postgres"), cache_path=cache)
+    other.parse_column_lineage(XOR_SQL, model_name="m")
+    assert other.stats.cache_hits == 0
+
+
+@pytest.mark.parametrize(
+    "content", ["[]", '"x"', "null", '{"version": 1, "declared": "redshift", "models": ["m"]}']
+)
+def test_outcome_cache_of_the_wrong_shape_is_ignored(tmp_path, content):
+    cache = tmp_path / "dialects.json"
+    cache.write_text(content)
+    parser = DialectCascadeParser("redshift", dialect_fallback_chain("redshift"), cache_path=cache)
+    parser.parse_column_lineage(XOR_SQL, model_name="m")
+    assert parser.stats.cache_hits == 0
+    assert parser.stats.rescued == 1
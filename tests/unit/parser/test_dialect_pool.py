@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+from dbt_column_lineage.parser import SQLColumnParser
+from dbt_column_lineage.parser.dialect_pool import (
+    DialectParserPool,
+    compiled_tokenizer_available,
+    get_parser_pool,
+)
+
+
+def test_pool_reuses_tokenizer_and_parser_per_dialect():
+    pool = DialectParserPool()
+    pool.parse_one("select 1", "snowflake")
+    first = dict(pool._entries)
+    pool.parse_one("select a from t", "snowflake")
+    assert pool._entries == first
+
+    pool.parse_one("select 1", "duckdb")
+    assert len(pool._entries) == 2
+
+
+def test_pool_matches_sqlglot_parse_one():
+    from sqlglot import parse_one
+
+    sql = "select a, sum(b) as total from t where c > 1 group by a"
+    pool = DialectParserPool()
+    assert pool.parse_one(sql, "duckdb") == parse_one(sql, dialect="duckdb")
+
+
+def test_pooled_parser_resets_between_statements():
+    pool = DialectParserPool()
+    first = pool.parse_one("select a from t1", None)
+    second = pool.parse_one("select b from t2", None)
+    assert isinstance(first, exp.Select) and isinstance(second, exp.Select)
+    assert first.find(exp.Table).name == "t1"
+    assert second.find(exp.Table).name == "t2"
+
+
+def test_empty_sql_raises_parse_error():
+    with pytest.raises(ParseError):
+        DialectParserPool().parse_one(";", None)
+
+
+def test_pool_is_thread_local():
+    pools = []
+
+    def _grab() -> None:
+        pools.append(get_parser_pool())
+
+    thread = threading.Thread(target=_grab)
+    thread.start()
+    thread.join()
+    assert get_parser_pool() is get_parser_pool()
+    assert pools[0] is not get_parser_pool()
+
+
+def test_compiled_tokenizer_request_falls_back_when_unavailable():
+    parser = SQLColumnParser(dialect="snowflake", use_compiled_tokenizer=True)
+    result = parser.parse_column_lineage("select id as customer_id from customers")
+    assert result.column_lineage["customer_id"][0].source_columns == {"customers.id"}
+    if not compiled_tokenizer_available():
+        assert ("snowflake", False) in get_parser_pool()._entries
@@ -341,6 +341,29 @@ def test_union_all_three_way_top_level():
     assert id_sources == {"t1.id", "t2.id", "t3.id"}
 
 
+def test_union_all_thousands_of_branches_streams_without_recursion_limit():
+    """Generated models union thousands of branches; sqlglot nests them N levels deep."""
+    branches = 3000
+    sql = "\nunion all\n".join(
+        f"select id, amount as amount from raw_{i % 40}" for i in range(branches)
+    )
+    result = SQLColumnParser().parse_column_lineage(sql)
+    lineage = result.column_lineage
+    # Identical branch lineage is deduplicated: one entry per distinct source table.
+    assert len(lineage["id"]) == 40
+    id_sources = {src for item in lineage["id"] for src in item.source_columns}
+    assert id_sources == {f"raw_{i}.id" for i in range(40)}
+
+
+def test_union_all_star_over_wide_union_cte():
+    """`select * from <cte>` over a many-branch union CTE streams every branch."""
+    body = "\n        union all\n        ".join(f"select id from t{i}" for i in range(1500))
+    sql = f"with u as (\n        {body}\n    )\n    select * from u"
+    result = SQLColumnParser().parse_column_lineage(sql)
+    id_sources = {src for item in result.column_lineage["id"] for src in item.source_columns}
+    assert id_sources == {f"t{i}.id" for i in range(1500)}
+
+
 def test_union_inside_cte_referenced_by_name():
     """A union CTE referenced by explicit column names carries every branch's source."""
     sql = """
@@ -859,6 +882,35 @@ def test_strip_sql_comments_utility() -> None:
     assert strip_sql_comments("/* only comment */") == ""
 
 
+def test_strip_sql_comments_fast_path_matches_full_cleanup() -> None:
+    """Inputs the fast path returns untouched must be ones the full cleanup leaves alone."""
+    from dbt_column_lineage.parser.sql_parser_utils import (
+        _strip_sql_comments,
+        strip_sql_comments,
+    )
+
+    cases = [
+        "orders.customer_id",
+        "col name",
+        " leading",
+        "trailing ",
+        "two  spaces",
+        "tab\tseparated",
+        "line\nbreak",
+        "a - b / c * d",
+        "a*/b",
+        "x--y",
+        "x/*y*/z",
+        "\u00a0nbsp",
+        "select " + "x, " * 200 + "y -- long",
+    ]
+    for text in cases:
+        assert strip_sql_comments(text) == _strip_sql_comments(text), text
+
+    clean = "orders.customer_id"
+    assert strip_sql_comments(clean) is clean
+
+
 def test_column_with_block_comment() -> None:
     """Test parsing SQL with /* ... */ comments in column names."""
     sql = """
@@ -1057,3 +1109,81 @@ def test_comments_in_complex_query() -> None:
         for lineage_item in lineage_list:
             for src in lineage_item.source_columns:
                 assert "/*" not in src and "*/" not in src
+
+
+def test_star_expands_inline_with_schema_provider():
+    schema = {"orders": ["ID", "amount", "status"], "customers": ["id", "name"]}.get
+    parser = SQLColumnParser()
+
+    result = parser.parse_column_lineage(
+        "select o.*, c.name as customer_name from orders o join customers c on o.id = c.id",
+        schema=schema,
+    )
+    assert set(result.column_lineage) == {"id", "amount", "status", "customer_name"}
+    assert result.column_lineage["amount"][0].source_columns == {"orders.amount"}
+    assert result.column_lineage["id"][0].transformation_type == "direct"
+    assert result.star_sources == {"orders"}
+
+    # A star inside a CTE expands too, honouring EXCLUDE; unknown relations stay unresolved.
+    result = parser.parse_column_lineage(
+        "with base as (select * exclude (status) from orders) select * from base",
+        schema=schema,
+    )
+    assert set(result.column_lineage) == {"id", "amount"}
+    assert parser.parse_column_lineage("select * from events", schema=schema).column_lineage == {}
+
+
+def test_bare_star_over_join_expands_every_known_table():
+    schema = {"orders": ["order_id", "amount"], "refunds": ["refund_id"]}.get
+
+    result = SQLColumnParser().parse_column_lineage(
+        "select * from orders join refunds using (order_id)", schema=schema
+    )
+
+    assert set(result.column_lineage) == {"order_id", "amount", "refund_id"}
+    assert result.star_sources == {"orders", "refunds"}
+
+
+def test_expression_fingerprint_ignores_formatting_but_not_logic():
+    """Reformatting an expression keeps its fingerprint, also through a CTE."""
+
+    def fingerprints(sql):
+        lineage = SQLColumnParser().parse_column_lineage(sql).column_lineage
+        return {col: [lin.expression_fingerprint for lin in lins] for col, lins in lineage.items()}
+
+    base = fingerprints(
+        """
+        with totals as (
+            select o.id, sum(o.amount) * 2 as doubled, o.status from orders o group by 1, 3
+        )
+        select t.id, t.doubled, case when t.status = 'open' then 1 else 0 end as is_open
+        from totals t
+        """
+    )
+    reformatted = fingerprints(
+        """
+        WITH totals AS (
+            SELECT x.ID, (SUM(x."AMOUNT") * 2) AS doubled, -- twice the total
+                   x.status
+            FROM orders AS x GROUP BY 1, 3
+        )
+        SELECT totals.id, totals.doubled,
+               CASE WHEN (status = 'open') THEN 1 ELSE 0 END AS is_open
+        FROM totals
+        """
+    )
+    changed = fingerprints(
+        """
+        with totals as (
+            select o.id, sum(o.amount) * 3 as doubled, o.status from orders o group by 1, 3
+        )
+        select t.id, t.doubled, case when t.status = 'Open' then 1 else 0 end as is_open
+        from totals t
+        """
+    )
+
+    assert base["id"] == [None]
+    assert all(base["doubled"]) and all(base["is_open"])
+    assert reformatted == base
+    assert changed["doubled"] != base["doubled"]
+    assert changed["is_open"] != base["is_open"]
@@ -0,0 +1,108 @@
+"""FederatedRegistry: column lineage across dbt projects that ref each other."""
+
+import json
+
+from dbt_column_lineage.artifacts.federated import FederatedRegistry, ProjectArtifacts
+from dbt_column_lineage.lineage.service import LineageService
+
+
+def _node(package, name, sql=None, depends_on=()):
+    node = {
+        "name": name,
+        "unique_id": f"model.{package}.{name}",
+        "resource_type": "model",
+        "language": "sql",
+        "schema": "main",
+        "database": "db",
+        "depends_on": {"nodes": list(depends_on)},
+    }
+    if sql is not None:
+        node["compiled_code"] = sql
+    return node
+
+
+def _write_project(root, project, nodes, catalog_columns):
+    root.mkdir()
+    manifest = {
+        "metadata": {"project_name": project, "adapter_type": "duckdb"},
+        "nodes": {n["unique_id"]: n for n in nodes},
+    }
+    catalog = {
+        "nodes": {
+            f"model.{project}.{name}": {
+                "metadata": {"name": name, "schema": "main", "database": "db"},
+                "columns": {c: {"name": c, "type": "TEXT"} for c in columns},
+            }
+            for name, columns in catalog_columns.items()
+        }
+    }
+    (root / "manifest.json").write_text(json.dumps(manifest))
+    (root / "catalog.json").write_text(json.dumps(catalog))
+    return ProjectArtifacts(project, str(root / "catalog.json"), str(root / "manifest.json"))
+
+
+def _projects(tmp_path):
+    producer = _write_project(
+        tmp_path / "producer",
+        "producer",
+        [_node("producer", "orders", "select 1 as id, 2 as amount")],
+        {"orders": ["id", "amount"]},
+    )
+    # The consumer's manifest lists the producer's public model as a node of the
+    # producer's package, with no SQL of its own.
+    consumer = _write_project(
+        tmp_path / "consumer",
+        "consumer",
+        [
+            _node("producer", "orders"),
+            _node(
+                "consumer",
+                "revenue",
+                "select id, amount * 2 as revenue from db.main.orders",
+                ["model.producer.orders"],
+            ),
+        ],
+        {"revenue": ["id", "revenue"]},
+    )
+    return [consumer, producer]
+
+
+def test_federated_registry_links_lineage_across_projects(tmp_path):
+    registry = FederatedRegistry(_projects(tmp_path))
+    service = LineageService.from_registry(registry)
+
+    orders = registry.get_model("orders")
+    assert set(orders.columns) == {"id", "amount"}  # the producer's node, not the stub
+    assert "revenue" in orders.downstream
+    assert registry.get_model("revenue").columns["revenue"].lineage[0].source_columns == {
+        "orders.amount"
+    }
+
+    impact = service.get_column_impact("orders", "amount")
+    assert [(c["model"], c["column"]) for c in impact["affected_columns"]] == [
+        ("revenue", "revenue")
+    ]
+
+    # The stub is counted once, by its owner: two models, both catalog-backed and parsed.
+    coverage = registry.get_coverage()
+    assert coverage.models_in_manifest == 2
+    assert coverage.parsed_ok == 2
+    assert coverage.skipped_no_sql == 0
+    assert coverage.complete
+
+
+def test_federated_registry_rebuilds_only_the_changed_project(tmp_path):
+    projects = _projects(tmp_path)
+    cache_dir = tmp_path / "cache"
+    FederatedRegistry(projects, cache_dir=str(cache_dir)).load()
+    stores = {p.name: cache_dir / f"{p.name}.lineage.sqlite" for p in projects}
+    built = {name: path.stat().st_mtime_ns for name, path in stores.items()}
+
+    consumer_manifest = tmp_path / "consumer" / "manifest.json"
+    consumer_manifest.write_text(consumer_manifest.read_text() + "\n")
+    registry = FederatedRegistry(projects, cache_dir=str(cache_dir))
+    registry.load()
+
+    assert stores["producer"].stat().st_mtime_ns == built["producer"]
+    assert stores["consumer"].stat().st_mtime_ns != built["consumer"]
+    assert "revenue" in registry.get_model("orders").downstream
@@ -177,3 +177,227 @@ def test_adapter_override(tmp_path):
     registry_with_override = ModelRegistry(str(catalog_path), str(manifest_path), adapter_override="bigquery")
     registry_with_override.load()
     assert registry_with_override._dialect == "bigquery", "Expected adapter override to take precedence"
+
+
+def test_lineage_reuse_looks_past_unchanged_sources(tmp_path, monkeypatch):
+    """A source upstream of every model does not block reuse unless its columns change.
+
+    The compiled SQL lives in target/compiled, and each file is read once per registry.
+    """
+    from dbt_column_lineage.artifacts import manifest as manifest_module
+    from dbt_column_lineage.parser.dialect_cascade import DialectCascadeParser
+
+    def write(directory, amount_type):
+        nodes = {}
+        for name, sql, upstream in (
+            ("stg", "select id, amount from d.raw.orders", "source.p.raw.orders"),
+            ("mart", "select id, amount * 2 as amount2 from d.s.stg", "model.p.stg"),
+        ):
+            nodes[f"model.p.{name}"] = {
+                "name": name,
+                "unique_id": f"model.p.{name}",
+                "resource_type": "model",
+                "package_name": "p",
+                "language": "sql",
+                "schema": "s",
+                "database": "d",
+                "original_file_path": f"models/{name}.sql",
+                "depends_on": {"nodes": [upstream]},
+            }
+            compiled = directory / "target" / "compiled" / "p" / "models" / f"{name}.sql"
+            compiled.parent.mkdir(parents=True, exist_ok=True)
+            compiled.write_text(sql)
+        source = {
+            "unique_id": "source.p.raw.orders",
+            "resource_type": "source",
+            "name": "orders",
+            "source_name": "raw",
+            "schema": "raw",
+            "database": "d",
+        }
+        catalog_source = {
+            "unique_id": "source.p.raw.orders",
+            "metadata": {"name": "orders", "schema": "raw", "database": "d"},
+            "columns": {
+                "id": {"name": "id", "type": "INTEGER"},
+                "amount": {"name": "amount", "type": amount_type},
+            },
+        }
+        target = directory / "target"
+        (target / "manifest.json").write_text(
+            json.dumps({"nodes": nodes, "sources": {source["unique_id"]: source}})
+        )
+        (target / "catalog.json").write_text(
+            json.dumps({"nodes": {}, "sources": {catalog_source["unique_id"]: catalog_source}})
+        )
+        return str(target / "catalog.json"), str(target / "manifest.json")
+
+    head = ModelRegistry(*write(tmp_path / "head", "INTEGER"))
+    head.load()
+    assert head.get_model("orders").downstream == {"stg"}
+
+    parsed, read = [], []
+    original_parse = DialectCascadeParser.parse_column_lineage
+    original_read = manifest_module._read_compiled_file
+
+    def recording_parse(self, sql, *args, **kwargs):
+        parsed.append(sql)
+        return original_parse(self, sql, *args, **kwargs)
+
+    def recording_read(path):
+        read.append(path.name)
+        return original_read(path)
+
+    monkeypatch.setattr(DialectCascadeParser, "parse_column_lineage", recording_parse)
+    monkeypatch.setattr(manifest_module, "_read_compiled_file", recording_read)
+
+    same = ModelRegistry(*write(tmp_path / "same", "INTEGER"), reuse_lineage_from=head)
+    same.load()
+    assert parsed == []
+    assert sorted(read) == ["mart.sql", "stg.sql"]
+    for name, model in head.get_models().items():
+        assert same.get_model(name) == model
+
+    parsed.clear()
+    retyped = ModelRegistry(*write(tmp_path / "retyped", "BIGINT"), reuse_lineage_from=head)
+    retyped.load()
+    assert len(parsed) == 2
+
+
+def _model_node(name, sql, depends_on):
+    return {
+        "name": name,
+        "unique_id": f"model.p.{name}",
+        "resource_type": "model",
+        "language": "sql",
+        "schema": "s",
+        "database": "d",
+        "depends_on": {"nodes": [f"model.p.{d}" for d in depends_on]},
+        "compiled_code": sql,
+    }
+
+
+def test_star_expands_inline_for_catalog_missing_models(tmp_path):
+    """A star over a model whose columns are only known from its SQL is still expanded.
+
+    ``mart`` is listed before its upstream on purpose: models are parsed in DAG order,
+    so ``stg``'s recovered columns exist by the time ``mart``'s star reads them.
+    """
+    nodes = [
+        _model_node("mart", "select * exclude (secret) from d.s.stg", ["stg"]),
+        _model_node(
+            "stg",
+            "with src as (select * from d.s.base) "
+            "select id, amount * 2 as amount2, secret from src",
+            ["base"],
+        ),
+        _model_node("base", "select 1 as id, 2 as amount, 'x' as secret", []),
+    ]
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({"nodes": {n["unique_id"]: n for n in nodes}}))
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(
+        json.dumps(
+            {
+                "nodes": {
+                    "model.p.base": {
+                        "unique_id": "model.p.base",
+                        "metadata": {"name": "base", "schema": "s", "database": "d"},
+                        "columns": {
+                            c: {"name": c, "type": "TEXT"} for c in ("id", "amount", "secret")
+                        },
+                    }
+                }
+            }
+        )
+    )
+
+    registry = ModelRegistry(str(catalog_path), str(manifest_path))
+    registry.load()
+
+    mart = registry.get_model("mart")
+    assert set(mart.columns) == {"id", "amount2"}
+    assert mart.columns["amount2"].lineage[0].source_columns == {"stg.amount2"}
+    assert mart.metadata["star_sources"] == ["stg"]
+    stg = registry.get_model("stg")
+    assert stg.columns["secret"].lineage[0].source_columns == {"base.secret"}
+
+
+def test_lineage_store_serves_the_same_models_and_is_reused(tmp_path):
+    nodes = [
+        _model_node("base", "select 1 as id, 2 as amount, 'x' as status", []),
+        _model_node(
+            "stg", "select id, amount * 2 as amount2 from d.s.base where status = 'ok'", ["base"]
+        ),
+    ]
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({"nodes": {n["unique_id"]: n for n in nodes}}))
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps({"nodes": {}}))
+    store_path = tmp_path / "lineage.sqlite"
+
+    in_memory = ModelRegistry(str(catalog_path), str(manifest_path))
+    in_memory.load()
+    store = {"lineage_store_path": str(store_path)}
+    first = ModelRegistry(str(catalog_path), str(manifest_path), **store)
+    first.load()
+    assert store_path.exists()
+
+    reused = ModelRegistry(str(catalog_path), str(manifest_path), **store)
+    reused.load()
+    assert reused._sql_parser is None  # served from the store, nothing re-parsed
+
+    for registry in (first, reused):
+        assert list(registry.get_models()) == list(in_memory.get_models())
+        for name, model in in_memory.get_models().items():
+            assert registry.get_model(name) == model
+        assert registry.get_filter_dependents("base.status") == {"stg"}
+        assert registry.get_coverage() == in_memory.get_coverage()
+
+    # A changed manifest invalidates the store: it is rebuilt rather than served stale.
+    manifest_path.write_text(manifest_path.read_text() + "\n")
+    rebuilt = ModelRegistry(str(catalog_path), str(manifest_path), **store)
+    rebuilt.load()
+    assert rebuilt._sql_parser is not None
+
+
+def test_unchanged_models_reuse_lineage_from_another_registry(tmp_path, monkeypatch):
+    """Only a changed model and its downstream cone are parsed when a donor is given."""
+    from dbt_column_lineage.parser.dialect_cascade import DialectCascadeParser
+
+    def write(directory, stg_sql):
+        nodes = [
+            _model_node("base", "select 1 as id, 2 as amount", []),
+            _model_node("stg", stg_sql, ["base"]),
+            _model_node("mart", "select * from d.s.stg", ["stg"]),
+            _model_node("other", "select id from d.s.base", ["base"]),
+        ]
+        directory.mkdir()
+        (directory / "manifest.json").write_text(
+            json.dumps({"nodes": {n["unique_id"]: n for n in nodes}})
+        )
+        (directory / "catalog.json").write_text(json.dumps({"nodes": {}}))
+        return str(directory / "catalog.json"), str(directory / "manifest.json")
+
+    head_paths = write(tmp_path / "head", "select id, amount + 1 as amount from d.s.base")
+    base_paths = write(tmp_path / "base", "select id, amount from d.s.base")
+    head = ModelRegistry(*head_paths)
+    head.load()
+    full = ModelRegistry(*base_paths)
+    full.load()
+
+    parsed = []
+    original = DialectCascadeParser.parse_column_lineage
+
+    def recording(self, sql, *args, **kwargs):
+        parsed.append(sql)
+        return original(self, sql, *args, **kwargs)
+
+    monkeypatch.setattr(DialectCascadeParser, "parse_column_lineage", recording)
+    base = ModelRegistry(*base_paths, reuse_lineage_from=head)
+    base.load()
+
+    assert sorted(parsed) == ["select * from d.s.stg", "select id, amount from d.s.base"]
+    for name, model in full.get_models().items():
+        assert base.get_model(name) == model
+    assert base.get_model("stg").columns["amount"].lineage[0].source_columns == {"base.amount"}